@@ -11,7 +11,14 @@ from ormkit.base import Base
 from ormkit.fields import JSON, ForeignKey, Mapped, mapped_column
 from ormkit.mixins import SoftDeleteMixin
 from ormkit.query import delete, insert, select, update
-from ormkit.relationships import joinedload, lazyload, noload, relationship, selectinload
+from ormkit.relationships import (
+    greedyload,
+    joinedload,
+    lazyload,
+    noload,
+    relationship,
+    selectinload,
+)
 from ormkit.session import AsyncSession, Q, Query, Transaction, create_session, session_context
 
 __version__ = "0.1.0"
@@ -44,6 +51,7 @@ __all__ = [
     # Eager loading
     "selectinload",
     "joinedload",
+    "greedyload",
     "lazyload",
     "noload",
     # Schema introspection (from Rust)
@@ -1,5 +1,6 @@
 """Type stubs for the Rust extension module."""
 
+from collections.abc import Sequence
 from typing import Any
 
 class ConnectionPool:
@@ -26,10 +27,39 @@ class ConnectionPool:
         """Execute a statement that doesn't return rows. Returns rows affected."""
         ...
 
+    async def execute_many(self, sql: str, params_seq: Sequence[Sequence[Any]]) -> int:
+        """Execute a statement once per parameter set, atomically. Returns rows affected."""
+        ...
+
+    async def execute_script(self, sql: str) -> None:
+        """Execute several `;`-separated statements (no parameters) in one call."""
+        ...
+
+    async def transaction(self) -> Transaction:
+        """Start a transaction (`BEGIN IMMEDIATE` on SQLite)."""
+        ...
+
     async def close(self) -> None:
         """Close the connection pool."""
         ...
 
+class Transaction:
+    """A database transaction; commits on clean exit, rolls back on error."""
+
+    async def __aenter__(self) -> Transaction: ...
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> bool: ...
+    async def execute(self, sql: str, params: list[Any] | None = None) -> QueryResult:
+        """Execute a query within the transaction."""
+        ...
+
+    async def execute_statement_py(self, sql: str, params: list[Any] | None = None) -> int:
+        """Execute a statement that doesn't return rows. Returns rows affected."""
+        ...
+
+    async def execute_many(self, sql: str, params_list: Sequence[Sequence[Any]]) -> int:
+        """Execute a statement once per parameter set."""
+        ...
+
 class QueryResult:
     """Result from executing a SQL query."""
 
@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
+import keyword
 import typing
+from types import CodeType, MappingProxyType
 from typing import Any, ClassVar, get_type_hints
 
+from ormkit.fields import _json_loads
+
 if typing.TYPE_CHECKING:
     from ormkit.fields import ColumnInfo
     from ormkit.relationships import RelationshipInfo
@@ -41,26 +45,17 @@ class ModelMeta(type):
         # Get type hints including from parent classes
         # We need to provide the proper namespace for get_type_hints to resolve forward refs
         try:
-            # Include the module's globals for proper resolution
+            # The module's globals are used as-is; the names every model may use
+            # come from localns, which is consulted first, so no per-class copy
             import sys
             module = sys.modules.get(cls.__module__, None)
-            globalns = dict(getattr(module, "__dict__", {})) if module else {}
-            # Add required typing constructs
-            globalns["ClassVar"] = ClassVar
-            globalns["Any"] = Any
-            # Also include ormkit types
-            from ormkit.fields import ColumnInfo as CI
-            from ormkit.fields import Mapped
-            from ormkit.relationships import RelationshipInfo as RI
-            globalns["Mapped"] = Mapped
-            globalns["ColumnInfo"] = CI
-            globalns["RelationshipInfo"] = RI
-            hints = get_type_hints(cls, globalns=globalns, localns={})
+            globalns = getattr(module, "__dict__", None) or {}
+            hints = get_type_hints(cls, globalns=globalns, localns=_hint_localns())
         except Exception:
             hints = {}
 
         # Import here to avoid circular imports
-        from ormkit.fields import ColumnInfo, Mapped
+        from ormkit.fields import ColumnInfo
         from ormkit.relationships import RelationshipInfo
 
         # Process annotations and collect column info from class namespace
@@ -87,29 +82,39 @@ class ModelMeta(type):
 
         # Check for ColumnInfo from parent classes/mixins FIRST (like SoftDeleteMixin)
         # This must happen BEFORE auto-generating from type annotations, because
-        # get_type_hints() includes inherited annotations too
+        # get_type_hints() includes inherited annotations too.
+        # Each base's MRO is walked once through the class __dicts__; the first
+        # class defining a name wins, exactly as getattr(base, name) resolves it
         for base in bases:
-            for attr_name in dir(base):
-                if attr_name.startswith("_") or attr_name in columns:
+            inherited: dict[str, ColumnInfo] = {}
+            seen: set[str] = set()
+            for klass in base.__mro__:
+                for attr_name, attr_value in vars(klass).items():
+                    if attr_name not in seen:
+                        seen.add(attr_name)
+                        if isinstance(attr_value, ColumnInfo) and not attr_name.startswith("_"):
+                            inherited[attr_name] = attr_value
+            # Sorted, matching the dir() order this sweep has always produced
+            for attr_name in sorted(inherited):
+                if attr_name in columns:
                     continue
-                attr_value = getattr(base, attr_name, None)
-                if isinstance(attr_value, ColumnInfo):
-                    # Clone the ColumnInfo to avoid sharing between classes
-                    col_copy = ColumnInfo(
-                        name=attr_name,
-                        python_type=attr_value.python_type,
-                        primary_key=attr_value.primary_key,
-                        nullable=attr_value.nullable,
-                        unique=attr_value.unique,
-                        index=attr_value.index,
-                        default=attr_value.default,
-                        server_default=attr_value.server_default,
-                        max_length=attr_value.max_length,
-                        foreign_key=attr_value.foreign_key,
-                        autoincrement=attr_value.autoincrement,
-                        is_json=attr_value.is_json,
-                    )
-                    columns[attr_name] = col_copy
+                attr_value = inherited[attr_name]
+                # Clone the ColumnInfo to avoid sharing between classes
+                col_copy = ColumnInfo(
+                    name=attr_name,
+                    python_type=attr_value.python_type,
+                    primary_key=attr_value.primary_key,
+                    nullable=attr_value.nullable,
+                    unique=attr_value.unique,
+                    index=attr_value.index,
+                    default=attr_value.default,
+                    server_default=attr_value.server_default,
+                    max_length=attr_value.max_length,
+                    foreign_key=attr_value.foreign_key,
+                    autoincrement=attr_value.autoincrement,
+                    is_json=attr_value.is_json,
+                )
+                columns[attr_name] = col_copy
 
         # Also process type annotations that are Mapped but have no mapped_column() value
         # These auto-generate a ColumnInfo based on the type
@@ -139,17 +144,39 @@ class ModelMeta(type):
                         )
                         columns[attr_name] = col
 
+        # One sweep for everything derived per column
+        primary_key = None
+        json_columns = []
+        insert_columns = []
+        for col_name, col in columns.items():
+            col._cache_sql_types()
+            if primary_key is None and col.primary_key:
+                primary_key = col_name
+            if col.is_json:
+                json_columns.append(col_name)
+            if not (col.primary_key and col.autoincrement):
+                insert_columns.append(col_name)
+
         cls.__columns__ = columns  # type: ignore[attr-defined]
-        cls.__relationships__ = relationships  # type: ignore[attr-defined]
-        cls.__primary_key__ = None  # type: ignore[attr-defined]
+        # Precomputed for row hydration: avoids per-row dict views and is_json lookups
+        cls.__column_tuple__ = tuple(columns)  # type: ignore[attr-defined]
+        cls.__json_columns__ = frozenset(json_columns)  # type: ignore[attr-defined]
+        # Columns an INSERT writes (everything but an autoincrement primary key)
+        cls.__insert_columns__ = tuple(insert_columns)  # type: ignore[attr-defined]
+        # Read-only: relationship metadata is fixed once the class is built
+        cls.__relationships__ = MappingProxyType(relationships)  # type: ignore[attr-defined]
+        cls.__primary_key__ = primary_key  # type: ignore[attr-defined]
+        # Own copy of the soft-delete flag, resolved through the MRO once (a mixin
+        # after Base still wins), so queries read it straight from cls.__dict__
+        cls.__soft_delete__ = next(  # type: ignore[attr-defined]
+            (vars(klass)["__soft_delete__"] for klass in cls.__mro__
+             if "__soft_delete__" in vars(klass)),
+            False,
+        )
         cls.__hints__ = hints  # type: ignore[attr-defined]
         cls.__relationships_resolved__ = False  # type: ignore[attr-defined]
 
-        # Find primary key
-        for col_name, col_info in columns.items():
-            if col_info.primary_key:
-                cls.__primary_key__ = col_name  # type: ignore[attr-defined]
-                break
+        _install_fast_methods(cls, namespace, columns)
 
         # Register model for relationship resolution
         from ormkit.relationships import register_model
@@ -158,7 +185,13 @@ class ModelMeta(type):
         return cls
 
     def _resolve_relationships(cls) -> None:
-        """Resolve all relationships after all models are defined."""
+        """Resolve all relationships after all models are defined.
+
+        Idempotent: once every target is found, later calls return immediately.
+        """
+        if getattr(cls, "__relationships_resolved__", False):
+            return
+
         unresolved = [
             (rel_name, rel_info)
             for rel_name, rel_info in cls.__relationships__.items()
@@ -168,9 +201,6 @@ class ModelMeta(type):
             cls.__relationships_resolved__ = True  # type: ignore[attr-defined]
             return
 
-        if getattr(cls, "__relationships_resolved__", False):
-            return
-
         # Re-resolve hints now that all models may be defined
         try:
             import sys
@@ -178,6 +208,7 @@ class ModelMeta(type):
             globalns = dict(getattr(module, "__dict__", {})) if module else {}
             globalns["ClassVar"] = ClassVar
             globalns["Any"] = Any
+            globalns["MappingProxyType"] = MappingProxyType
             from ormkit.fields import ColumnInfo as CI
             from ormkit.fields import Mapped
             from ormkit.relationships import RelationshipInfo as RI
@@ -199,6 +230,27 @@ class ModelMeta(type):
         )  # type: ignore[attr-defined]
 
 
+# Names resolvable in every model annotation, filled on first use (see _hint_localns)
+_hint_names: dict[str, Any] = {}
+
+
+def _hint_localns() -> dict[str, Any]:
+    """Return the typing and ormkit names model annotations may use unimported."""
+    if not _hint_names:
+        from ormkit.fields import ColumnInfo, Mapped
+        from ormkit.relationships import RelationshipInfo
+
+        _hint_names.update(
+            ClassVar=ClassVar,
+            Any=Any,
+            MappingProxyType=MappingProxyType,
+            Mapped=Mapped,
+            ColumnInfo=ColumnInfo,
+            RelationshipInfo=RelationshipInfo,
+        )
+    return _hint_names
+
+
 def _extract_mapped_type(hint: Any) -> type | None:
     """Extract the inner type from Mapped[T] annotation."""
     origin = typing.get_origin(hint)
@@ -214,6 +266,138 @@ def _extract_mapped_type(hint: Any) -> type | None:
     return hint if isinstance(hint, type) else None
 
 
+# ========== Generated Per-Model Methods ==========
+
+# Sentinel for "keyword not passed" in generated __init__ signatures
+_MISSING: Any = object()
+
+# Cache of column shape -> compiled factory code for __init__ / to_dict.
+# Keyed by names and default kinds only, so default values are bound per class.
+_init_code_cache: dict[tuple[tuple[str, str], ...], CodeType] = {}
+_to_dict_code_cache: dict[tuple[str, ...], CodeType] = {}
+
+
+def _default_kind(col: ColumnInfo) -> str:
+    if col.default is not None:
+        return "call" if callable(col.default) else "value"
+    return "null" if col.nullable else "skip"
+
+
+def _init_extra(self: Base, extra: dict[str, Any]) -> None:
+    relationships = type(self).__relationships__
+    for key, value in extra.items():
+        if key not in relationships:
+            raise TypeError(f"Unknown column or relationship: {key}")
+        setattr(self, key, value)
+
+
+def _to_dict_slow(self: Base) -> dict[str, Any]:
+    result = {}
+    for col_name in self.__columns__:
+        if hasattr(self, col_name):
+            result[col_name] = getattr(self, col_name)
+    return result
+
+
+def _compile_init(shape: tuple[tuple[str, str], ...]) -> CodeType:
+    code = _init_code_cache.get(shape)
+    if code is not None:
+        return code
+
+    defaults = "".join(f", _d{i}" for i in range(len(shape)))
+    params = "".join(f"{name}=_MISSING, " for name, _ in shape)
+    passed = "".join(f"({name!r}, {name}), " for name, _ in shape)
+    lines = [
+        f"def _factory(_cls{defaults}):",
+        f"    def __init__(self, *, {params}**_extra):",
+        # A subclass with its own __init__ reaches this one through super(); it
+        # may add columns, so fall back to the generic walk over its columns
+        "        if type(self) is not _cls:",
+        f"            _passed = {{k: v for k, v in ({passed}) if v is not _MISSING}}",
+        "            return _generic_init(self, **_passed, **_extra)",
+        '        _osa(self, "_loaded_relationships", {})',
+        '        _osa(self, "_session", None)',
+    ]
+    for i, (name, kind) in enumerate(shape):
+        lines.append(f"        if {name} is not _MISSING:")
+        lines.append(f"            self.{name} = {name}")
+        if kind == "call":
+            lines.append(f"        else:\n            self.{name} = _d{i}()")
+        elif kind == "value":
+            lines.append(f"        else:\n            self.{name} = _d{i}")
+        elif kind == "null":
+            lines.append(f"        else:\n            self.{name} = None")
+    lines.append("        if _extra:")
+    lines.append("            _init_extra(self, _extra)")
+    lines.append("    return __init__")
+
+    code = compile("\n".join(lines), "<ormkit __init__>", "exec")
+    _init_code_cache[shape] = code
+    return code
+
+
+def _compile_to_dict(names: tuple[str, ...]) -> CodeType:
+    code = _to_dict_code_cache.get(names)
+    if code is not None:
+        return code
+
+    items = ", ".join(f"{name!r}: self.{name}" for name in names)
+    source = (
+        "def to_dict(self, include_relationships=False):\n"
+        "    try:\n"
+        f"        result = {{{items}}}\n"
+        "    except AttributeError:\n"
+        "        result = _to_dict_slow(self)\n"
+        "    if include_relationships:\n"
+        "        _add_relationships(self, result)\n"
+        "    return result\n"
+    )
+    code = compile(source, "<ormkit to_dict>", "exec")
+    _to_dict_code_cache[names] = code
+    return code
+
+
+def _is_generic(method: Any, generic: Any) -> bool:
+    return method is generic or getattr(method, "_ormkit_generated", False)
+
+
+def _install_fast_methods(
+    cls: type, namespace: dict[str, Any], columns: dict[str, ColumnInfo]
+) -> None:
+    """Install straight-line __init__ and to_dict specialized to the model's columns.
+
+    Skipped when the class (or a parent model) defines its own version, or when a
+    column name cannot be used as a Python parameter.
+    """
+    names = tuple(columns)
+    if not all(n.isidentifier() and not keyword.iskeyword(n) and n != "self" for n in names):
+        return
+
+    if "__init__" not in namespace and _is_generic(cls.__init__, Base.__init__):
+        shape = tuple((name, _default_kind(col)) for name, col in columns.items())
+        scope: dict[str, Any] = {
+            "_MISSING": _MISSING,
+            "_osa": object.__setattr__,
+            "_init_extra": _init_extra,
+            "_generic_init": Base.__init__,
+        }
+        exec(_compile_init(shape), scope)
+        init = scope["_factory"](cls, *(col.default for col in columns.values()))
+        init.__qualname__ = f"{cls.__qualname__}.__init__"
+        init.__doc__ = Base.__init__.__doc__
+        init._ormkit_generated = True
+        cls.__init__ = init  # type: ignore[misc]
+
+    if "to_dict" not in namespace and _is_generic(cls.to_dict, Base.to_dict):
+        scope = {"_to_dict_slow": _to_dict_slow, "_add_relationships": _add_relationships}
+        exec(_compile_to_dict(names), scope)
+        to_dict = scope["to_dict"]
+        to_dict.__qualname__ = f"{cls.__qualname__}.to_dict"
+        to_dict.__doc__ = Base.to_dict.__doc__
+        to_dict._ormkit_generated = True
+        cls.to_dict = to_dict  # type: ignore[attr-defined]
+
+
 class Base(metaclass=ModelMeta):
     """Base class for all ORM models.
 
@@ -226,8 +410,12 @@ class Base(metaclass=ModelMeta):
 
     __tablename__: ClassVar[str]
     __columns__: ClassVar[dict[str, ColumnInfo]]
-    __relationships__: ClassVar[dict[str, RelationshipInfo]]
+    __column_tuple__: ClassVar[tuple[str, ...]]
+    __json_columns__: ClassVar[frozenset[str]]
+    __insert_columns__: ClassVar[tuple[str, ...]]
+    __relationships__: ClassVar[MappingProxyType[str, RelationshipInfo]]
     __primary_key__: ClassVar[str | None]
+    __soft_delete__: ClassVar[bool]
     __hints__: ClassVar[dict[str, Any]]
     __relationships_resolved__: ClassVar[bool]
 
@@ -311,7 +499,7 @@ class Base(metaclass=ModelMeta):
 
                 if session is not None:
                     from ormkit.relationships import ManyToManyCollection
-                    collection = ManyToManyCollection(self, rel_info, session, [])
+                    collection = ManyToManyCollection(self, rel_info, session, [], partial=True)
                     loaded[name] = collection
                     return collection
                 else:
@@ -358,22 +546,9 @@ class Base(metaclass=ModelMeta):
 
     def to_dict(self, include_relationships: bool = False) -> dict[str, Any]:
         """Convert model instance to a dictionary."""
-        result = {}
-        for col_name in self.__columns__:
-            if hasattr(self, col_name):
-                result[col_name] = getattr(self, col_name)
-
+        result = _to_dict_slow(self)
         if include_relationships:
-            for rel_name in self.__relationships__:
-                if rel_name in self._loaded_relationships:
-                    rel_value = self._loaded_relationships[rel_name]
-                    if isinstance(rel_value, list):
-                        result[rel_name] = [item.to_dict() for item in rel_value]
-                    elif rel_value is not None:
-                        result[rel_name] = rel_value.to_dict()
-                    else:
-                        result[rel_name] = None
-
+            _add_relationships(self, result)
         return result
 
     @classmethod
@@ -388,23 +563,44 @@ class Base(metaclass=ModelMeta):
         This is an internal method used by the ORM for bulk result conversion.
         It bypasses the normal __init__ validation for better performance.
         """
-        import json as json_module
-
         instance = object.__new__(cls)
-        object.__setattr__(instance, "_loaded_relationships", {})
-        object.__setattr__(instance, "_session", None)
+        # Columns are plain instance attributes (no descriptors), so the instance
+        # dict can be filled directly instead of going through __setattr__
+        state = instance.__dict__
+        state["_loaded_relationships"] = {}
+        state["_session"] = None
 
-        # Set attributes directly without validation
         cols = cls.__columns__
+        json_cols = cls.__json_columns__
+        if not json_cols and data.keys() <= cols.keys():
+            # Common case: a row of this model's own columns - copy it in one go
+            state.update(data)
+            return instance
+
         for key, value in data.items():
-            if key in cols:
-                col_info = cols[key]
-                # Handle JSON deserialization for JSON columns stored as TEXT in SQLite
-                if col_info.is_json and isinstance(value, str):
-                    try:
-                        value = json_module.loads(value)
-                    except (json_module.JSONDecodeError, TypeError):
-                        pass  # Keep as string if not valid JSON
-                object.__setattr__(instance, key, value)
+            if key not in cols:
+                continue
+            # Handle JSON deserialization for JSON columns stored as TEXT in SQLite
+            if key in json_cols and isinstance(value, (str, bytes)):
+                try:
+                    value = _json_loads(value)
+                except (ValueError, TypeError):
+                    pass  # Keep as string if not valid JSON
+            state[key] = value
 
         return instance
+
+
+def _add_relationships(self: Base, result: dict[str, Any]) -> None:
+    loaded = self._loaded_relationships
+    if not loaded:
+        return
+    for rel_name in self.__relationships__:
+        rel_value = loaded.get(rel_name, _MISSING)
+        if rel_value is not _MISSING:
+            if isinstance(rel_value, list):
+                result[rel_name] = [item.to_dict() for item in rel_value]
+            elif rel_value is not None:
+                result[rel_name] = rel_value.to_dict()
+            else:
+                result[rel_name] = None
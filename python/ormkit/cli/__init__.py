@@ -572,7 +572,8 @@ def migrate_create(directory: Path | str, message: str) -> Path:
         if path.name.startswith("_"):
             continue
         try:
-            script = MigrationScript.load(path)
+            # Only the header is needed to find the head revision
+            script = MigrationScript.scan(path)
             existing_migrations.append(script)
         except (ValueError, FileNotFoundError):
             pass
@@ -2,12 +2,29 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import date, datetime, time
 from typing import Any, TypeVar, Union
 
 T = TypeVar("T")
 
+# JSON codec for values decoded/encoded on the Python side (SQLite TEXT columns,
+# JSON filter parameters). orjson is used when installed, stdlib json otherwise.
+try:
+    import orjson
+
+    def _json_loads(value: str | bytes) -> Any:
+        return orjson.loads(value)
+
+    def _json_dumps(value: Any) -> str:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+except ImportError:
+    import json
+
+    _json_loads = json.loads
+    _json_dumps = json.dumps
+
 
 class JSON:
     """Marker class for JSON/JSONB column types.
@@ -91,8 +108,24 @@ class ColumnInfo:
     autoincrement: bool | None = None
     is_json: bool = False  # Whether this column stores JSON data
 
+    # Both dialects' type strings, filled by ModelMeta once the type is known
+    _sql_types: dict[str, str] | None = field(default=None, init=False, repr=False, compare=False)
+
     def sql_type(self, dialect: str = "postgresql") -> str:
         """Get the SQL type for this column."""
+        sql_types = self._sql_types
+        if sql_types is not None:
+            try:
+                return sql_types[dialect]
+            except KeyError:
+                pass
+        return self._compute_sql_type(dialect)
+
+    def _cache_sql_types(self) -> None:
+        """Precompute sql_type() for every dialect; call once the column is final."""
+        self._sql_types = {dialect: self._compute_sql_type(dialect) for dialect in _SQL_TYPES}
+
+    def _compute_sql_type(self, dialect: str) -> str:
         # JSON columns have their own type mapping
         if self.is_json:
             return "JSONB" if dialect == "postgresql" else "TEXT"
@@ -113,54 +146,42 @@ class ColumnInfo:
         if actual_type is dict or actual_type is list:
             return "JSONB" if dialect == "postgresql" else "TEXT"
 
-        if dialect == "postgresql":
-            return self._pg_type(actual_type)
-        elif dialect == "sqlite":
-            return self._sqlite_type(actual_type)
-        else:
-            return self._pg_type(actual_type)
-
-    def _pg_type(self, python_type: type) -> str:
-        """Get PostgreSQL type for a Python type."""
-        if python_type is int:
-            if self.primary_key:
-                return "SERIAL" if self.autoincrement is not False else "INTEGER"
-            return "INTEGER"
-        elif python_type is str:
-            if self.max_length:
-                return f"VARCHAR({self.max_length})"
-            return "TEXT"
-        elif python_type is float:
-            return "DOUBLE PRECISION"
-        elif python_type is bool:
-            return "BOOLEAN"
-        elif python_type is bytes:
-            return "BYTEA"
-        elif python_type is datetime:
-            return "TIMESTAMP"
-        elif python_type is date:
-            return "DATE"
-        elif python_type is time:
-            return "TIME"
-        else:
-            return "TEXT"
-
-    def _sqlite_type(self, python_type: type) -> str:
-        """Get SQLite type for a Python type."""
-        if python_type is int:
-            return "INTEGER"
-        elif python_type is str:
-            return "TEXT"
-        elif python_type is float:
-            return "REAL"
-        elif python_type is bool:
-            return "INTEGER"  # SQLite uses 0/1 for bool
-        elif python_type is bytes:
-            return "BLOB"
-        elif python_type in (datetime, date, time):
-            return "TEXT"  # SQLite stores dates as text
-        else:
-            return "TEXT"
+        if dialect == "sqlite":
+            return _SQL_TYPES["sqlite"].get(actual_type, "TEXT")  # type: ignore[arg-type]
+
+        # PostgreSQL (also the fallback for unknown dialects)
+        if actual_type is int and self.primary_key and self.autoincrement is not False:
+            return "SERIAL"
+        if actual_type is str and self.max_length:
+            return f"VARCHAR({self.max_length})"
+        return _SQL_TYPES["postgresql"].get(actual_type, "TEXT")  # type: ignore[arg-type]
+
+
+# Python type -> SQL type per dialect. Serial primary keys and sized strings are
+# handled in ColumnInfo._compute_sql_type; SQLite stores dates as text and
+# bools as 0/1.
+_SQL_TYPES: dict[str, dict[type, str]] = {
+    "postgresql": {
+        int: "INTEGER",
+        str: "TEXT",
+        float: "DOUBLE PRECISION",
+        bool: "BOOLEAN",
+        bytes: "BYTEA",
+        datetime: "TIMESTAMP",
+        date: "DATE",
+        time: "TIME",
+    },
+    "sqlite": {
+        int: "INTEGER",
+        str: "TEXT",
+        float: "REAL",
+        bool: "INTEGER",
+        bytes: "BLOB",
+        datetime: "TEXT",
+        date: "TEXT",
+        time: "TEXT",
+    },
+}
 
 
 def mapped_column(
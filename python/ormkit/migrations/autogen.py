@@ -41,6 +41,98 @@ PYTHON_TO_SQL = {
     list: {"postgresql": "JSONB", "sqlite": "TEXT"},
 }
 
+# Type spellings that name the same storage; anything else compares as itself
+_TYPE_ALIASES = {
+    "INT": "INTEGER",
+    "INT4": "INTEGER",
+    "SERIAL": "INTEGER",
+    "INT8": "BIGINT",
+    "BIGSERIAL": "BIGINT",
+    "VARCHAR": "TEXT",
+    "CHARACTER VARYING": "TEXT",
+    "FLOAT8": "DOUBLE PRECISION",
+    "FLOAT": "DOUBLE PRECISION",
+    "REAL": "DOUBLE PRECISION",
+    "BOOL": "BOOLEAN",
+    "TIMESTAMP WITHOUT TIME ZONE": "TIMESTAMP",
+    "TIME WITHOUT TIME ZONE": "TIME",
+}
+
+# Cache of raw type string -> canonical type
+_canonical_type_cache: dict[str, str] = {}
+
+
+def _canonical_type(type_str: str) -> str:
+    """Normalize a SQL type so equivalent spellings compare equal.
+
+    Length/precision modifiers are dropped, so ``VARCHAR(255)`` and ``TEXT``
+    both canonicalize to ``TEXT``.
+    """
+    canonical = _canonical_type_cache.get(type_str)
+    if canonical is None:
+        base = type_str.split("(", 1)[0].strip().upper()
+        canonical = _TYPE_ALIASES.get(base, base)
+        _canonical_type_cache[type_str] = canonical
+    return canonical
+
+
+def _canon(col: ColumnSchema) -> tuple[str, bool]:
+    """Comparison key for a column: (canonical type, nullable)."""
+    return (_canonical_type(col.data_type), col.nullable)
+
+# Alembic migration file layout; filled in once per render with format_map
+_MIGRATION_TEMPLATE = '''"""{message}
+
+Revision ID: {revision}
+Revises: {revises}
+Create Date: {create_date}
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '{revision}'
+down_revision = {down_revision}
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    {upgrade}
+
+
+def downgrade():
+    {downgrade}
+'''
+
+# SQL type substring -> SQLAlchemy type name, checked in order
+_SA_TYPES = (
+    ("INTEGER", "Integer"),
+    ("INT", "Integer"),
+    ("SERIAL", "Integer"),
+    ("BIGINT", "BigInteger"),
+    ("BIGSERIAL", "BigInteger"),
+    ("TEXT", "Text"),
+    ("VARCHAR", "String"),
+    ("CHARACTER VARYING", "String"),
+    ("BOOLEAN", "Boolean"),
+    ("BOOL", "Boolean"),
+    ("DOUBLE PRECISION", "Float"),
+    ("FLOAT", "Float"),
+    ("REAL", "Float"),
+    ("BYTEA", "LargeBinary"),
+    ("BLOB", "LargeBinary"),
+    ("JSONB", "JSON"),
+    ("JSON", "JSON"),
+    ("TIMESTAMP", "DateTime"),
+    ("TIMESTAMPTZ", "DateTime"),
+    ("DATE", "Date"),
+    ("TIME", "Time"),
+)
+
+# Cache of SQL type string -> SQLAlchemy type name
+_sa_type_cache: dict[str, str] = {}
+
 
 @dataclass
 class TableSchema:
@@ -99,15 +191,18 @@ class AutogenContext:
         self,
         pool: ConnectionPool,
         models: list[type[Base]],
+        max_concurrency: int = 4,
     ) -> None:
         """Initialize the autogen context.
 
         Args:
             pool: Database connection pool
             models: List of OrmKit model classes
+            max_concurrency: Tables introspected at once on PostgreSQL
         """
         self.pool = pool
         self.models = models
+        self.max_concurrency = max_concurrency
         self._dialect = "postgresql" if pool.is_postgres() else "sqlite"
 
     async def get_database_schema(self) -> dict[str, TableSchema]:
@@ -116,14 +211,11 @@ class AutogenContext:
         Returns:
             Dict mapping table names to TableSchema
         """
-        tables = await self.pool.get_tables()
+        # One call for every table's columns, indexes and constraints
         schema: dict[str, TableSchema] = {}
-
-        for table_name in tables:
-            # Get columns
-            columns_info = await self.pool.get_columns(table_name)
+        for table_info in await self.pool.get_schema(self.max_concurrency):
             columns = {}
-            for col in columns_info:
+            for col in table_info.columns:
                 columns[col.name] = ColumnSchema(
                     name=col.name,
                     data_type=col.data_type,
@@ -132,20 +224,16 @@ class AutogenContext:
                     is_primary_key=col.is_primary_key,
                 )
 
-            # Get indexes
-            indexes_info = await self.pool.get_indexes(table_name)
             indexes = {}
-            for idx in indexes_info:
+            for idx in table_info.indexes:
                 indexes[idx.name] = IndexSchema(
                     name=idx.name,
                     columns=idx.columns,
                     unique=idx.unique,
                 )
 
-            # Get constraints
-            constraints_info = await self.pool.get_constraints(table_name)
             constraints = {}
-            for con in constraints_info:
+            for con in table_info.constraints:
                 constraints[con.name] = ConstraintSchema(
                     name=con.name,
                     constraint_type=con.constraint_type,
@@ -154,8 +242,8 @@ class AutogenContext:
                     references_column=con.references_column,
                 )
 
-            schema[table_name] = TableSchema(
-                name=table_name,
+            schema[table_info.name] = TableSchema(
+                name=table_info.name,
                 columns=columns,
                 indexes=indexes,
                 constraints=constraints,
@@ -243,88 +331,83 @@ class AutogenContext:
                     )
                 operations.append(CreateTable(table_name, columns))
 
-        # Find dropped tables (in DB but not in models)
-        model_table_names = set(model_schema.keys())
-        for table_name in db_schema:
-            if table_name not in model_table_names:
-                # Don't auto-drop tables - this is dangerous
-                # User must explicitly drop
-                pass
+        # Tables in the DB but not in the models are never auto-dropped - this
+        # is dangerous, so the user must drop them explicitly
 
-        # Find column changes in existing tables
+        # Changes to existing tables; each table diff is independent and pure
         for table_name, model_table in model_schema.items():
-            if table_name not in db_schema:
-                continue  # Already handled as new table
-
-            db_table = db_schema[table_name]
-
-            # New columns
-            for col_name, model_col in model_table.columns.items():
-                if col_name not in db_table.columns:
-                    operations.append(
-                        AddColumn(
-                            table_name,
-                            Column(
-                                name=model_col.name,
-                                type_=model_col.data_type,
-                                nullable=model_col.nullable,
-                                primary_key=model_col.is_primary_key,
-                                default=model_col.default,
-                            ),
-                        )
-                    )
+            db_table = db_schema.get(table_name)
+            if db_table is not None:
+                operations.extend(self._diff_table(table_name, model_table, db_table))
 
-            # Dropped columns
-            for col_name in db_table.columns:
-                if col_name not in model_table.columns:
-                    # Generate drop column operation
-                    # Note: This can be dangerous - review carefully before applying
-                    operations.append(DropColumn(table_name, col_name))
-
-            # Changed columns
-            for col_name, model_col in model_table.columns.items():
-                if col_name not in db_table.columns:
-                    continue  # Already handled as new column
-
-                db_col = db_table.columns[col_name]
-
-                # Check for type changes
-                type_changed = not self._types_match(model_col.data_type, db_col.data_type)
-                nullable_changed = model_col.nullable != db_col.nullable
-
-                if type_changed or nullable_changed:
-                    operations.append(
-                        AlterColumn(
-                            table_name,
-                            col_name,
-                            type_=model_col.data_type if type_changed else None,
-                            nullable=model_col.nullable if nullable_changed else None,
-                            existing_type=db_col.data_type,
-                            existing_nullable=db_col.nullable,
-                        )
-                    )
+        return operations
 
-            # Index changes
-            db_indexes = db_table.indexes
-            model_indexes = model_table.indexes
-
-            # New indexes (in model but not in DB)
-            for index_name, model_idx in model_indexes.items():
-                # Check if an equivalent index exists (same columns)
-                found = False
-                for _db_idx_name, db_idx in db_indexes.items():
-                    if set(db_idx.columns) == set(model_idx.columns):
-                        found = True
-                        break
-                if not found:
-                    operations.append(
-                        CreateIndex(
-                            index_name=index_name,
-                            table_name=table_name,
-                            columns=model_idx.columns,
-                            unique=model_idx.unique,
-                        )
+    def _diff_table(
+        self, table_name: str, model_table: TableSchema, db_table: TableSchema
+    ) -> list[Operation]:
+        """Operations that bring one existing table in line with its model."""
+        operations: list[Operation] = []
+
+        model_cols = {name: _canon(col) for name, col in model_table.columns.items()}
+        db_cols = {name: _canon(col) for name, col in db_table.columns.items()}
+        # Hashed set differences; iterate the dicts so operations keep column order
+        added = model_cols.keys() - db_cols.keys()
+        dropped = db_cols.keys() - model_cols.keys()
+
+        # New columns
+        for col_name in (name for name in model_cols if name in added):
+            model_col = model_table.columns[col_name]
+            operations.append(
+                AddColumn(
+                    table_name,
+                    Column(
+                        name=model_col.name,
+                        type_=model_col.data_type,
+                        nullable=model_col.nullable,
+                        primary_key=model_col.is_primary_key,
+                        default=model_col.default,
+                    ),
+                )
+            )
+
+        # Dropped columns
+        for col_name in (name for name in db_cols if name in dropped):
+            # Note: This can be dangerous - review carefully before applying
+            operations.append(DropColumn(table_name, col_name))
+
+        # Changed columns: a single tuple compare per shared column
+        for col_name, model_canon in model_cols.items():
+            db_canon = db_cols.get(col_name)
+            if db_canon is None or model_canon == db_canon:
+                continue
+
+            model_col = model_table.columns[col_name]
+            db_col = db_table.columns[col_name]
+            type_changed = model_canon[0] != db_canon[0]
+            nullable_changed = model_canon[1] != db_canon[1]
+            operations.append(
+                AlterColumn(
+                    table_name,
+                    col_name,
+                    type_=model_col.data_type if type_changed else None,
+                    nullable=model_col.nullable if nullable_changed else None,
+                    existing_type=db_col.data_type,
+                    existing_nullable=db_col.nullable,
+                )
+            )
+
+        # New indexes (in model but no DB index covers the same columns)
+        db_index_columns = {frozenset(idx.columns) for idx in db_table.indexes.values()}
+        for index_name, model_idx in model_table.indexes.items():
+            if frozenset(model_idx.columns) not in db_index_columns:
+                operations.append(
+                    CreateIndex(
+                        index_name=index_name,
+                        table_name=table_name,
+                        columns=model_idx.columns,
+                        unique=model_idx.unique,
                     )
+                )
 
         return operations
 
@@ -338,31 +421,7 @@ class AutogenContext:
         Returns:
             True if types are compatible
         """
-        # Normalize types for comparison
-        model_upper = model_type.upper()
-        db_upper = db_type.upper()
-
-        # Direct match
-        if model_upper == db_upper:
-            return True
-
-        # Common equivalences
-        equivalences = [
-            {"INTEGER", "INT", "INT4", "SERIAL"},
-            {"BIGINT", "INT8", "BIGSERIAL"},
-            {"TEXT", "VARCHAR", "CHARACTER VARYING"},
-            {"DOUBLE PRECISION", "FLOAT8", "REAL", "FLOAT"},
-            {"BOOLEAN", "BOOL"},
-        ]
-
-        for equiv_set in equivalences:
-            # Check if both types are in the same equivalence set
-            model_in = any(t in model_upper for t in equiv_set)
-            db_in = any(t in db_upper for t in equiv_set)
-            if model_in and db_in:
-                return True
-
-        return False
+        return _canonical_type(model_type) == _canonical_type(db_type)
 
     def render_migration(
         self,
@@ -399,32 +458,15 @@ class AutogenContext:
             if rev:
                 downgrade_lines.extend(self._render_operation(rev))
 
-        upgrade_code = "\n    ".join(upgrade_lines) if upgrade_lines else "pass"
-        downgrade_code = "\n    ".join(downgrade_lines) if downgrade_lines else "pass"
-
-        return f'''"""{message}
-
-Revision ID: {revision}
-Revises: {down_revision or 'None'}
-Create Date: {date_str}
-"""
-from alembic import op
-import sqlalchemy as sa
-
-# revision identifiers, used by Alembic.
-revision = '{revision}'
-down_revision = {down_rev}
-branch_labels = None
-depends_on = None
-
-
-def upgrade():
-    {upgrade_code}
-
-
-def downgrade():
-    {downgrade_code}
-'''
+        return _MIGRATION_TEMPLATE.format_map({
+            "message": message,
+            "revision": revision,
+            "revises": down_revision or "None",
+            "create_date": date_str,
+            "down_revision": down_rev,
+            "upgrade": "\n    ".join(upgrade_lines) if upgrade_lines else "pass",
+            "downgrade": "\n    ".join(downgrade_lines) if downgrade_lines else "pass",
+        })
 
     def _render_operation(self, op: Operation) -> list[str]:
         """Render a single operation as Python code.
@@ -509,38 +551,13 @@ def downgrade():
         Returns:
             SQLAlchemy type name
         """
-        type_upper = type_str.upper()
-
-        mappings = {
-            "INTEGER": "Integer",
-            "INT": "Integer",
-            "SERIAL": "Integer",
-            "BIGINT": "BigInteger",
-            "BIGSERIAL": "BigInteger",
-            "TEXT": "Text",
-            "VARCHAR": "String",
-            "CHARACTER VARYING": "String",
-            "BOOLEAN": "Boolean",
-            "BOOL": "Boolean",
-            "DOUBLE PRECISION": "Float",
-            "FLOAT": "Float",
-            "REAL": "Float",
-            "BYTEA": "LargeBinary",
-            "BLOB": "LargeBinary",
-            "JSONB": "JSON",
-            "JSON": "JSON",
-            "TIMESTAMP": "DateTime",
-            "TIMESTAMPTZ": "DateTime",
-            "DATE": "Date",
-            "TIME": "Time",
-        }
-
-        for sql_type, sa_type in mappings.items():
-            if sql_type in type_upper:
-                return sa_type
-
-        # Default to Text for unknown types
-        return "Text"
+        sa_type = _sa_type_cache.get(type_str)
+        if sa_type is None:
+            type_upper = type_str.upper()
+            # First substring hit wins, so the table order matters
+            sa_type = next((sa for sql, sa in _SA_TYPES if sql in type_upper), "Text")
+            _sa_type_cache[type_str] = sa_type
+        return sa_type
 
 
 async def generate_migration(
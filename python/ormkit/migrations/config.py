@@ -3,10 +3,15 @@
 from __future__ import annotations
 
 import configparser
+import dataclasses
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
+# Cache of (path, mtime_ns, size) -> parsed config, so CLI commands that
+# resolve the config repeatedly only parse an unchanged alembic.ini once
+_ini_cache: dict[tuple[str, int, int], AlembicConfig] = {}
+
 
 @dataclass
 class AlembicConfig:
@@ -66,9 +71,21 @@ class AlembicConfig:
             ValueError: If required options are missing
         """
         path = Path(path)
-        if not path.exists():
-            raise FileNotFoundError(f"Config file not found: {path}")
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Config file not found: {path}") from None
+
+        key = (str(path), stat.st_mtime_ns, stat.st_size)
+        cached = _ini_cache.get(key)
+        if cached is None:
+            cached = _ini_cache[key] = cls._parse_ini(path)
+        # Callers may mutate the result; hand out a copy
+        return dataclasses.replace(cached, extra=dict(cached.extra))
 
+    @classmethod
+    def _parse_ini(cls, path: Path) -> AlembicConfig:
+        """Parse alembic.ini without consulting the cache."""
         config = configparser.ConfigParser()
         config.read(path)
 
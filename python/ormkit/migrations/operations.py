@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from dataclasses import dataclass
-from typing import Any, Protocol, runtime_checkable
+from typing import Any, ClassVar, Protocol, runtime_checkable
 
 
 @runtime_checkable
@@ -19,9 +20,17 @@ class Operation(Protocol):
         ...
 
 
-@dataclass
+# Cache of (column, default type, dialect) -> rendered column definition.
+# The default's type is part of the key because True == 1 but renders differently.
+_column_sql_cache: dict[tuple[ColumnDef, type, str], str] = {}
+
+
+@dataclass(slots=True, frozen=True)
 class ColumnDef:
-    """Column definition for CreateTable and AddColumn operations."""
+    """Column definition for CreateTable and AddColumn operations.
+
+    Frozen so identical definitions hash equal and share one cached rendering.
+    """
 
     name: str
     type_: str
@@ -34,6 +43,17 @@ class ColumnDef:
 
     def to_sql(self, dialect: str) -> str:
         """Generate SQL column definition."""
+        key = (self, type(self.default), dialect)
+        try:
+            return _column_sql_cache[key]
+        except KeyError:
+            sql = _column_sql_cache[key] = self._render(dialect)
+            return sql
+        except TypeError:
+            # Unhashable default (e.g. a dict literal) - render without caching
+            return self._render(dialect)
+
+    def _render(self, dialect: str) -> str:
         parts = [f"{self.name} {self.type_}"]
 
         if self.primary_key:
@@ -187,41 +207,46 @@ class AlterColumn:
 
     def to_sql(self, dialect: str) -> str:
         """Generate ALTER TABLE ALTER COLUMN SQL."""
+        render = self._DIALECT_STATEMENTS.get(dialect)
+        statements = render(self) if render is not None else []
+        return "; ".join(statements)
+
+    def _postgresql_statements(self) -> list[str]:
         statements = []
         table = self.table_name
         col = self.column_name
-
-        if dialect == "postgresql":
-            if self.type_ is not None:
-                statements.append(
-                    f"ALTER TABLE {table} ALTER COLUMN {col} TYPE {self.type_}"
-                )
-            if self.nullable is not None:
-                if self.nullable:
-                    statements.append(f"ALTER TABLE {table} ALTER COLUMN {col} DROP NOT NULL")
-                else:
-                    statements.append(f"ALTER TABLE {table} ALTER COLUMN {col} SET NOT NULL")
-            if self.default is not None:
-                if self.default == "DROP":
-                    statements.append(f"ALTER TABLE {table} ALTER COLUMN {col} DROP DEFAULT")
-                else:
-                    statements.append(
-                        f"ALTER TABLE {table} ALTER COLUMN {col} SET DEFAULT {self.default}"
-                    )
-            if self.new_name is not None:
-                statements.append(
-                    f"ALTER TABLE {table} RENAME COLUMN {col} TO {self.new_name}"
-                )
-        elif dialect == "sqlite":
-            # SQLite has limited ALTER TABLE support
-            # For type changes, we'd need to recreate the table
-            if self.new_name is not None:
+        if self.type_ is not None:
+            statements.append(f"ALTER TABLE {table} ALTER COLUMN {col} TYPE {self.type_}")
+        if self.nullable is not None:
+            if self.nullable:
+                statements.append(f"ALTER TABLE {table} ALTER COLUMN {col} DROP NOT NULL")
+            else:
+                statements.append(f"ALTER TABLE {table} ALTER COLUMN {col} SET NOT NULL")
+        if self.default is not None:
+            if self.default == "DROP":
+                statements.append(f"ALTER TABLE {table} ALTER COLUMN {col} DROP DEFAULT")
+            else:
                 statements.append(
-                    f"ALTER TABLE {table} RENAME COLUMN {col} TO {self.new_name}"
+                    f"ALTER TABLE {table} ALTER COLUMN {col} SET DEFAULT {self.default}"
                 )
-            # Other changes require table recreation (not implemented here)
-
-        return "; ".join(statements) if statements else ""
+        if self.new_name is not None:
+            statements.append(f"ALTER TABLE {table} RENAME COLUMN {col} TO {self.new_name}")
+        return statements
+
+    def _sqlite_statements(self) -> list[str]:
+        # SQLite has limited ALTER TABLE support: only renames are expressible.
+        # Other changes require table recreation (not implemented here)
+        if self.new_name is not None:
+            return [
+                f"ALTER TABLE {self.table_name} RENAME COLUMN {self.column_name} TO {self.new_name}"
+            ]
+        return []
+
+    # Dialect -> statement builder; unknown dialects produce no SQL
+    _DIALECT_STATEMENTS: ClassVar[dict[str, Callable[[AlterColumn], list[str]]]] = {
+        "postgresql": _postgresql_statements,
+        "sqlite": _sqlite_statements,
+    }
 
     def reverse(self) -> AlterColumn | None:
         """Reverse the alteration if original values are known."""
@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import json
+import os
 from dataclasses import dataclass
 from datetime import datetime
-from typing import TYPE_CHECKING
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 from ormkit.migrations.config import AlembicConfig
 from ormkit.migrations.operations import Operations
@@ -13,6 +16,59 @@ from ormkit.migrations.script import MigrationScript
 if TYPE_CHECKING:
     from ormkit._ormkit import ConnectionPool
 
+# Sidecar in the versions directory holding each script's header fields,
+# keyed by file name and trusted only while (mtime_ns, size) still match
+_HEADER_CACHE_NAME = ".ormkit_cache.json"
+
+
+def _load_cache(versions_dir: Path) -> dict[str, list[Any]]:
+    """Read the header cache, treating a missing or corrupt file as empty."""
+    try:
+        cache = json.loads((versions_dir / _HEADER_CACHE_NAME).read_bytes())
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def _save_cache(versions_dir: Path, cache: dict[str, list[Any]]) -> None:
+    """Atomically replace the header cache; a read-only directory is not an error."""
+    path = versions_dir / _HEADER_CACHE_NAME
+    tmp = path.with_name(f"{_HEADER_CACHE_NAME}.{os.getpid()}.tmp")
+    try:
+        tmp.write_bytes(json.dumps(cache, separators=(",", ":")).encode())
+        os.replace(tmp, path)
+    except OSError:
+        tmp.unlink(missing_ok=True)
+
+
+def _cache_entry(stat: os.stat_result, script: MigrationScript) -> list[Any]:
+    """Serialize a script's header fields alongside the stat they were read at."""
+    return [
+        stat.st_mtime_ns,
+        stat.st_size,
+        script.revision,
+        script.down_revision,
+        script.message,
+        list(script.branch_labels) if script.branch_labels else None,
+        list(script.depends_on) if script.depends_on else None,
+        script.create_date.isoformat() if script.create_date else None,
+    ]
+
+
+def _script_from_entry(path: Path, entry: list[Any]) -> MigrationScript:
+    """Rebuild a deferred MigrationScript from a cache entry."""
+    _, _, revision, down_revision, message, branch_labels, depends_on, create_date = entry
+    return MigrationScript(
+        revision=revision,
+        down_revision=down_revision,
+        message=message,
+        branch_labels=tuple(branch_labels) if branch_labels else None,
+        depends_on=tuple(depends_on) if depends_on else None,
+        create_date=datetime.fromisoformat(create_date) if create_date else None,
+        path=path,
+        _deferred=True,
+    )
+
 
 @dataclass
 class MigrationState:
@@ -58,9 +114,13 @@ class MigrationRunner:
         self.config = config
         self._dialect = "postgresql" if pool.is_postgres() else "sqlite"
         self._version_table = config.version_table if config else "alembic_version"
+        # Set once the version table is known to exist, so the CREATE runs once
+        self._version_table_ready = False
 
     async def ensure_version_table(self) -> None:
         """Create the version table if it doesn't exist."""
+        if self._version_table_ready:
+            return
         table = self._version_table
         if self._dialect == "postgresql":
             sql = f"""
@@ -76,6 +136,7 @@ class MigrationRunner:
                 )
             """
         await self.pool.execute(sql)
+        self._version_table_ready = True
 
     async def get_current_revision(self) -> str | None:
         """Get the current applied revision.
@@ -87,10 +148,7 @@ class MigrationRunner:
         table = self._version_table
 
         result = await self.pool.execute(f'SELECT version_num FROM "{table}" LIMIT 1')
-        row = result.first()
-        if row:
-            return row["version_num"]
-        return None
+        return result.scalar()
 
     async def get_applied_revisions(self) -> list[str]:
         """Get all applied revision IDs.
@@ -102,7 +160,7 @@ class MigrationRunner:
         table = self._version_table
 
         result = await self.pool.execute(f'SELECT version_num FROM "{table}"')
-        return [row["version_num"] for row in result.all()]
+        return result.scalars()
 
     async def stamp(self, revision: str) -> None:
         """Stamp a revision as current without running migrations.
@@ -113,19 +171,13 @@ class MigrationRunner:
         await self.ensure_version_table()
         table = self._version_table
 
-        # Remove all existing versions
-        await self.pool.execute(f'DELETE FROM "{table}"')
+        placeholder = "$1" if self._dialect == "postgresql" else "?"
 
-        # Insert new version
-        if self._dialect == "postgresql":
-            await self.pool.execute(
-                f'INSERT INTO "{table}" (version_num) VALUES ($1)',
-                [revision]
-            )
-        else:
-            await self.pool.execute(
-                f'INSERT INTO "{table}" (version_num) VALUES (?)',
-                [revision]
+        # Replace the stamped version in one transaction on one connection
+        async with await self.pool.transaction() as tx:
+            await tx.execute(f'DELETE FROM "{table}"')
+            await tx.execute(
+                f'INSERT INTO "{table}" (version_num) VALUES ({placeholder})', [revision]
             )
 
     def load_migrations(self) -> list[MigrationScript]:
@@ -141,16 +193,41 @@ class MigrationRunner:
         if not versions_dir.exists():
             return []
 
+        # Only files whose (mtime_ns, size) changed since the last listing are
+        # scanned again; the rest come straight from the sidecar cache
+        cache = _load_cache(versions_dir)
+        fresh: dict[str, list[Any]] = {}
         scripts = []
-        for path in versions_dir.glob("*.py"):
-            if path.name.startswith("_"):
-                continue
-            try:
-                script = MigrationScript.load(path)
+        with os.scandir(versions_dir) as entries:
+            for dir_entry in entries:
+                name = dir_entry.name
+                if name.startswith("_") or not name.endswith(".py"):
+                    continue
+                path = versions_dir / name
+                try:
+                    stat = dir_entry.stat()
+                except FileNotFoundError:
+                    continue
+                entry = cache.get(name)
+                if (
+                    isinstance(entry, list)
+                    and len(entry) == 8
+                    and entry[0] == stat.st_mtime_ns
+                    and entry[1] == stat.st_size
+                ):
+                    script = _script_from_entry(path, entry)
+                else:
+                    try:
+                        script = MigrationScript.scan(path)
+                    except (ValueError, FileNotFoundError):
+                        # Skip invalid files
+                        continue
+                    entry = _cache_entry(stat, script)
+                fresh[name] = entry
                 scripts.append(script)
-            except (ValueError, FileNotFoundError):
-                # Skip invalid files
-                pass
+
+        if fresh != cache:
+            _save_cache(versions_dir, fresh)
 
         # Sort by dependency order
         return self._sort_migrations(scripts)
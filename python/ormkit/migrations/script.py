@@ -8,6 +8,7 @@ from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
+from types import CodeType
 from typing import Any
 
 from ormkit.migrations.operations import Operations
@@ -63,13 +64,20 @@ class MigrationScript:
     # Raw source for modifications
     _source: str | None = None
 
+    # Compiled module, executed on first upgrade()/downgrade()
+    _code: CodeType | None = None
+    _functions_loaded: bool = False
+
+    # Set by scan() when only the header was read; the file is parsed on first run
+    _deferred: bool = False
+
     @classmethod
     def load(cls, path: Path) -> MigrationScript:
         """Load a migration script from a Python file.
 
         This parses Alembic-format migration files and extracts:
         - revision, down_revision, branch_labels, depends_on
-        - upgrade() and downgrade() functions
+        - upgrade() and downgrade() functions (executed on first use)
         - Creation date from docstring
 
         Args:
@@ -84,77 +92,58 @@ class MigrationScript:
         if not path.exists():
             raise FileNotFoundError(f"Migration file not found: {path}")
 
-        source = path.read_text()
+        # Parsing and compiling happen once per file version; later loads of an
+        # unchanged file only rebuild the dataclass
+        stat = path.stat()
+        cache_key = (str(path), stat.st_mtime_ns, stat.st_size)
+        cached = _script_cache.get(cache_key)
+        if cached is None:
+            cached = _parse_script(path)
+            _script_cache[cache_key] = cached
 
-        # Parse the AST to extract module-level variables
-        try:
-            tree = ast.parse(source)
-        except SyntaxError as e:
-            raise ValueError(f"Invalid Python in {path}: {e}") from e
+        fields, code = cached
+        return cls(**fields, path=path, _code=code)
+
+    @classmethod
+    def scan(cls, path: Path) -> MigrationScript:
+        """Load a migration script's header, parsing the file only if needed.
+
+        Files whose identifiers are plain string literals are read with a regex
+        scan; parsing and compiling wait until the migration actually runs.
+        Anything the scan cannot read with certainty falls back to load().
+
+        Args:
+            path: Path to the migration .py file
+
+        Returns:
+            MigrationScript instance
+
+        Raises:
+            ValueError: If file is not a valid migration
+        """
+        fields = fast_scan(path)
+        if fields is None:
+            return cls.load(path)
+        return cls(**fields, path=path, _deferred=True)
+
+    def _load_functions(self) -> None:
+        """Execute the compiled module to get its upgrade/downgrade functions.
+
+        Deferred until a migration actually runs, so listing or inspecting
+        migrations never executes their code.
+        """
+        if self._deferred:
+            self._deferred = False
+            if self.path is not None:
+                loaded = type(self).load(self.path)
+                self._code = loaded._code
+                self._source = loaded._source
+        if self._code is None or self._functions_loaded:
+            return
+        self._functions_loaded = True
 
-        # Extract variables and functions
-        revision = None
-        down_revision = None
-        branch_labels = None
-        depends_on = None
-        message = ""
-        create_date = None
-
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Assign):
-                for target in node.targets:
-                    if isinstance(target, ast.Name):
-                        name = target.id
-                        value = _eval_ast_value(node.value)
-
-                        if name == "revision":
-                            revision = value
-                        elif name == "down_revision":
-                            down_revision = value
-                        elif name == "branch_labels":
-                            if value:
-                                branch_labels = tuple(value) if isinstance(value, (list, tuple)) else (value,)
-                        elif name == "depends_on":
-                            if value:
-                                depends_on = tuple(value) if isinstance(value, (list, tuple)) else (value,)
-
-        # Extract docstring for message and date
-        if tree.body and isinstance(tree.body[0], ast.Expr):
-            if isinstance(tree.body[0].value, ast.Constant):
-                docstring = tree.body[0].value.value
-                if isinstance(docstring, str):
-                    lines = docstring.strip().split("\n")
-                    if lines:
-                        message = lines[0].strip()
-                    # Try to find creation date
-                    for line in lines:
-                        if "Create Date:" in line:
-                            date_str = line.split("Create Date:", 1)[1].strip()
-                            try:
-                                create_date = datetime.fromisoformat(date_str.split(".")[0])
-                            except ValueError:
-                                pass
-
-        if revision is None:
-            raise ValueError(f"No 'revision' found in {path}")
-
-        # Create script
-        script = cls(
-            revision=revision,
-            down_revision=down_revision,
-            message=message,
-            branch_labels=branch_labels,
-            depends_on=depends_on,
-            create_date=create_date,
-            path=path,
-            _source=source,
-        )
-
-        # Compile the module to get upgrade/downgrade functions
         # We need to provide mock 'alembic' and 'sqlalchemy' modules since migrations import them
         try:
-            code = compile(source, str(path), "exec")
-
             # Create mock modules and inject them into sys.modules
             # This allows `from alembic import op` and `import sqlalchemy as sa` to work
             import sys
@@ -167,12 +156,12 @@ class MigrationScript:
 
             try:
                 module_dict: dict[str, Any] = {}
-                exec(code, module_dict)
+                exec(self._code, module_dict)
 
                 if "upgrade" in module_dict:
-                    script._upgrade_fn = module_dict["upgrade"]
+                    self._upgrade_fn = module_dict["upgrade"]
                 if "downgrade" in module_dict:
-                    script._downgrade_fn = module_dict["downgrade"]
+                    self._downgrade_fn = module_dict["downgrade"]
             finally:
                 # Restore original modules if they existed
                 if old_alembic is not None:
@@ -184,11 +173,9 @@ class MigrationScript:
                 elif "sqlalchemy" in sys.modules:
                     del sys.modules["sqlalchemy"]
         except Exception as e:
-            # Log but don't fail - we might just be reading metadata
+            # Don't fail here - upgrade()/downgrade() report the missing function
             import warnings
-            warnings.warn(f"Failed to load migration functions from {path}: {e}", stacklevel=2)
-
-        return script
+            warnings.warn(f"Failed to load migration functions from {self.path}: {e}", stacklevel=3)
 
     def upgrade(self, op: Operations) -> None:
         """Execute the upgrade function.
@@ -199,6 +186,7 @@ class MigrationScript:
         Raises:
             RuntimeError: If upgrade function not loaded
         """
+        self._load_functions()
         if self._upgrade_fn is None:
             raise RuntimeError(f"No upgrade() function in migration {self.revision}")
 
@@ -224,6 +212,7 @@ class MigrationScript:
         Raises:
             RuntimeError: If downgrade function not loaded
         """
+        self._load_functions()
         if self._downgrade_fn is None:
             raise RuntimeError(f"No downgrade() function in migration {self.revision}")
 
@@ -253,20 +242,40 @@ class MigrationScript:
         branch = repr(self.branch_labels) if self.branch_labels else "None"
         deps = repr(self.depends_on) if self.depends_on else "None"
 
-        return f'''"""{self.message}
+        return _EMPTY_MIGRATION_TEMPLATE.format_map({
+            "message": self.message,
+            "revision": self.revision,
+            "revises": self.down_revision or "None",
+            "create_date": date_str,
+            "down_revision": down_rev,
+            "branch_labels": branch,
+            "depends_on": deps,
+        })
+
+    @property
+    def short_revision(self) -> str:
+        """Get short form of revision (first 12 chars)."""
+        return self.revision[:12]
+
+    def __repr__(self) -> str:
+        return f"MigrationScript(revision='{self.short_revision}', message='{self.message[:30]}...')"
+
 
-Revision ID: {self.revision}
-Revises: {self.down_revision or 'None'}
-Create Date: {date_str}
+# Source of a new, empty migration; filled in by MigrationScript.render()
+_EMPTY_MIGRATION_TEMPLATE = '''"""{message}
+
+Revision ID: {revision}
+Revises: {revises}
+Create Date: {create_date}
 """
 from alembic import op
 import sqlalchemy as sa
 
 # revision identifiers, used by Alembic.
-revision = '{self.revision}'
-down_revision = {down_rev}
-branch_labels = {branch}
-depends_on = {deps}
+revision = '{revision}'
+down_revision = {down_revision}
+branch_labels = {branch_labels}
+depends_on = {depends_on}
 
 
 def upgrade():
@@ -277,13 +286,143 @@ def downgrade():
     pass
 '''
 
-    @property
-    def short_revision(self) -> str:
-        """Get short form of revision (first 12 chars)."""
-        return self.revision[:12]
+# Parsed migration files: (path, mtime_ns, size) -> (MigrationScript fields, compiled module)
+_script_cache: dict[tuple[str, int, int], tuple[dict[str, Any], CodeType | None]] = {}
 
-    def __repr__(self) -> str:
-        return f"MigrationScript(revision='{self.short_revision}', message='{self.message[:30]}...')"
+# Module-level names MigrationScript.load() reads
+_SCRIPT_VARIABLES = frozenset({"revision", "down_revision", "branch_labels", "depends_on"})
+
+
+# Header patterns for fast_scan(): top-level assignments whose value is None
+# or a single string literal; anything else defers to the AST path
+_HEADER_ASSIGN_RE = re.compile(
+    rb"^(revision|down_revision|branch_labels|depends_on)[ \t]*(?::[^=\n]*)?=[ \t]*(.*?)\s*$",
+    re.M,
+)
+_HEADER_LITERAL_RE = re.compile(rb"None|'([\w.-]+)'|\"([\w.-]+)\"")
+_DOCSTRING_RE = re.compile(rb'\A\s*(?:#[^\n]*\s*)*(?:"""|\'\'\')(.*?)(?:"""|\'\'\')', re.S)
+_CREATE_DATE_RE = re.compile(rb"Create Date:\s*([^\n.]+)")
+
+
+def fast_scan(path: Path) -> dict[str, Any] | None:
+    """Read a migration's header fields without parsing it as Python.
+
+    Returns MigrationScript fields, or None when the file does not declare
+    its identifiers as plain literals (the caller then falls back to the AST).
+    """
+    data = path.read_bytes()
+
+    variables: dict[str, str | None] = {}
+    for raw_name, value in _HEADER_ASSIGN_RE.findall(data):
+        name = raw_name.decode()
+        literal = _HEADER_LITERAL_RE.fullmatch(value)
+        if literal is None or name in variables:
+            return None
+        string = literal.group(1) or literal.group(2)
+        variables[name] = string.decode() if string else None
+
+    revision = variables.get("revision")
+    if revision is None:
+        return None
+
+    message = ""
+    create_date = None
+    if docstring := _DOCSTRING_RE.match(data):
+        text = docstring.group(1).decode()
+        message = text.strip().split("\n", 1)[0].strip()
+        if date := _CREATE_DATE_RE.search(docstring.group(1)):
+            try:
+                create_date = datetime.fromisoformat(date.group(1).decode().strip())
+            except ValueError:
+                pass
+
+    branch_labels = variables.get("branch_labels")
+    depends_on = variables.get("depends_on")
+    return {
+        "revision": revision,
+        "down_revision": variables.get("down_revision"),
+        "message": message,
+        "branch_labels": (branch_labels,) if branch_labels else None,
+        "depends_on": (depends_on,) if depends_on else None,
+        "create_date": create_date,
+    }
+
+
+def _parse_script(path: Path) -> tuple[dict[str, Any], CodeType | None]:
+    """Parse a migration file into MigrationScript fields and a compiled module.
+
+    Raises:
+        ValueError: If file is not a valid migration
+    """
+    source = path.read_text()
+
+    # Parse the AST to extract module-level variables
+    try:
+        tree = ast.parse(source, filename=str(path))
+    except SyntaxError as e:
+        raise ValueError(f"Invalid Python in {path}: {e}") from e
+
+    # Alembic declares its identifiers as top-level (optionally annotated) assignments
+    variables: dict[str, Any] = {}
+    for node in tree.body:
+        if isinstance(node, ast.Assign):
+            targets = node.targets
+        elif isinstance(node, ast.AnnAssign) and node.value is not None:
+            targets = [node.target]
+        else:
+            continue
+        for target in targets:
+            if isinstance(target, ast.Name) and target.id in _SCRIPT_VARIABLES:
+                variables[target.id] = _eval_ast_value(node.value)  # type: ignore[arg-type]
+
+    revision = variables.get("revision")
+    if revision is None:
+        raise ValueError(f"No 'revision' found in {path}")
+
+    branch_labels = None
+    if value := variables.get("branch_labels"):
+        branch_labels = tuple(value) if isinstance(value, (list, tuple)) else (value,)
+    depends_on = None
+    if value := variables.get("depends_on"):
+        depends_on = tuple(value) if isinstance(value, (list, tuple)) else (value,)
+
+    # Extract docstring for message and date
+    message = ""
+    create_date = None
+    if tree.body and isinstance(tree.body[0], ast.Expr):
+        if isinstance(tree.body[0].value, ast.Constant):
+            docstring = tree.body[0].value.value
+            if isinstance(docstring, str):
+                lines = docstring.strip().split("\n")
+                if lines:
+                    message = lines[0].strip()
+                # Try to find creation date
+                for line in lines:
+                    if "Create Date:" in line:
+                        date_str = line.split("Create Date:", 1)[1].strip()
+                        try:
+                            create_date = datetime.fromisoformat(date_str.split(".")[0])
+                        except ValueError:
+                            pass
+
+    # Compile from the tree already parsed rather than re-tokenizing the source
+    try:
+        code: CodeType | None = compile(tree, str(path), "exec")
+    except (SyntaxError, ValueError) as e:
+        import warnings
+        warnings.warn(f"Failed to load migration functions from {path}: {e}", stacklevel=3)
+        code = None
+
+    fields = {
+        "revision": revision,
+        "down_revision": variables.get("down_revision"),
+        "message": message,
+        "branch_labels": branch_labels,
+        "depends_on": depends_on,
+        "create_date": create_date,
+        "_source": source,
+    }
+    return fields, code
 
 
 def _eval_ast_value(node: ast.expr) -> Any:
@@ -35,6 +35,7 @@ class RelationshipInfo:
     lazy: str = "select"  # select, joined, subquery, selectin, raise
     uselist: bool | None = None  # True for one-to-many, False for many-to-one
     secondary: str | None = None  # Junction table name for many-to-many relationships
+    order_by: str | list[str] | None = None  # Target column(s) collections load in; "-col" = DESC
 
     # Resolved at runtime
     _target_model: type[Base] | None = field(default=None, repr=False)
@@ -44,10 +45,11 @@ class RelationshipInfo:
     _junction_local_col: str | None = field(default=None, repr=False)
     _junction_remote_col: str | None = field(default=None, repr=False)
 
-    @property
-    def is_many_to_many(self) -> bool:
-        """Check if this is a many-to-many relationship."""
-        return self.secondary is not None
+    # Fixed at definition time; checked on every relationship load and attribute access
+    is_many_to_many: bool = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.is_many_to_many = self.secondary is not None
 
     def resolve(self, owner_model: type[Base], attr_name: str, type_hint: Any) -> None:
         """Resolve the relationship target model and columns."""
@@ -169,6 +171,7 @@ def relationship(
     lazy: str = "select",
     uselist: bool | None = None,
     secondary: str | None = None,
+    order_by: str | list[str] | None = None,
 ) -> Any:
     """Define a relationship between models.
 
@@ -178,6 +181,8 @@ def relationship(
         lazy: Loading strategy - "select", "joined", "subquery", "selectin", "raise"
         uselist: Whether to return a list (True) or single object (False)
         secondary: Table name for many-to-many relationships
+        order_by: Target column(s) to sort collections by when eager loaded
+            (prefix with "-" for descending)
 
     Returns:
         A RelationshipInfo descriptor
@@ -199,6 +204,7 @@ def relationship(
         lazy=lazy,
         uselist=uselist,
         secondary=secondary,
+        order_by=order_by,
     )
 
 
@@ -218,14 +224,32 @@ def selectinload(attr: str | RelationshipInfo) -> LoadOption:
 def joinedload(attr: str | RelationshipInfo) -> LoadOption:
     """Eager load a relationship using a JOIN.
 
-    Use this for single-object relationships (many-to-one, one-to-one).
+    Use this for single-object relationships (many-to-one, one-to-one). For a
+    many-to-many relationship, ``.all()`` fetches parents and related objects in
+    a single statement through the junction table - worth it for small parent
+    sets, where saving a round-trip outweighs the repeated parent columns.
 
     Example:
         >>> posts = await session.query(Post).options(joinedload("author")).all()
+        >>> users = await session.query(User).options(joinedload("roles")).all()
     """
     return LoadOption("joined", attr)
 
 
+def greedyload(attr: str | RelationshipInfo) -> LoadOption:
+    """Eager load a collection by reading the whole related table in one query.
+
+    Suited to small related tables: no parent IDs are sent, and inside
+    ``session.begin()`` the rows are reused by later greedy loads of the same
+    relationship until the session writes or the transaction ends.
+
+    Example:
+        >>> async with session.begin():
+        ...     users = await session.query(User).options(greedyload("roles")).all()
+    """
+    return LoadOption("greedy", attr)
+
+
 def lazyload(attr: str | RelationshipInfo) -> LoadOption:
     """Explicitly set lazy loading for a relationship.
 
@@ -248,7 +272,7 @@ def noload(attr: str | RelationshipInfo) -> LoadOption:
 class LoadOption:
     """Represents a relationship loading option."""
 
-    strategy: str  # "selectin", "joined", "select", "noload", "raise"
+    strategy: str  # "selectin", "joined", "greedy", "select", "noload", "raise"
     attribute: str | RelationshipInfo
 
     @property
@@ -282,11 +306,16 @@ class ManyToManyCollection(list):
         rel_info: RelationshipInfo,
         session: Any,
         initial: list | None = None,
+        *,
+        partial: bool = False,
     ) -> None:
         super().__init__(initial or [])
         self._owner = owner
         self._rel_info = rel_info
         self._session = session
+        # True when the collection was created without loading the junction
+        # table, so it only tracks items added through this collection
+        self._partial = partial
 
     def append(self, _item: Any) -> None:
         raise TypeError(
@@ -365,8 +394,28 @@ class ManyToManyCollection(list):
 
         params: list[Any] = []
         values_sql: list[str] = []
-
-        if dialect == "postgresql":
+        target_col = self._rel_info._target_model.__columns__.get(target_pk_col)
+        target_type = target_col.python_type if target_col else None
+
+        # PG string keys are bound per row instead: the column may be a uuid or
+        # other non-text type, which the JSON array's text values wouldn't match
+        if target_type is int or (target_type is str and dialect != "postgresql"):
+            # Bind all ids as one JSON array so the statement text doesn't
+            # depend on how many items are added (keeps the statement cache hot)
+            params = [owner_id, list(item_by_target_id)]
+            if dialect == "postgresql":
+                sql = (
+                    f"INSERT INTO {junction_table} ({junction_local}, {junction_remote}) "
+                    f"SELECT $1, ids.value::bigint "
+                    f"FROM jsonb_array_elements_text($2::jsonb) AS ids(value) "
+                    f"ON CONFLICT DO NOTHING"
+                )
+            else:
+                sql = (
+                    f"INSERT OR IGNORE INTO {junction_table} ({junction_local}, {junction_remote}) "
+                    f"SELECT ?, value FROM json_each(?)"
+                )
+        elif dialect == "postgresql":
             param_idx = 1
             for target_id in item_by_target_id:
                 values_sql.append(f"(${param_idx}, ${param_idx + 1})")
@@ -385,6 +434,7 @@ class ManyToManyCollection(list):
                 f"VALUES {', '.join(values_sql)}"
             )
 
+        self._session._prefetch_cache.clear()
         await self._session._pool.execute_statement_py(sql, params)
 
         existing_ids = {getattr(item, target_pk_col) for item in self}
@@ -416,21 +466,24 @@ class ManyToManyCollection(list):
         if not target_ids:
             return
 
-        if dialect == "postgresql":
-            placeholders = ", ".join(f"${i + 2}" for i in range(len(target_ids)))
-            sql = (
-                f"DELETE FROM {junction_table} "
-                f"WHERE {junction_local} = $1 AND {junction_remote} IN ({placeholders})"
-            )
-            params = [owner_id, *target_ids]
-        else:
-            placeholders = ", ".join("?" for _ in target_ids)
-            sql = (
-                f"DELETE FROM {junction_table} "
-                f"WHERE {junction_local} = ? AND {junction_remote} IN ({placeholders})"
-            )
-            params = [owner_id, *target_ids]
+        from ormkit.session import _build_id_list_sql
+
+        target_col = self._rel_info._target_model.__columns__.get(target_pk_col)
+        in_sql, in_params = _build_id_list_sql(
+            junction_remote,
+            target_ids,
+            dialect,
+            target_col.python_type if target_col else None,
+            param_offset=1,
+        )
+        owner_placeholder = "$1" if dialect == "postgresql" else "?"
+        sql = (
+            f"DELETE FROM {junction_table} "
+            f"WHERE {junction_local} = {owner_placeholder} AND {in_sql}"
+        )
+        params = [owner_id, *in_params]
 
+        self._session._prefetch_cache.clear()
         await self._session._pool.execute_statement_py(sql, params)
 
         target_id_set = set(target_ids)
@@ -455,6 +508,7 @@ class ManyToManyCollection(list):
         else:
             sql = f"DELETE FROM {junction_table} WHERE {junction_local} = ?"
 
+        self._session._prefetch_cache.clear()
         await self._session._pool.execute_statement_py(sql, [owner_id])
 
         # Clear local list
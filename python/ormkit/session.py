@@ -2,24 +2,31 @@
 
 from __future__ import annotations
 
-from collections.abc import AsyncIterator
+import asyncio
+from collections import defaultdict
+from collections.abc import AsyncIterator, Callable, Hashable, Mapping, Sequence
 from contextlib import asynccontextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass, field
-from datetime import UTC
+from datetime import UTC, datetime
+from functools import lru_cache
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any, TypeVar
 
 from ormkit._ormkit import ConnectionPool, QueryResult
+from ormkit.fields import ColumnInfo, _json_dumps
 
 if TYPE_CHECKING:
     from ormkit.base import Base
     from ormkit.query import DeleteStatement, InsertStatement, SelectStatement, UpdateStatement
+    from ormkit.relationships import LoadOption, RelationshipInfo
 
 T = TypeVar("T", bound="Base")
 
 
 # ========== Q Objects for Complex Conditions ==========
 
-@dataclass
+@dataclass(slots=True)
 class Q:
     """Django-style Q object for complex query conditions.
 
@@ -42,11 +49,17 @@ class Q:
     _filters: list[tuple[str, str, Any]] = field(default_factory=list)
     _children: list[tuple[str, Q]] = field(default_factory=list)  # ("AND"/"OR", child_q)
     _negated: bool = False
+    # Rendered SQL and params, keyed by (dialect, param_offset); a Q is never
+    # modified after construction, and chained queries share their Q objects
+    _sql_cache: dict[tuple[str, int], tuple[str, list[Any]]] = field(
+        default_factory=dict, repr=False, compare=False
+    )
 
     def __init__(self, **kwargs: Any) -> None:
         self._filters = []
         self._children = []
         self._negated = False
+        self._sql_cache = {}
 
         for key, value in kwargs.items():
             col, op = _parse_filter_key(key)
@@ -74,13 +87,31 @@ class Q:
 
     def to_sql(self, dialect: str, param_offset: int = 0) -> tuple[str, list[Any]]:
         """Convert to SQL WHERE clause fragment."""
+        sql, params = self._compiled(dialect, param_offset)
+        return sql, params.copy()
+
+    def _compiled(self, dialect: str, param_offset: int) -> tuple[str, list[Any]]:
+        """Return the cached SQL and params; callers must copy, not mutate, params."""
+        key = (dialect, param_offset)
+        compiled = self._sql_cache.get(key)
+        if compiled is None:
+            compiled = self._sql_cache[key] = self._render(dialect, param_offset)
+        return compiled
+
+    def _render(self, dialect: str, param_offset: int) -> tuple[str, list[Any]]:
+        """Build the SQL fragment and params, walking child Q objects."""
         params: list[Any] = []
 
         if self._children:
             # Complex expression with children
+            connector = " OR " if self._children[0][0] == "OR" else " AND "
+            children = self._children
+            if connector == " AND ":
+                # Stable sort: cheap, selective terms first so SQLite can stop early
+                children = sorted(children, key=lambda child: child[1]._rank())
             parts = []
-            for _join_type, child in self._children:
-                child_sql, child_params = child.to_sql(dialect, param_offset + len(params))
+            for _join_type, child in children:
+                child_sql, child_params = child._compiled(dialect, param_offset + len(params))
                 if child_sql:
                     parts.append(child_sql)
                     params.extend(child_params)
@@ -88,14 +119,12 @@ class Q:
             if not parts:
                 return "", []
 
-            # Determine connector
-            connector = " OR " if self._children[0][0] == "OR" else " AND "
             sql = f"({connector.join(parts)})"
 
         elif self._filters:
-            # Simple filter expression
+            # Simple filter expression (implicitly AND-ed, ordered like children)
             filter_parts = []
-            for col, op, value in self._filters:
+            for col, op, value in sorted(self._filters, key=lambda f: _predicate_rank(f[0], f[1])):
                 sql_part, filter_params = _build_filter_sql(col, op, value, dialect, param_offset + len(params))
                 filter_parts.append(sql_part)
                 params.extend(filter_params)
@@ -111,8 +140,14 @@ class Q:
 
         return sql, params
 
+    def _rank(self) -> int:
+        """Evaluation-order rank of this Q as one term of an AND."""
+        if self._children or self._negated or not self._filters:
+            return _LAST_PREDICATE_RANK
+        return max(_predicate_rank(col, op) for col, op, _value in self._filters)
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class JoinInfo:
     """Information about a JOIN clause for eager loading."""
 
@@ -124,6 +159,141 @@ class JoinInfo:
     alias: str  # Table alias for the joined table
 
 
+# Column alias carrying the owning parent's id in M2M eager-load rows
+_M2M_PARENT_ALIAS = "_m2m_parent_id"
+
+# Generated row hydrators, keyed by
+# (model, ((rel_name, target_model, alias), ...), result column names)
+_join_hydrator_cache: dict[tuple[Any, ...], Callable[[list[tuple[Any, ...]]], list[Any]]] = {}
+
+
+def _instance_lines(
+    var: str, model: type, items: str, index: int, namespace: dict[str, Any], indent: str
+) -> list[str]:
+    """Source lines that build one ``model`` instance from a dict literal's items.
+
+    Models without JSON columns need no value conversion, so the instance dict
+    is filled inline (what _from_row_fast does, minus the call and key check).
+    """
+    if model.__json_columns__:
+        namespace[f"_from_row_{index}"] = model._from_row_fast
+        return [f"{indent}{var} = _from_row_{index}({{{items}}})"]
+    namespace[f"_model_{index}"] = model
+    return [
+        f"{indent}{var} = _new(_model_{index})",
+        f"{indent}{var}.__dict__.update("
+        f"{{'_loaded_relationships': {{}}, '_session': None, {items}}})",
+    ]
+
+
+def _compile_join_hydrator(
+    model: type, join_infos: list[JoinInfo], columns: tuple[str, ...]
+) -> Callable[[list[tuple[Any, ...]]], list[Any]]:
+    """Get (or generate) a specialized hydrator for a model + JOIN shape.
+
+    The generated function reads tuple rows by inlined column position, so
+    hydrating a row is straight-line dict construction with no per-row key
+    lookups. Joined targets are deduplicated by primary key within a result:
+    a parent repeated across many rows shares one instance.
+    """
+    key = (model, tuple((j.rel_name, j.target_model, j.alias) for j in join_infos), columns)
+    hydrator = _join_hydrator_cache.get(key)
+    if hydrator is not None:
+        return hydrator
+
+    position = {name: i for i, name in enumerate(columns)}
+    namespace: dict[str, Any] = {"_new": object.__new__}
+    # Columns missing from the result are left unset, as with _from_row_fast
+    main_items = ", ".join(
+        f"{c!r}: row[{position[c]}]" for c in model.__column_tuple__ if c in position
+    )
+    prelude = [
+        "def _hydrate(rows):",
+        "    out = []",
+        "    append = out.append",
+    ]
+    lines = [
+        "    for row in rows:",
+        *_instance_lines("inst", model, main_items, 0, namespace, "        "),
+    ]
+    if join_infos:
+        # Joined relationships are scalar (never M2M collections), so the
+        # generated code can fill the fresh instance's cache directly
+        lines.append("        loaded = inst._loaded_relationships")
+    for i, join_info in enumerate(join_infos, start=1):
+        target_model = join_info.target_model
+        target_positions = {
+            c: position[f"{join_info.alias}_{c}"]
+            for c in target_model.__column_tuple__
+            if f"{join_info.alias}_{c}" in position
+        }
+        items = ", ".join(f"{c!r}: row[{i}]" for c, i in target_positions.items())
+        rel_name = repr(join_info.rel_name)
+        target_pk = target_model.__primary_key__
+        if target_pk not in target_positions:
+            # Without a primary key every column decides whether the LEFT JOIN hit
+            has_data = " or ".join(
+                f"row[{i}] is not None" for i in target_positions.values()
+            ) or "False"
+            lines += [
+                f"        if {has_data}:",
+                *_instance_lines("target", target_model, items, i, namespace, " " * 12),
+                f"            loaded[{rel_name}] = target",
+                "        else:",
+                f"            loaded[{rel_name}] = None",
+            ]
+            continue
+        # A LEFT JOIN miss leaves the target's primary key NULL; a hit reuses
+        # the instance already built for that key
+        prelude.append(f"    seen_{i} = {{}}")
+        lines += [
+            f"        pk = row[{target_positions[target_pk]}]",
+            "        if pk is None:",
+            f"            loaded[{rel_name}] = None",
+            "        else:",
+            f"            target = seen_{i}.get(pk)",
+            "            if target is None:",
+            *_instance_lines("target", target_model, items, i, namespace, " " * 16),
+            f"                seen_{i}[pk] = target",
+            f"            loaded[{rel_name}] = target",
+        ]
+    lines += [
+        "        append(inst)",
+        "    return out",
+    ]
+
+    source = "\n".join(prelude + lines)
+    exec(compile(source, f"<ormkit hydrator {model.__name__}>", "exec"), namespace)
+    hydrator = namespace["_hydrate"]
+    _join_hydrator_cache[key] = hydrator
+    return hydrator
+
+
+# Operator suffixes recognised by Django-style filter keys (field__op=value)
+_FILTER_OPERATORS = frozenset({
+    "gt",
+    "gte",
+    "lt",
+    "lte",
+    "ne",
+    "like",
+    "ilike",
+    "in",
+    "notin",
+    "isnull",
+    "isnotnull",
+    "contains",  # LIKE %value% (or JSON contains for JSON paths)
+    "icontains",
+    "startswith",
+    "istartswith",
+    "endswith",
+    "iendswith",
+    # JSON-specific operators
+    "has_key",
+    "json_contains",  # PostgreSQL @> operator
+})
+
+
 def _parse_filter_key(key: str) -> tuple[str, str]:
     """Parse Django-style filter key into column and operator.
 
@@ -132,35 +302,136 @@ def _parse_filter_key(key: str) -> tuple[str, str]:
     - JSON path operators: metadata__key, metadata__key__subkey
     - JSON special operators: metadata__has_key, metadata__contains
     """
-    operators = {
-        "gt": ">",
-        "gte": ">=",
-        "lt": "<",
-        "lte": "<=",
-        "ne": "!=",
-        "like": "LIKE",
-        "ilike": "ILIKE",
-        "in": "IN",
-        "notin": "NOT IN",
-        "isnull": "IS NULL",
-        "isnotnull": "IS NOT NULL",
-        "contains": "LIKE",  # Will add % wildcards (or JSON contains for JSON fields)
-        "icontains": "ILIKE",  # Will add % wildcards
-        "startswith": "LIKE",
-        "istartswith": "ILIKE",
-        "endswith": "LIKE",
-        "iendswith": "ILIKE",
-        # JSON-specific operators
-        "has_key": "JSON_HAS_KEY",
-        "json_contains": "JSON_CONTAINS",  # PostgreSQL @> operator
-    }
-
-    if "__" in key:
-        parts = key.rsplit("__", 1)
-        if len(parts) == 2 and parts[1] in operators:
-            return parts[0], parts[1]  # Return the operator NAME, not SQL
-
-    return key, "eq"
+    parsed = _filter_key_cache.get(key)
+    if parsed is None:
+        col, sep, op = key.rpartition("__")
+        if sep and op in _FILTER_OPERATORS:
+            parsed = (col, op)  # The operator NAME, not SQL
+        else:
+            parsed = (key, "eq")
+        _filter_key_cache[key] = parsed
+    return parsed
+
+
+# Aggregate spec suffixes accepted by Query.aggregate(): "age__avg" -> AVG(age)
+_AGGREGATE_FUNCTIONS = {"count": "COUNT", "sum": "SUM", "avg": "AVG", "min": "MIN", "max": "MAX"}
+
+# Parsed filter keys: "name__like" -> ("name", "like")
+_filter_key_cache: dict[str, tuple[str, str]] = {}
+
+# Single-placeholder comparison operators: op -> (postgresql SQL, sqlite SQL, value format).
+# SQLite's LIKE ignores ASCII case and cannot use a BINARY index, so the
+# case-sensitive pattern operators use GLOB there (the format's % becomes *)
+_SIMPLE_FILTER_OPS: dict[str, tuple[str, str, str | None]] = {
+    "eq": ("=", "=", None),
+    "gt": (">", ">", None),
+    "gte": (">=", ">=", None),
+    "lt": ("<", "<", None),
+    "lte": ("<=", "<=", None),
+    "ne": ("!=", "!=", None),
+    "like": ("LIKE", "LIKE", None),
+    "ilike": ("ILIKE", "LIKE", None),
+    "contains": ("LIKE", "GLOB", "%{}%"),
+    "icontains": ("ILIKE", "LIKE", "%{}%"),
+    "startswith": ("LIKE", "GLOB", "{}%"),
+    "istartswith": ("ILIKE", "LIKE", "{}%"),
+    "endswith": ("LIKE", "GLOB", "%{}"),
+    "iendswith": ("ILIKE", "LIKE", "%{}"),
+}
+
+# Evaluation order for AND-ed Q predicates: equality and NULL checks first, then
+# ranges, then pattern matches; JSON paths and other operators go last
+_PREDICATE_RANK: dict[str, int] = {
+    "eq": 0,
+    "in": 0,
+    "isnull": 0,
+    "gt": 1,
+    "gte": 1,
+    "lt": 1,
+    "lte": 1,
+    "like": 2,
+    "ilike": 2,
+    "contains": 2,
+    "icontains": 2,
+    "startswith": 2,
+    "istartswith": 2,
+    "endswith": 2,
+    "iendswith": 2,
+}
+_LAST_PREDICATE_RANK = 3
+
+
+def _predicate_rank(col: str, op: str) -> int:
+    """Rank a filter for AND ordering; lower ranks are emitted first."""
+    if "__" in col:
+        return _LAST_PREDICATE_RANK
+    return _PREDICATE_RANK.get(op, _LAST_PREDICATE_RANK)
+
+
+# GLOB metacharacters, each wrapped in a one-character class to match literally
+_GLOB_ESCAPES = str.maketrans({"*": "[*]", "?": "[?]", "[": "[[]"})
+
+
+def _simple_filter_op(op: str, dialect: str) -> tuple[str, Callable[[Any], Any] | None] | None:
+    """Return the SQL operator and value binder for a single-placeholder comparison."""
+    spec = _SIMPLE_FILTER_OPS.get(op)
+    if spec is None:
+        return None
+    pg_sql, sqlite_sql, value_format = spec
+    if dialect == "postgresql":
+        return pg_sql, value_format.format if value_format else None
+    if sqlite_sql == "GLOB" and value_format:
+        glob_format = value_format.replace("%", "*")
+        return sqlite_sql, lambda value: glob_format.format(str(value).translate(_GLOB_ESCAPES))
+    return sqlite_sql, value_format.format if value_format else None
+
+
+# Compiled "col OP " prefix and value binder, keyed by (col, op, dialect)
+_filter_sql_cache: dict[tuple[str, str, str], tuple[str, Callable[[Any], Any] | None]] = {}
+
+
+def _compile_simple_filter(
+    col: str, op: str, dialect: str
+) -> tuple[str, Callable[[Any], Any] | None] | None:
+    """Return the cached SQL prefix and value binder for a plain column comparison.
+
+    Returns None for filters whose SQL depends on more than one placeholder or
+    on the value itself (IN lists, NULL checks, JSON paths and operators).
+    """
+    key = (col, op, dialect)
+    compiled = _filter_sql_cache.get(key)
+    if compiled is None:
+        if "__" in col:
+            return None
+        simple = _simple_filter_op(op, dialect)
+        if simple is None:
+            return None
+        op_sql, bind = simple
+        compiled = (f"{col} {op_sql} ", bind)
+        _filter_sql_cache[key] = compiled
+    return compiled
+
+
+def _filter_shape(
+    filters: Sequence[tuple[str, str, Any]], dialect: str
+) -> tuple[tuple[tuple[str, str], ...], list[Any]] | None:
+    """Return the ``(col, op)`` pairs and bound params for plain comparisons.
+
+    Returns None if any filter renders value-dependent SQL (see
+    _compile_simple_filter), or compares to None (rendered as IS NULL).
+    """
+    conditions = []
+    params = []
+    for col, op, value in filters:
+        if value is None and op == "eq":
+            return None  # Renders as IS NULL
+        compiled = _compile_simple_filter(col, op, dialect)
+        if compiled is None:
+            return None
+        bind = compiled[1]
+        conditions.append((col, op))
+        params.append(value if bind is None else bind(value))
+    return tuple(conditions), params
 
 
 def _build_json_path_sql(col: str, path: list[str], dialect: str) -> str:
@@ -192,6 +463,15 @@ def _build_filter_sql(col: str, op: str, value: Any, dialect: str, param_offset:
     - JSON operators: metadata__has_key="key", metadata__json_contains={"key": "value"}
     """
 
+    if value is not None or op != "eq":
+        compiled = _compile_simple_filter(col, op, dialect)
+        if compiled is not None:
+            prefix, bind = compiled
+            param = value if bind is None else bind(value)
+            if dialect == "postgresql":
+                return f"{prefix}${param_offset + 1}", [param]
+            return prefix + "?", [param]
+
     def placeholder(offset: int = 0) -> str:
         return f"${param_offset + offset + 1}" if dialect == "postgresql" else "?"
 
@@ -215,14 +495,12 @@ def _build_filter_sql(col: str, op: str, value: Any, dialect: str, param_offset:
         if dialect == "postgresql":
             # PostgreSQL @> containment operator
             # Value should be a dict that we serialize to JSON
-            import json
-            return f"{col} @> {placeholder()}::jsonb", [json.dumps(value)]
+            return f"{col} @> {placeholder()}::jsonb", [_json_dumps(value)]
         else:
             # SQLite doesn't have a direct containment operator
             # We'd need to check each key-value pair individually
             # For now, return a best-effort check
-            import json
-            return f"json({col}) = json({placeholder()})", [json.dumps(value)]
+            return f"json({col}) = json({placeholder()})", [_json_dumps(value)]
 
     # If we have a JSON path, modify the column reference
     col_ref = _build_json_path_sql(col, json_path, dialect) if json_path else col
@@ -264,40 +542,137 @@ def _build_filter_sql(col: str, op: str, value: Any, dialect: str, param_offset:
                     f"EXISTS (SELECT 1 FROM json_each({col}, '{json_path_str}') WHERE value = {placeholder()})",
                     [value]
                 )
+    # Comparisons and pattern matches on a JSON path (plain columns take the
+    # cached path above); unknown operators fall back to equality
+    op_sql, bind = _simple_filter_op(op, dialect) or ("=", None)
+    return f"{col_ref} {op_sql} {placeholder()}", [value if bind is None else bind(value)]
+
+
+def _relationship_order_terms(rel_info: RelationshipInfo, alias: str | None = None) -> list[str]:
+    """Return ORDER BY terms for a relationship's order_by, qualified with alias."""
+    order_by = rel_info.order_by
+    if not order_by:
+        return []
+    prefix = f"{alias}." if alias else ""
+    columns = [order_by] if isinstance(order_by, str) else order_by
+    return [
+        f"{prefix}{col[1:]} DESC" if col.startswith("-") else f"{prefix}{col} ASC"
+        for col in columns
+    ]
+
+
+# count_related() SQL prefix and parent column, keyed by (model, relationship name)
+_count_related_sql_cache: dict[tuple[type, str], tuple[str, str]] = {}
+
+# session.get() primary-key SELECT, keyed by (model, dialect, include_deleted)
+_get_sql_cache: dict[tuple[type, str, bool], str] = {}
+
+# Query SELECT SQL up to ORDER BY, keyed by query shape (see Query._select_shape)
+_select_sql_cache: dict[tuple[Any, ...], str] = {}
+
+# WHERE clauses for aggregates, EXISTS and DELETE, keyed by
+# (model, dialect, include_deleted, only_deleted, ((col, op), ...))
+_where_sql_cache: dict[tuple[Any, ...], str] = {}
+
+# Bulk UPDATE statements, keyed by (table, dialect, SET columns, ((col, op), ...))
+_update_sql_cache: dict[tuple[Any, ...], str] = {}
+
+# Placeholder lists for padded IN clauses, keyed by (dialect, count, param_offset)
+_in_placeholder_cache: dict[tuple[str, int, int], str] = {}
+
+# Bound-parameter limits (SQLITE_MAX_VARIABLE_NUMBER since 3.32; the PG wire protocol)
+_MAX_BIND_PARAMS = {"sqlite": 32766, "postgresql": 65535}
+
+
+# Bounded: a full batch can be hundreds of KB of placeholders, and every
+# distinct row count would otherwise keep its own statement for good
+@lru_cache(maxsize=256)
+def _compile_insert_sql(
+    table: str, columns: tuple[str, ...], pk_col: str | None, dialect: str, row_count: int
+) -> str:
+    """Build a multi-row flush INSERT (with RETURNING for the primary key)."""
+    value_groups = []
+    for row in range(row_count):
+        if dialect == "postgresql":
+            start = row * len(columns) + 1
+            placeholders = ", ".join(f"${start + i}" for i in range(len(columns)))
+        else:
+            placeholders = ", ".join("?" * len(columns))
+        value_groups.append(f"({placeholders})")
+
+    sql = f"INSERT INTO {table} ({', '.join(columns)}) VALUES {', '.join(value_groups)}"
+    if pk_col:
+        # Use RETURNING to get generated IDs (works in PostgreSQL and SQLite 3.35+)
+        sql += f" RETURNING {pk_col}"
+    return sql
+
+
+def _build_id_list_sql(
+    col: str,
+    ids: list[Any],
+    dialect: str,
+    python_type: type | None,
+    param_offset: int = 0,
+) -> tuple[str, list[Any]]:
+    """Build a `col IN (...)` predicate whose SQL text doesn't depend on len(ids).
+
+    Integer keys (and string keys on SQLite) are bound as a single JSON array
+    parameter that the database expands (jsonb_array_elements_text / json_each),
+    so the statement text stays constant and hits the driver's prepared-statement
+    cache. Other keys fall back to placeholders, padded to a power-of-two count so
+    the text only changes when the batch size crosses one. On PostgreSQL that
+    includes string keys: a ``str`` attribute may be stored in a uuid or other
+    non-text column, which only bound placeholders compare against.
+    """
+    if python_type is int and dialect == "postgresql":
+        return (
+            f"{col} IN (SELECT jsonb_array_elements_text(${param_offset + 1}::jsonb)::bigint)",
+            [ids],
+        )
+    if (python_type is int or python_type is str) and dialect != "postgresql":
+        return f"{col} IN (SELECT value FROM json_each(?))", [ids]
+
+    # Round the placeholder count up to a power of two (repeating the last id,
+    # which IN ignores) so batches of similar size share one statement text,
+    # unless the padding alone would push past the driver's parameter limit.
+    # Padding keeps the keys' own type, so PostgreSQL never sees a NULL of
+    # another type against a uuid, date or numeric column
+    n = 1 << (len(ids) - 1).bit_length() if ids else 1
+    if param_offset + n > _MAX_BIND_PARAMS.get(dialect, n):
+        n = len(ids)
+    cache_key = (dialect, n, param_offset)
+    placeholders = _in_placeholder_cache.get(cache_key)
+    if placeholders is None:
+        if dialect == "postgresql":
+            placeholders = ", ".join(f"${param_offset + i + 1}" for i in range(n))
         else:
-            # Regular string contains
-            return f"{col_ref} LIKE {placeholder()}", [f"%{value}%"]
+            placeholders = ", ".join("?" * n)
+        _in_placeholder_cache[cache_key] = placeholders
+    pad = ids[-1] if ids else None
+    return f"{col} IN ({placeholders})", [*ids, *([pad] * (n - len(ids)))]
 
-    elif op == "icontains":
-        op_sql = "ILIKE" if dialect == "postgresql" else "LIKE"
-        return f"{col_ref} {op_sql} {placeholder()}", [f"%{value}%"]
 
-    elif op == "startswith":
-        return f"{col_ref} LIKE {placeholder()}", [f"{value}%"]
+@dataclass(slots=True)
+class _ActiveTransaction:
+    """A session's open database transaction, as seen by one task."""
 
-    elif op == "istartswith":
-        op_sql = "ILIKE" if dialect == "postgresql" else "LIKE"
-        return f"{col_ref} {op_sql} {placeholder()}", [f"{value}%"]
+    engine: ConnectionPool  # The pool the transaction was taken from
+    db_tx: Any  # The driver transaction every statement is routed through
+    # greedyload() results, keyed by SQL; cleared on every write
+    prefetch_cache: dict[str, QueryResult] = field(default_factory=dict)
 
-    elif op == "endswith":
-        return f"{col_ref} LIKE {placeholder()}", [f"%{value}"]
 
-    elif op == "iendswith":
-        op_sql = "ILIKE" if dialect == "postgresql" else "LIKE"
-        return f"{col_ref} {op_sql} {placeholder()}", [f"%{value}"]
+# Transactions opened by session.begin() on the current task, keyed by session.
+# Task-local, so other tasks sharing a session keep using its pool. The dict is
+# replaced, never mutated, so tasks spawned inside a block don't leak changes out
+_active_transactions: ContextVar[Mapping[AsyncSession, _ActiveTransaction]] = ContextVar(
+    "ormkit_active_transactions", default=MappingProxyType({})
+)
 
-    else:
-        # Standard comparison operators
-        op_sql = {
-            "gt": ">",
-            "gte": ">=",
-            "lt": "<",
-            "lte": "<=",
-            "ne": "!=",
-            "like": "LIKE",
-            "ilike": "ILIKE" if dialect == "postgresql" else "LIKE",
-        }.get(op, "=")
-        return f"{col_ref} {op_sql} {placeholder()}", [value]
+
+def _is_memory_sqlite(pool: ConnectionPool) -> bool:
+    """Whether the pool is an in-memory SQLite database (a single shared connection)."""
+    return pool.is_sqlite() and pool.url in ("sqlite::memory:", "sqlite://:memory:")
 
 
 class AsyncSession:
@@ -322,15 +697,53 @@ class AsyncSession:
     """
 
     def __init__(self, pool: ConnectionPool, *, autoflush: bool = True) -> None:
-        self._pool = pool
-        self._pending_new: list[Base] = []
+        self._engine = pool
+        # An in-memory pool's only connection is held for the whole of a begin()
+        # block, so other sessions on it can't run until that block ends
+        self._single_connection = _is_memory_sqlite(pool)
+        # Pending objects are bucketed by model class at add-time so flushes
+        # don't need a separate grouping pass
+        self._pending_new_by_class: defaultdict[type[Base], list[Base]] = defaultdict(list)
         self._pending_dirty: list[Base] = []
-        self._pending_delete: list[Base] = []
+        self._pending_delete_by_class: defaultdict[type[Base], list[Base]] = defaultdict(list)
         self._identity_map: dict[tuple[type, Any], Base] = {}
+        # Eager loads currently awaiting the database, so concurrent identical
+        # loads share one round-trip instead of each querying
+        self._inflight_loads: dict[tuple[Any, ...], asyncio.Future[QueryResult]] = {}
         self._autoflush = autoflush
         self._dialect = "postgresql" if pool.is_postgres() else "sqlite"
         self._sqlite_returning_supported: bool | None = None
 
+    @property
+    def _pool(self) -> ConnectionPool:
+        """The open transaction inside this task's begin() block, else the pool."""
+        active = _active_transactions.get()
+        state = active.get(self)
+        if state is not None:
+            return state.db_tx
+        if active and self._single_connection:
+            for other in active.values():
+                if other.engine is self._engine:
+                    # Waiting for the connection would never return: the
+                    # transaction holding it is suspended on this very task
+                    raise RuntimeError(
+                        "The in-memory SQLite pool's only connection is held by a "
+                        "transaction on this task; run this statement through the "
+                        "session that opened it, or after its begin() block"
+                    )
+        return self._engine
+
+    @property
+    def _in_transaction(self) -> bool:
+        """True inside a begin() block on the current task."""
+        return self in _active_transactions.get()
+
+    @property
+    def _prefetch_cache(self) -> dict[str, QueryResult]:
+        """greedyload() results for this task's transaction (a throwaway dict outside one)."""
+        state = _active_transactions.get().get(self)
+        return state.prefetch_cache if state is not None else {}
+
     async def __aenter__(self) -> AsyncSession:
         return self
 
@@ -349,6 +762,12 @@ class AsyncSession:
     async def begin(self) -> AsyncIterator[Transaction]:
         """Begin a transaction that auto-commits on success.
 
+        Everything the session executes inside the block runs in a single
+        database transaction (``BEGIN IMMEDIATE`` on SQLite, so the write lock
+        is taken up front) and is committed once on exit. Nested calls join
+        the enclosing transaction. The transaction belongs to the calling task;
+        other tasks sharing the session keep running on the pool.
+
         Example:
             >>> async with session.begin() as tx:
             ...     tx.add(User(name="Alice"))
@@ -356,12 +775,24 @@ class AsyncSession:
             ...     # commits automatically on exit
         """
         tx = Transaction(self)
-        try:
-            yield tx
-            await self.commit()
-        except Exception:
-            await self.rollback()
-            raise
+        active = _active_transactions.get()
+        if self in active:
+            # Nested: pending changes flush into the enclosing transaction
+            async with self._commit_on_exit():
+                yield tx
+            return
+
+        async with await self._pool.transaction() as db_tx:
+            # Route every statement the session issues on this task (queries,
+            # inserts, M2M add/remove) through the one transaction
+            token = _active_transactions.set(
+                {**active, self: _ActiveTransaction(self._engine, db_tx)}
+            )
+            try:
+                async with self._commit_on_exit():
+                    yield tx
+            finally:
+                _active_transactions.reset(token)
 
     @asynccontextmanager
     async def transaction(self) -> AsyncIterator[AsyncSession]:
@@ -372,8 +803,14 @@ class AsyncSession:
             ...     session.add(user)
             ...     # commits automatically
         """
-        try:
+        async with self.begin():
             yield self
+
+    @asynccontextmanager
+    async def _commit_on_exit(self) -> AsyncIterator[None]:
+        """Flush pending changes if the block succeeds, discard them if it raises."""
+        try:
+            yield
             await self.commit()
         except Exception:
             await self.rollback()
@@ -411,46 +848,65 @@ class AsyncSession:
         return instances
 
     async def get(
-        self, model: type[T], id: Any, *, include_deleted: bool = False
+        self,
+        model: type[T],
+        id: Any,
+        *,
+        include_deleted: bool = False,
+        load: LoadOption | Sequence[LoadOption] | None = None,
     ) -> T | None:
         """Get a model by primary key.
 
+        Instances already in the identity map are returned without a query.
+        Otherwise a cached per-model ``SELECT ... WHERE pk = ?`` is used instead
+        of building a full Query.
+
         For models with SoftDeleteMixin, soft-deleted records are excluded
         by default. Use include_deleted=True to include them.
 
+        ``load`` takes one or more loader options (e.g. ``selectinload("roles")``);
+        relationships that are already loaded on the instance are not reloaded.
+
         Example:
             >>> user = await session.get(User, 1)
+            >>> user = await session.get(User, 1, load=selectinload("roles"))
             >>> # Include soft-deleted
             >>> article = await session.get(Article, 1, include_deleted=True)
         """
         # Check identity map first
         key = (model, id)
-        if key in self._identity_map:
-            instance = self._identity_map[key]
+        instance = self._identity_map.get(key)
+        if instance is not None:
             # Check soft delete status
             if (
                 not include_deleted
-                and getattr(model, "__soft_delete__", False)
+                and model.__soft_delete__
                 and getattr(instance, "deleted_at", None) is not None
             ):
                 return None
-            return instance  # type: ignore
-
-        pk = model.__primary_key__
-        if pk is None:
-            raise ValueError(f"{model.__name__} has no primary key")
-
-        # Use Query to respect soft delete filtering
-        query = self.query(model).filter(**{pk: id})
-        if include_deleted:
-            query = query.with_deleted()
-
-        instance = await query.first()
-
-        if instance is not None:
+        else:
+            sql = self._get_sql(model, include_deleted)
+            result = await self._pool.execute(sql, [id])
+            instance = ScalarResult(result, model).first()
+            if instance is None:
+                return None
             self._identity_map[key] = instance
 
-        return instance
+        if load is not None:
+            options = [load] if not isinstance(load, Sequence) else list(load)
+            loaded = instance._loaded_relationships
+            missing = [
+                opt
+                for opt in options
+                if opt.attr_name not in loaded
+                or getattr(loaded[opt.attr_name], "_partial", False)
+            ]
+            if missing:
+                await self.query(model).options(*missing)._apply_load_options(
+                    [instance], join_infos=[]
+                )
+
+        return instance  # type: ignore
 
     async def get_or_raise(self, model: type[T], id: Any) -> T:
         """Get a model by primary key, raise if not found.
@@ -478,6 +934,7 @@ class AsyncSession:
         Example:
             >>> user = await session.update(user, name="Bob", age=30)
         """
+        self._prefetch_cache.clear()
         for key, value in values.items():
             setattr(instance, key, value)
 
@@ -486,24 +943,21 @@ class AsyncSession:
         if pk_col is None:
             raise ValueError(f"Cannot update {cls.__name__}: no primary key")
 
-        pk_value = getattr(instance, pk_col)
         table = cls.__tablename__
+        params = [*values.values(), getattr(instance, pk_col)]
 
-        set_parts = []
-        params: list[Any] = []
-        for key, value in values.items():
+        # Same text (and cache entry) as a bulk update filtered on the primary key
+        cache_key = (table, self._dialect, tuple(values), ((pk_col, "eq"),))
+        sql = _update_sql_cache.get(cache_key)
+        if sql is None:
             if self._dialect == "postgresql":
-                set_parts.append(f"{key} = ${len(params) + 1}")
+                set_parts = [f"{key} = ${i}" for i, key in enumerate(values, 1)]
+                where_sql = f"{pk_col} = ${len(params)}"
             else:
-                set_parts.append(f"{key} = ?")
-            params.append(value)
-
-        if self._dialect == "postgresql":
-            params.append(pk_value)
-            sql = f"UPDATE {table} SET {', '.join(set_parts)} WHERE {pk_col} = ${len(params)}"
-        else:
-            params.append(pk_value)
-            sql = f"UPDATE {table} SET {', '.join(set_parts)} WHERE {pk_col} = ?"
+                set_parts = [f"{key} = ?" for key in values]
+                where_sql = f"{pk_col} = ?"
+            sql = f"UPDATE {table} SET {', '.join(set_parts)} WHERE {where_sql}"
+            _update_sql_cache[cache_key] = sql
 
         await self._pool.execute_statement_py(sql, params)
         return instance
@@ -528,8 +982,33 @@ class AsyncSession:
             ...     Q(last_login__lt=cutoff_date) | Q(deleted=True)
             ... )
         """
+        parsed = [(*_parse_filter_key(key), value) for key, value in filters.items()]
+        return await self._bulk_update_parsed(model, values, conditions, parsed)
+
+    async def _bulk_update_parsed(
+        self,
+        model: type[T],
+        values: dict[str, Any],
+        conditions: tuple[Q, ...] | list[Q],
+        filters: list[tuple[str, str, Any]],
+    ) -> int:
+        """Bulk update using filters already parsed into (column, operator, value)."""
+        self._prefetch_cache.clear()
         table = model.__tablename__
 
+        # Plain column filters render the same UPDATE for any values, so its text
+        # is cached by shape just like SELECTs (see Query._select_shape)
+        cache_key = None
+        shape = None if conditions else _filter_shape(filters, self._dialect)
+        if shape is not None:
+            filter_shape, filter_params = shape
+            cache_key = (table, self._dialect, tuple(values), filter_shape)
+            cached_sql = _update_sql_cache.get(cache_key)
+            if cached_sql is not None:
+                return await self._pool.execute_statement_py(
+                    cached_sql, [*values.values(), *filter_params]
+                )
+
         set_parts = []
         params: list[Any] = []
         for key, value in values.items():
@@ -546,20 +1025,21 @@ class AsyncSession:
 
         # Handle Q objects
         for q in conditions:
-            q_sql, q_params = q.to_sql(self._dialect, len(params))
+            q_sql, q_params = q._compiled(self._dialect, len(params))
             if q_sql:
                 where_parts.append(q_sql)
                 params.extend(q_params)
 
         # Handle keyword filters
-        for key, value in filters.items():
-            col, op = _parse_filter_key(key)
+        for col, op, value in filters:
             filter_sql, filter_params = _build_filter_sql(col, op, value, self._dialect, len(params))
             where_parts.append(filter_sql)
             params.extend(filter_params)
 
         if where_parts:
             sql += " WHERE " + " AND ".join(where_parts)
+        if cache_key is not None:
+            _update_sql_cache[cache_key] = sql
 
         return await self._pool.execute_statement_py(sql, params)
 
@@ -599,11 +1079,8 @@ class AsyncSession:
                 "Add SoftDeleteMixin to enable soft delete."
             )
 
-        from datetime import datetime
-
-        deleted_at = datetime.now(UTC)
-        instance.deleted_at = deleted_at  # type: ignore[attr-defined]
-        await self.update(instance, deleted_at=deleted_at)
+        # update() assigns the attribute and reuses the cached UPDATE statement
+        await self.update(instance, deleted_at=datetime.now(UTC))
         return instance
 
     async def restore(self, instance: T) -> T:
@@ -619,7 +1096,6 @@ class AsyncSession:
                 "Add SoftDeleteMixin to enable soft delete."
             )
 
-        instance.deleted_at = None  # type: ignore[attr-defined]
         await self.update(instance, deleted_at=None)
         return instance
 
@@ -664,29 +1140,13 @@ class AsyncSession:
             ...     update_fields=["name"]
             ... )
         """
+        self._prefetch_cache.clear()
         cls = type(instance)
         table = cls.__tablename__
         pk_col = cls.__primary_key__
 
         # Get columns to insert (exclude autoincrement PK)
-        insert_cols = []
-        for col_name, col_info in cls.__columns__.items():
-            if col_info.primary_key and col_info.autoincrement:
-                continue
-            insert_cols.append(col_name)
-
-        # Build values dict - get instance attributes, skipping ColumnInfo class attrs
-        from ormkit.fields import ColumnInfo
-
-        values: dict[str, Any] = {}
-        for col in insert_cols:
-            try:
-                val = object.__getattribute__(instance, col)
-                # Skip if it's still the ColumnInfo class attribute
-                if not isinstance(val, ColumnInfo):
-                    values[col] = val
-            except AttributeError:
-                pass
+        insert_cols = cls.__insert_columns__
 
         # Determine update columns
         if do_nothing:
@@ -697,9 +1157,10 @@ class AsyncSession:
             # Update all non-PK columns
             update_cols = [c for c in insert_cols if c != pk_col]
 
-        # Build SQL
-        col_str = ", ".join(values.keys())
-        params = list(values.values())
+        # Build SQL. Every insert column is bound (unset ones as NULL), the same
+        # as upsert_all's batches, so both store identical rows
+        col_str = ", ".join(insert_cols)
+        params = self._upsert_values(instance, insert_cols)
 
         if self._dialect == "postgresql":
             placeholders = ", ".join(f"${i+1}" for i in range(len(params)))
@@ -719,7 +1180,9 @@ class AsyncSession:
             if update_cols:
                 set_parts = [f"{col} = {excluded_prefix}.{col}" for col in update_cols]
             else:
-                set_parts = [f"{col} = {excluded_prefix}.{col}" for col in values if col != pk_col]
+                set_parts = [
+                    f"{col} = {excluded_prefix}.{col}" for col in insert_cols if col != pk_col
+                ]
             sql += f" ON CONFLICT ({conflict_str}) DO UPDATE SET {', '.join(set_parts)}"
 
         row: dict[str, Any] | None = None
@@ -789,17 +1252,16 @@ class AsyncSession:
         """
         if not instances:
             return []
+        if len(instances) == 1:
+            # A lone row takes the single-row path and skips VALUES-list assembly
+            return [await self.upsert(instances[0], conflict_target, update_fields, do_nothing)]
 
         cls = type(instances[0])
         table = cls.__tablename__
         pk_col = cls.__primary_key__
 
         # Get columns to insert (exclude autoincrement PK)
-        insert_cols = [
-            col_name
-            for col_name, col_info in cls.__columns__.items()
-            if not (col_info.primary_key and col_info.autoincrement)
-        ]
+        insert_cols = cls.__insert_columns__
 
         # Determine update columns
         conflict_cols = [conflict_target] if isinstance(conflict_target, str) else conflict_target
@@ -812,8 +1274,8 @@ class AsyncSession:
         else:
             update_cols = [c for c in insert_cols if c != pk_col]
 
-        # Batch size limits
-        max_params = 900 if self._dialect == "sqlite" else 30000
+        # Each statement binds one parameter per column per row
+        max_params = _MAX_BIND_PARAMS.get(self._dialect, 999)
         batch_size = max_params // max(len(insert_cols), 1)
 
         for batch_start in range(0, len(instances), batch_size):
@@ -829,7 +1291,7 @@ class AsyncSession:
         self,
         cls: type,
         instances: list,
-        insert_cols: list[str],
+        insert_cols: tuple[str, ...],
         table: str,
         pk_col: str | None,
         conflict_cols: list[str],
@@ -838,26 +1300,19 @@ class AsyncSession:
         do_nothing: bool,
     ) -> None:
         """Upsert a single batch of instances."""
-        from ormkit.fields import ColumnInfo
+        self._prefetch_cache.clear()
 
         params: list[Any] = []
         value_groups = []
 
         for instance in instances:
             placeholders = []
-            for col in insert_cols:
+            for _col in insert_cols:
                 if self._dialect == "postgresql":
-                    placeholders.append(f"${len(params) + 1}")
+                    placeholders.append(f"${len(params) + len(placeholders) + 1}")
                 else:
                     placeholders.append("?")
-
-                try:
-                    val = object.__getattribute__(instance, col)
-                    if isinstance(val, ColumnInfo):
-                        val = None
-                except AttributeError:
-                    val = None
-                params.append(val)
+            params.extend(self._upsert_values(instance, insert_cols))
             value_groups.append(f"({', '.join(placeholders)})")
 
         col_str = ", ".join(insert_cols)
@@ -880,14 +1335,14 @@ class AsyncSession:
         if pk_col and self._dialect == "postgresql":
             sql += " RETURNING *"
             result = await self._pool.execute(sql, params)
-            rows = list(result.all())
+            rows = result.all()
             used_returning = True
         elif pk_col and not do_nothing and self._dialect == "sqlite":
             supports_returning = await self._sqlite_supports_returning()
             if supports_returning:
                 try:
                     result = await self._pool.execute(f"{sql} RETURNING *", params)
-                    rows = list(result.all())
+                    rows = result.all()
                     used_returning = True
                 except Exception as exc:
                     if self._is_sqlite_returning_unsupported_error(exc):
@@ -949,28 +1404,30 @@ class AsyncSession:
 
     def add(self, instance: Base) -> None:
         """Add a model instance to be inserted on commit."""
-        self._pending_new.append(instance)
+        self._pending_new_by_class[type(instance)].append(instance)
 
     def add_all(self, instances: list[Base]) -> None:
         """Add multiple model instances to be inserted on commit."""
-        self._pending_new.extend(instances)
+        pending = self._pending_new_by_class
+        for instance in instances:
+            pending[type(instance)].append(instance)
 
     def delete(self, instance: Base) -> None:
         """Mark a model instance for deletion on commit."""
-        self._pending_delete.append(instance)
+        self._pending_delete_by_class[type(instance)].append(instance)
 
     async def commit(self) -> None:
         """Commit all pending changes to the database."""
-        if self._pending_new:
+        if self._pending_new_by_class:
             await self._flush_inserts()
-        if self._pending_delete:
+        if self._pending_delete_by_class:
             await self._flush_deletes()
 
     async def rollback(self) -> None:
         """Discard all pending changes."""
-        self._pending_new.clear()
+        self._pending_new_by_class.clear()
         self._pending_dirty.clear()
-        self._pending_delete.clear()
+        self._pending_delete_by_class.clear()
 
     async def flush(self) -> None:
         """Flush pending changes without committing (same as commit for now)."""
@@ -983,7 +1440,8 @@ class AsyncSession:
         statement: SelectStatement[T] | InsertStatement[T] | UpdateStatement[T] | DeleteStatement[T],
     ) -> ExecuteResult[T]:
         """Execute a query statement."""
-        if self._autoflush and self._pending_new:
+        self._prefetch_cache.clear()
+        if self._autoflush and self._pending_new_by_class:
             await self._flush_inserts()
 
         sql, params = statement.to_sql(self._dialect)
@@ -992,6 +1450,7 @@ class AsyncSession:
 
     async def execute_raw(self, sql: str, params: list[Any] | None = None) -> QueryResult:
         """Execute raw SQL and return results."""
+        self._prefetch_cache.clear()
         return await self._pool.execute(sql, params or [])
 
     @staticmethod
@@ -1022,14 +1481,27 @@ class AsyncSession:
 
         return self._sqlite_returning_supported
 
+    @staticmethod
+    def _upsert_values(instance: Any, insert_cols: tuple[str, ...]) -> list[Any]:
+        """Bind values for an upsert row, with NULL for columns the instance never set."""
+        values: list[Any] = []
+        for col in insert_cols:
+            try:
+                val = object.__getattribute__(instance, col)
+                # Still the ColumnInfo class attribute: the column was never set
+                if isinstance(val, ColumnInfo):
+                    val = None
+            except AttributeError:
+                val = None
+            values.append(val)
+        return values
+
     @staticmethod
     def _conflict_keys_from_instances(
         instances: list[Any],
         conflict_cols: list[str],
     ) -> list[tuple[Any, ...]]:
         """Extract deduplicated conflict key tuples from model instances."""
-        from ormkit.fields import ColumnInfo
-
         keys: list[tuple[Any, ...]] = []
         seen: set[tuple[Any, ...]] = set()
 
@@ -1076,7 +1548,7 @@ class AsyncSession:
                 placeholders = ", ".join("?" for _ in values)
             sql = f"SELECT * FROM {table} WHERE {col} IN ({placeholders})"
             result = await self._pool.execute(sql, values)
-            return list(result.all())
+            return result.all()
 
         row_placeholders: list[str] = []
         params: list[Any] = []
@@ -1099,23 +1571,86 @@ class AsyncSession:
         where_expr = f"({cols_expr}) IN ({', '.join(row_placeholders)})"
         sql = f"SELECT * FROM {table} WHERE {where_expr}"
         result = await self._pool.execute(sql, params)
-        return list(result.all())
+        return result.all()
+
+    async def _execute_shared(
+        self,
+        sql: str,
+        params: list[Any],
+        params_key: Hashable = (),
+    ) -> QueryResult:
+        """Run a read query, sharing its result with concurrent loads of the same key.
+
+        Loads are shared only when they run on the same connection or transaction
+        with the same SQL text; ``params_key`` stands in for the (unhashable)
+        parameters. Only in-flight queries are shared; once the result arrives
+        the entry is dropped, so later loads always see fresh data. Callers
+        hydrate their own instances from the (immutable) QueryResult.
+        """
+        pool = self._pool
+        # A load outside begin() must not answer one inside it (or vice versa):
+        # each side has to see its own transaction's writes
+        key = (id(pool), sql, params_key)
+        pending = self._inflight_loads.get(key)
+        if pending is not None:
+            return await asyncio.shield(pending)
+
+        future: asyncio.Future[QueryResult] = asyncio.get_running_loop().create_future()
+        self._inflight_loads[key] = future
+        try:
+            result = await pool.execute(sql, params)
+        except BaseException as exc:
+            if isinstance(exc, asyncio.CancelledError):
+                future.cancel()
+            else:
+                future.set_exception(exc)
+                future.exception()  # Mark retrieved; waiters still re-raise it
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._inflight_loads[key]
 
     # ========== Internal Methods ==========
 
+    def _get_sql(self, model: type[Base], include_deleted: bool) -> str:
+        """Return the cached primary-key SELECT used by get()."""
+        cache_key = (model, self._dialect, include_deleted)
+        sql = _get_sql_cache.get(cache_key)
+        if sql is None:
+            pk = model.__primary_key__
+            if pk is None:
+                raise ValueError(f"{model.__name__} has no primary key")
+            placeholder = "$1" if self._dialect == "postgresql" else "?"
+            sql = (
+                f"SELECT {', '.join(model.__columns__)} FROM {model.__tablename__} "
+                f"WHERE {pk} = {placeholder}"
+            )
+            if not include_deleted and model.__soft_delete__:
+                sql += " AND deleted_at IS NULL"
+            sql += " LIMIT 1"
+            _get_sql_cache[cache_key] = sql
+        return sql
+
     async def _flush_inserts(self) -> None:
         """Insert all pending new objects."""
-        by_class: dict[type[Base], list[Base]] = {}
-        for obj in self._pending_new:
-            cls = type(obj)
-            if cls not in by_class:
-                by_class[cls] = []
-            by_class[cls].append(obj)
+        # Take ownership of the pending set before awaiting, so concurrent
+        # insert()/commit() calls on this session each flush only their own objects
+        pending = self._pending_new_by_class
+        self._pending_new_by_class = defaultdict(list)
 
-        for model_cls, instances in by_class.items():
-            await self._batch_insert(model_cls, instances)
-
-        self._pending_new.clear()
+        flushed: list[type[Base]] = []
+        try:
+            for model_cls, instances in pending.items():
+                await self._batch_insert(model_cls, instances)
+                flushed.append(model_cls)
+        except BaseException:
+            # Re-queue what was not written so a retry doesn't lose it
+            for model_cls, instances in pending.items():
+                if model_cls not in flushed:
+                    self._pending_new_by_class[model_cls][:0] = instances
+            raise
 
     async def _batch_insert(self, model_cls: type[Base], instances: list[Base]) -> None:
         """Perform batch insert for a single model class."""
@@ -1123,17 +1658,12 @@ class AsyncSession:
             return
 
         table = model_cls.__tablename__
-        columns = [
-            col_name
-            for col_name, col_info in model_cls.__columns__.items()
-            if not (col_info.primary_key and col_info.autoincrement)
-        ]
-
+        columns = model_cls.__insert_columns__
         if not columns:
             return
 
-        # SQLite has a limit of ~999 variables, batch accordingly
-        max_params = 900 if self._dialect == "sqlite" else 30000
+        # One multi-row INSERT per batch, as large as the bound-parameter limit allows
+        max_params = _MAX_BIND_PARAMS.get(self._dialect, 999)
         batch_size = max_params // len(columns)
 
         for batch_start in range(0, len(instances), batch_size):
@@ -1144,31 +1674,21 @@ class AsyncSession:
         self,
         model_cls: type[Base],
         instances: list[Base],
-        columns: list[str],
+        columns: tuple[str, ...],
         table: str,
     ) -> None:
-        """Insert a single batch of instances."""
-        params: list[Any] = []
-        value_groups = []
-
-        for instance in instances:
-            placeholders = []
-            for col in columns:
-                if self._dialect == "postgresql":
-                    placeholders.append(f"${len(params) + 1}")
-                else:
-                    placeholders.append("?")
+        """Insert a single batch of instances.
 
-                value = getattr(instance, col, None)
-                params.append(value)
-            value_groups.append(f"({', '.join(placeholders)})")
+        The statement text depends only on the model and row count, so it is
+        cached; identical text also keeps the driver's prepared statement warm.
+        """
+        self._prefetch_cache.clear()
+        params = [getattr(instance, col, None) for instance in instances for col in columns]
+        pk_col = model_cls.__primary_key__
 
-        sql = f"INSERT INTO {table} ({', '.join(columns)}) VALUES {', '.join(value_groups)}"
+        sql = _compile_insert_sql(table, columns, pk_col, self._dialect, len(instances))
 
-        pk_col = model_cls.__primary_key__
         if pk_col:
-            # Use RETURNING to get generated IDs (works in PostgreSQL and SQLite 3.35+)
-            sql += f" RETURNING {pk_col}"
             result = await self._pool.execute(sql, params)
             rows = result.all()
             for i, instance in enumerate(instances):
@@ -1181,29 +1701,29 @@ class AsyncSession:
 
     async def _flush_deletes(self) -> None:
         """Delete all pending delete objects."""
-        for obj in self._pending_delete:
-            cls = type(obj)
+        self._prefetch_cache.clear()
+        for cls, instances in self._pending_delete_by_class.items():
             pk_col = cls.__primary_key__
             if pk_col is None:
                 raise ValueError(f"Cannot delete {cls.__name__}: no primary key defined")
 
-            pk_value = getattr(obj, pk_col, None)
-            if pk_value is None:
-                continue
-
             table = cls.__tablename__
             if self._dialect == "postgresql":
                 sql = f"DELETE FROM {table} WHERE {pk_col} = $1"
             else:
                 sql = f"DELETE FROM {table} WHERE {pk_col} = ?"
 
-            await self._pool.execute_statement_py(sql, [pk_value])
+            for obj in instances:
+                pk_value = getattr(obj, pk_col, None)
+                if pk_value is None:
+                    continue
+
+                await self._pool.execute_statement_py(sql, [pk_value])
 
-            # Remove from identity map
-            key = (cls, pk_value)
-            self._identity_map.pop(key, None)
+                # Remove from identity map
+                self._identity_map.pop((cls, pk_value), None)
 
-        self._pending_delete.clear()
+        self._pending_delete_by_class.clear()
 
 
 class Transaction:
@@ -1405,6 +1925,10 @@ class Query[T]:
 
     async def all(self) -> list[T]:
         """Execute query and return all results."""
+        joined_m2m = self._joined_m2m_relationship()
+        if joined_m2m is not None:
+            return await self._all_with_joined_m2m(*joined_m2m)
+
         result = await self._execute()
         instances = result.scalars().all()
         await self._apply_load_options(instances, result.join_infos)
@@ -1423,11 +1947,46 @@ class Query[T]:
             >>> async for user in session.query(User).stream(batch_size=500):
             ...     process_user(user)
         """
-        offset = 0
-        while True:
+        # The caller's offset applies once, before the first batch, and the
+        # caller's limit caps the total number of rows yielded
+        remaining = self._limit_val
+        pk_col = self._model.__primary_key__
+        if pk_col and not (self._order or self._group_by or self._build_join_info()):
+            # Unordered queries page by primary key: each batch seeks past the
+            # last key instead of re-scanning every skipped row with OFFSET
+            keyset_query = self.order_by(pk_col)
+            keyset_query._offset_val = None
+            batch_query = keyset_query._copy()
+            batch_query._offset_val = self._offset_val
+            while remaining is None or remaining > 0:
+                size = batch_size if remaining is None else min(batch_size, remaining)
+                batch_query._limit_val = size
+                result = await batch_query._execute()
+                instances = result.scalars().all()
+
+                if not instances:
+                    break
+
+                await batch_query._apply_load_options(instances, result.join_infos)
+
+                for instance in instances:
+                    yield instance
+
+                if len(instances) < size:
+                    break
+                if remaining is not None:
+                    remaining -= size
+
+                last_pk = getattr(instances[-1], pk_col)
+                batch_query = keyset_query.filter(**{f"{pk_col}__gt": last_pk})
+            return
+
+        offset = self._offset_val or 0
+        while remaining is None or remaining > 0:
             # Fetch a batch
+            size = batch_size if remaining is None else min(batch_size, remaining)
             batch_query = self._copy()
-            batch_query._limit_val = batch_size
+            batch_query._limit_val = size
             batch_query._offset_val = offset
 
             result = await batch_query._execute()
@@ -1441,10 +2000,12 @@ class Query[T]:
             for instance in instances:
                 yield instance
 
-            if len(instances) < batch_size:
+            if len(instances) < size:
                 break
+            if remaining is not None:
+                remaining -= size
 
-            offset += batch_size
+            offset += size
 
     def __aiter__(self) -> AsyncIterator[T]:
         """Allow using the query directly as an async iterator.
@@ -1479,53 +2040,92 @@ class Query[T]:
             await self._apply_load_options([instance], result.join_infos)
         return instance
 
-    async def count(self) -> int:
-        """Return count of matching rows."""
-        sql, params = self._build_aggregate_sql("COUNT(*)", "count")
+    async def aggregate(self, *specs: str) -> dict[str, Any]:
+        """Compute several aggregates over the matching rows in one query.
+
+        Each spec is ``"column__func"`` with func one of count, sum, avg, min or
+        max, or plain ``"count"`` for COUNT(*). Results are keyed by spec.
+
+        Example:
+            >>> await session.query(User).aggregate("count", "age__avg", "age__max")
+            {"count": 4, "age__avg": 29.5, "age__max": 35}
+        """
+        exprs: dict[str, str] = {}
+        for spec in specs:
+            if spec == "count":
+                exprs[spec] = "COUNT(*)"
+                continue
+            col, _, func = spec.rpartition("__")
+            sql_func = _AGGREGATE_FUNCTIONS.get(func)
+            if not col or sql_func is None:
+                raise ValueError(
+                    f"Invalid aggregate {spec!r}: expected 'column__func' with func in "
+                    f"{', '.join(_AGGREGATE_FUNCTIONS)}"
+                )
+            exprs[spec] = f"{sql_func}({col})"
+        return await self._aggregate(exprs)
+
+    async def _aggregate(self, exprs: dict[str, str]) -> dict[str, Any]:
+        """Run one SELECT of ``expr AS alias`` terms and return the row."""
+        select_list = ", ".join(f"{expr} AS {alias}" for alias, expr in exprs.items())
+        sql, params = self._build_aggregate_sql(select_list)
         result = await self._session._pool.execute(sql, params)
         row = result.first()
-        return row["count"] if row else 0
+        return row if row else dict.fromkeys(exprs)
+
+    async def _aggregate_scalar(self, expr: str) -> Any:
+        """Run ``SELECT expr`` over the matching rows and return the bare value."""
+        sql, params = self._build_aggregate_sql(expr)
+        result = await self._session._pool.execute(sql, params)
+        return result.scalar()
+
+    async def count(self) -> int:
+        """Return count of matching rows."""
+        return await self._aggregate_scalar("COUNT(*)") or 0
 
     async def sum(self, column: str) -> float | None:
         """Return sum of a column."""
-        sql, params = self._build_aggregate_sql(f"SUM({column})", "sum")
-        result = await self._session._pool.execute(sql, params)
-        row = result.first()
-        return row["sum"] if row else None
+        return await self._aggregate_scalar(f"SUM({column})")
 
     async def avg(self, column: str) -> float | None:
         """Return average of a column."""
-        sql, params = self._build_aggregate_sql(f"AVG({column})", "avg")
-        result = await self._session._pool.execute(sql, params)
-        row = result.first()
-        return row["avg"] if row else None
+        return await self._aggregate_scalar(f"AVG({column})")
 
     async def min(self, column: str) -> Any:
         """Return minimum value of a column."""
-        sql, params = self._build_aggregate_sql(f"MIN({column})", "min")
-        result = await self._session._pool.execute(sql, params)
-        row = result.first()
-        return row["min"] if row else None
+        return await self._aggregate_scalar(f"MIN({column})")
 
     async def max(self, column: str) -> Any:
         """Return maximum value of a column."""
-        sql, params = self._build_aggregate_sql(f"MAX({column})", "max")
-        result = await self._session._pool.execute(sql, params)
-        row = result.first()
-        return row["max"] if row else None
+        return await self._aggregate_scalar(f"MAX({column})")
+
+    async def count_related(self, relationship: str) -> int:
+        """Return how many related rows a collection relationship has for the matching rows.
+
+        Counts junction (many-to-many) or child (one-to-many) rows in a single
+        aggregate, without loading or hydrating the related objects.
+
+        Example:
+            >>> n = await session.query(User).filter(id=1).count_related("roles")
+        """
+        count_sql, parent_col = self._count_related_sql(relationship)
+        parent_sql, params = self._build_select_sql((parent_col,), join_infos=[])
+        result = await self._session._pool.execute(f"{count_sql} IN ({parent_sql})", params)
+        return result.scalar() or 0
 
     async def exists(self) -> bool:
         """Check if any matching rows exist."""
         table = self._model.__tablename__
         sql = f"SELECT 1 FROM {table}"
-        where_sql, params = self._build_where_clause()
+        where_sql, params = self._build_cached_where_clause()
         sql += where_sql + " LIMIT 1"
         result = await self._session._pool.execute(sql, params)
-        return result.first() is not None
+        return len(result) > 0
 
     async def delete(self) -> int:
         """Delete all matching rows and return count."""
         sql, params = self._build_delete_sql()
+        self._session._prefetch_cache.clear()
         return await self._session._pool.execute_statement_py(sql, params)
 
     async def update(self, **values: Any) -> int:
@@ -1534,11 +2134,31 @@ class Query[T]:
         Example:
             >>> count = await session.query(User).filter(age__lt=18).update(status="minor")
         """
-        return await self._session.bulk_update(
+        # Filters are already parsed - skip the kwargs round-trip through bulk_update()
+        return await self._session._bulk_update_parsed(
+            self._model, values, self._q_objects, self._filters
+        )
+
+    async def soft_delete(self) -> int:
+        """Soft delete all matching rows in one UPDATE and return the count.
+
+        Sets ``deleted_at`` on rows that are not already soft-deleted; instances
+        loaded earlier are not refreshed. Only works on models that use
+        SoftDeleteMixin.
+
+        Example:
+            >>> count = await session.query(Article).filter(title__like="Draft%").soft_delete()
+        """
+        if not getattr(self._model, "__soft_delete__", False):
+            raise TypeError(
+                f"{self._model.__name__} doesn't support soft delete. "
+                "Add SoftDeleteMixin to enable soft delete."
+            )
+        return await self._session._bulk_update_parsed(
             self._model,
-            values,
-            *self._q_objects,
-            **{f"{col}__{op}" if op != "eq" else col: val for col, op, val in self._filters}
+            {"deleted_at": datetime.now(UTC)},
+            self._q_objects,
+            [*self._filters, ("deleted_at", "isnull", True)],
         )
 
     async def values(self, *columns: str) -> list[dict[str, Any]]:
@@ -1548,9 +2168,10 @@ class Query[T]:
             >>> await query.values("id", "name")
             [{"id": 1, "name": "Alice"}, {"id": 2, "name": "Bob"}]
         """
-        sql, params = self._build_select_sql(columns)
+        # Rows come back as plain dicts, so joinedload options have nothing to fill
+        sql, params = self._build_select_sql(columns, join_infos=[])
         result = await self._session._pool.execute(sql, params)
-        return list(result.all())
+        return result.all()
 
     async def values_list(self, *columns: str, flat: bool = False) -> list[Any]:
         """Return specific columns as tuples (like Django's values_list()).
@@ -1562,12 +2183,12 @@ class Query[T]:
             >>> await query.values_list("name", flat=True)
             ["Alice", "Bob"]
         """
-        sql, params = self._build_select_sql(columns)
+        sql, params = self._build_select_sql(columns, join_infos=[])
         result = await self._session._pool.execute(sql, params)
 
         if flat and len(columns) == 1:
-            return list(result.column(columns[0]))
-        return list(result.tuples())
+            return result.column(columns[0])
+        return result.tuples()
 
     async def _execute(self) -> ExecuteResult[T]:
         """Build and execute the SELECT statement."""
@@ -1586,7 +2207,7 @@ class Query[T]:
         where_parts: list[str] = []
 
         # Add soft delete filter if model uses SoftDeleteMixin
-        if getattr(self._model, "__soft_delete__", False):
+        if self._model.__soft_delete__:
             if not self._include_deleted:
                 # Exclude deleted records by default
                 where_parts.append("deleted_at IS NULL")
@@ -1597,7 +2218,8 @@ class Query[T]:
 
         # Handle Q objects first
         for q in self._q_objects:
-            q_sql, q_params = q.to_sql(dialect, param_offset + len(params))
+            # extend() copies the cached params, so to_sql()'s defensive copy is skipped
+            q_sql, q_params = q._compiled(dialect, param_offset + len(params))
             if q_sql:
                 where_parts.append(q_sql)
                 params.extend(q_params)
@@ -1612,6 +2234,32 @@ class Query[T]:
             return " WHERE " + " AND ".join(where_parts), params
         return "", []
 
+    def _build_cached_where_clause(self) -> tuple[str, list[Any]]:
+        """Build the WHERE clause, reusing the cached SQL for plain comparisons.
+
+        Used by statements that share the query's filters but not its SELECT
+        (COUNT and other aggregates, EXISTS, DELETE).
+        """
+        if self._q_objects:
+            return self._build_where_clause()
+        dialect = self._session._dialect
+        shape = _filter_shape(self._filters, dialect)
+        if shape is None:
+            return self._build_where_clause()
+        conditions, params = shape
+
+        cache_key = (
+            self._model,
+            dialect,
+            self._include_deleted,
+            self._only_deleted,
+            conditions,
+        )
+        where_sql = _where_sql_cache.get(cache_key)
+        if where_sql is None:
+            where_sql = _where_sql_cache[cache_key] = self._build_where_clause()[0]
+        return where_sql, params
+
     def _build_select_sql(
         self,
         columns: tuple[str, ...] | None = None,
@@ -1619,14 +2267,67 @@ class Query[T]:
         join_infos: list[JoinInfo] | None = None,
     ) -> tuple[str, list[Any]]:
         """Build full SELECT SQL."""
-        dialect = self._session._dialect
-        table = self._model.__tablename__
-        main_alias = "_t0"
-
         # Build JOIN info for joinedload options
         if join_infos is None:
             join_infos = self._build_join_info()
 
+        shape = self._select_shape(columns, join_infos)
+        if shape is None:
+            sql, params = self._render_select_sql(columns, join_infos)
+        else:
+            cache_key, params = shape
+            sql = _select_sql_cache.get(cache_key)
+            if sql is None:
+                sql = _select_sql_cache[cache_key] = self._render_select_sql(columns, join_infos)[0]
+
+        # LIMIT / OFFSET change from page to page, so they stay out of the cache
+        if self._limit_val is not None:
+            sql += f" LIMIT {self._limit_val}"
+        if self._offset_val is not None:
+            sql += f" OFFSET {self._offset_val}"
+
+        return sql, params
+
+    def _select_shape(
+        self, columns: tuple[str, ...] | None, join_infos: list[JoinInfo]
+    ) -> tuple[tuple[Any, ...], list[Any]] | None:
+        """Return the SELECT cache key and bound params, or None if uncacheable.
+
+        A query is cacheable when every condition is a plain column comparison,
+        so its SQL depends only on which columns and operators are used. Q
+        objects, IN lists, NULL checks and JSON paths render value-dependent SQL.
+        """
+        if self._q_objects:
+            return None
+        dialect = self._session._dialect
+        shape = _filter_shape((*self._filters, *self._having), dialect)
+        if shape is None:
+            return None
+        conditions, params = shape
+
+        cache_key = (
+            self._model,
+            dialect,
+            columns,
+            tuple(join_infos),
+            self._distinct,
+            self._include_deleted,
+            self._only_deleted,
+            conditions,
+            len(self._filters),
+            tuple(self._group_by),
+            tuple(self._order),
+        )
+        return cache_key, params
+
+    def _render_select_sql(
+        self, columns: tuple[str, ...] | None, join_infos: list[JoinInfo]
+    ) -> tuple[str, list[Any]]:
+        """Render SELECT SQL without LIMIT / OFFSET."""
+        dialect = self._session._dialect
+        table = self._model.__tablename__
+        main_alias = "_t0"
+
         # Columns
         if columns:
             # User-specified columns - use them as-is
@@ -1682,12 +2383,6 @@ class Query[T]:
             order_parts = [f"{col} {direction}" for col, direction in self._order]
             sql += " ORDER BY " + ", ".join(order_parts)
 
-        # LIMIT / OFFSET
-        if self._limit_val is not None:
-            sql += f" LIMIT {self._limit_val}"
-        if self._offset_val is not None:
-            sql += f" OFFSET {self._offset_val}"
-
         return sql, params
 
     def _build_join_info(self) -> list[JoinInfo]:
@@ -1745,29 +2440,153 @@ class Query[T]:
 
         return join_infos
 
-    def _build_aggregate_sql(self, agg_expr: str, alias: str) -> tuple[str, list[Any]]:
-        """Build aggregate SQL (COUNT, SUM, AVG, etc.)."""
-        table = self._model.__tablename__
-        sql = f"SELECT {agg_expr} as {alias} FROM {table}"
-        params: list[Any] = []
+    def _joined_m2m_relationship(self) -> tuple[str, Any, type] | None:
+        """Find the first joinedload() option naming a many-to-many relationship."""
+        from ormkit.relationships import LoadOption
 
-        where_sql, where_params = self._build_where_clause()
-        sql += where_sql
-        params.extend(where_params)
+        if not self._model.__primary_key__:
+            return None
 
-        return sql, params
+        self._model._resolve_relationships()
+
+        for opt in self._load_options:
+            if not isinstance(opt, LoadOption) or opt.strategy != "joined":
+                continue
+
+            rel_name = opt.attr_name
+            rel_info = self._model.__relationships__.get(rel_name)
+            if rel_info is None or not rel_info.is_many_to_many:
+                continue
+
+            if rel_info._target_model is None:
+                rel_info.resolve(self._model, rel_name, self._model.__hints__.get(rel_name))
+
+            target_model = rel_info._target_model
+            if (
+                target_model is not None
+                and target_model.__primary_key__
+                and rel_info._junction_local_col
+                and rel_info._junction_remote_col
+            ):
+                return rel_name, rel_info, target_model
+
+        return None
+
+    async def _all_with_joined_m2m(
+        self, rel_name: str, rel_info: Any, target_model: type
+    ) -> list[T]:
+        """Load results together with a many-to-many relationship in one query.
+
+        The parent query (filters, ordering, LIMIT/OFFSET) becomes a subquery that
+        is LEFT JOINed through the junction table to the targets. Rows are then
+        grouped back per parent, hydrating each target once.
+        """
+        pk_col = self._model.__primary_key__
+        target_pk = target_model.__primary_key__
+        alias = "_m"
+
+        inner_sql, params = self._build_select_sql(join_infos=[])
+        parent_cols = [f"_t0.{c} AS {c}" for c in self._model.__column_tuple__]
+        target_cols = [f"{alias}.{c} AS {alias}_{c}" for c in target_model.__column_tuple__]
+        sql = (
+            f"SELECT {', '.join(parent_cols + target_cols)} FROM ({inner_sql}) AS _t0"
+            f" LEFT JOIN {rel_info.secondary} AS _mj"
+            f" ON _mj.{rel_info._junction_local_col} = _t0.{pk_col}"
+            f" LEFT JOIN {target_model.__tablename__} AS {alias}"
+            f" ON {alias}.{target_pk} = _mj.{rel_info._junction_remote_col}"
+        )
+        # The subquery's ordering is not guaranteed to survive the join
+        order_parts = [f"_t0.{col} {direction}" for col, direction in self._order]
+        related_order = _relationship_order_terms(rel_info, alias)
+        if related_order:
+            # Parent order first, then each parent's related rows by the relationship's order_by
+            order_parts = (order_parts or [f"_t0.{pk_col} ASC"]) + related_order
+        if order_parts:
+            sql += " ORDER BY " + ", ".join(order_parts)
+
+        result = await self._session._pool.execute(sql, params)
+
+        parent_from_row = self._model._from_row_fast
+        target_from_row = target_model._from_row_fast
+        target_keys = [(c, f"{alias}_{c}") for c in target_model.__column_tuple__]
+        target_id_key = f"{alias}_{target_pk}"
+
+        # Parents repeat once per association; keep first-seen order
+        parents: dict[Any, T] = {}
+        related_by_parent: dict[Any, list[Any]] = {}
+        targets_by_id: dict[Any, Any] = {}
+        for row in result.all():
+            pid = row[pk_col]
+            related = related_by_parent.get(pid)
+            if related is None:
+                parents[pid] = parent_from_row(row)
+                related = related_by_parent[pid] = []
+
+            tid = row[target_id_key]
+            if tid is None:
+                continue
+            target = targets_by_id.get(tid)
+            if target is None:
+                target = targets_by_id[tid] = target_from_row({c: row[k] for c, k in target_keys})
+            related.append(target)
+
+        for pid, instance in parents.items():
+            # Pass session so ManyToManyCollection can be created
+            instance._set_relationship(rel_name, related_by_parent[pid], self._session)
+
+        instances = list(parents.values())
+        join_info = JoinInfo(rel_name, target_model, "LEFT", pk_col, target_pk, alias)
+        await self._apply_load_options(instances, [join_info])
+        return instances
+
+    def _count_related_sql(self, rel_name: str) -> tuple[str, str]:
+        """Return the count_related() SQL prefix and the parent column it matches on."""
+        cache_key = (self._model, rel_name)
+        cached = _count_related_sql_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        self._model._resolve_relationships()
+        rel_info = self._model.__relationships__.get(rel_name)
+        if rel_info is None:
+            raise ValueError(f"{self._model.__name__} has no relationship '{rel_name}'")
+        if rel_info._target_model is None:
+            rel_info.resolve(self._model, rel_name, self._model.__hints__.get(rel_name))
+
+        target_model = rel_info._target_model
+        if rel_info.is_many_to_many:
+            table = rel_info.secondary
+            fk_col = rel_info._junction_local_col
+            parent_col = self._model.__primary_key__
+        elif rel_info.uselist and target_model is not None:
+            table = target_model.__tablename__
+            fk_col = rel_info._local_fk_column
+            parent_col = rel_info._remote_pk_column or self._model.__primary_key__
+        else:
+            raise ValueError(
+                f"count_related() needs a collection relationship; "
+                f"'{rel_name}' on {self._model.__name__} is not one"
+            )
+        if not fk_col or not parent_col:
+            raise ValueError(f"Cannot resolve columns for relationship '{rel_name}'")
+
+        cached = (f"SELECT COUNT(*) AS count FROM {table} WHERE {fk_col}", parent_col)
+        _count_related_sql_cache[cache_key] = cached
+        return cached
+
+    def _build_aggregate_sql(self, select_list: str) -> tuple[str, list[Any]]:
+        """Build aggregate SQL (COUNT, SUM, AVG, etc.) for a select list."""
+        table = self._model.__tablename__
+        sql = f"SELECT {select_list} FROM {table}"
+        where_sql, params = self._build_cached_where_clause()
+        return sql + where_sql, params
 
     def _build_delete_sql(self) -> tuple[str, list[Any]]:
         """Build DELETE SQL."""
         table = self._model.__tablename__
         sql = f"DELETE FROM {table}"
-        params: list[Any] = []
-
-        where_sql, where_params = self._build_where_clause()
-        sql += where_sql
-        params.extend(where_params)
-
-        return sql, params
+        where_sql, params = self._build_cached_where_clause()
+        return sql + where_sql, params
 
     async def _apply_load_options(
         self,
@@ -1788,6 +2607,8 @@ class Query[T]:
         # Resolve relationships if needed
         self._model._resolve_relationships()
 
+        # Each relationship loads independently, so their queries run concurrently
+        loaders = []
         for opt in self._load_options:
             if not isinstance(opt, LoadOption):
                 continue
@@ -1803,15 +2624,27 @@ class Query[T]:
             rel_info = self._model.__relationships__[rel_name]
 
             if opt.strategy == "selectin":
-                await self._load_selectin(instances, rel_name, rel_info)
+                loaders.append(self._load_selectin(instances, rel_name, rel_info))
             elif opt.strategy == "joined":
                 # For one-to-many relationships, use selectinload strategy
                 # (JOINs would create duplicate rows)
-                await self._load_selectin(instances, rel_name, rel_info)
+                loaders.append(self._load_selectin(instances, rel_name, rel_info))
+            elif opt.strategy == "greedy":
+                loaders.append(self._load_greedy(instances, rel_name, rel_info))
             elif opt.strategy == "noload":
-                # Set empty values
-                for instance in instances:
-                    instance._set_relationship(rel_name, [] if rel_info.uselist else None)
+                # Hydrated instances always carry _loaded_relationships, so the
+                # empty value goes straight into each cache (one list per instance)
+                if rel_info.uselist:
+                    for instance in instances:
+                        instance._loaded_relationships[rel_name] = []
+                else:
+                    for instance in instances:
+                        instance._loaded_relationships[rel_name] = None
+
+        if len(loaders) == 1:
+            await loaders[0]
+        elif loaders:
+            await asyncio.gather(*loaders)
 
     async def _load_selectin(
         self, instances: list[T], rel_name: str, rel_info: Any
@@ -1851,20 +2684,25 @@ class Query[T]:
                 return
 
             table = target_model.__tablename__
-            if dialect == "postgresql":
-                placeholders = ", ".join(f"${i+1}" for i in range(len(parent_ids)))
+            pk_info = self._model.__columns__.get(pk_col)
+            in_sql, params = _build_id_list_sql(
+                fk_col, parent_ids, dialect, pk_info.python_type if pk_info else None
+            )
+            sql = f"SELECT * FROM {table} WHERE {in_sql}"
+            order_terms = _relationship_order_terms(rel_info)
+            if order_terms:
+                sql += " ORDER BY " + ", ".join(order_terms)
+            result = await self._session._pool.execute(sql, params)
+
+            # Rows go straight from Rust into _from_row_fast; no Python-side row dicts
+            target_pk = target_model.__primary_key__
+            related_by_parent: dict[Any, list[Any]]
+            if target_pk is not None:
+                related_by_parent = result.to_models_grouped(target_model, fk_col, target_pk)
             else:
-                placeholders = ", ".join("?" for _ in parent_ids)
-
-            sql = f"SELECT * FROM {table} WHERE {fk_col} IN ({placeholders})"
-            result = await self._session._pool.execute(sql, parent_ids)
-
-            related_by_parent: dict[Any, list[Any]] = {pid: [] for pid in parent_ids}
-            for row in result.all():
-                row_data = row if isinstance(row, dict) else dict(row)
-                parent_id = row_data.get(fk_col)
-                if parent_id in related_by_parent:
-                    related_by_parent[parent_id].append(target_model._from_row_fast(row_data))
+                related_by_parent = defaultdict(list)
+                for related in result.to_models(target_model):
+                    related_by_parent[getattr(related, fk_col, None)].append(related)
 
             for instance in instances:
                 parent_id = getattr(instance, pk_col, None)
@@ -1889,24 +2727,78 @@ class Query[T]:
                 return
 
             table = target_model.__tablename__
-            if dialect == "postgresql":
-                placeholders = ", ".join(f"${i+1}" for i in range(len(fk_values)))
-            else:
-                placeholders = ", ".join("?" for _ in fk_values)
-
-            sql = f"SELECT * FROM {table} WHERE {remote_pk} IN ({placeholders})"
-            result = await self._session._pool.execute(sql, fk_values)
+            pk_info = target_model.__columns__.get(remote_pk)
+            in_sql, params = _build_id_list_sql(
+                remote_pk, fk_values, dialect, pk_info.python_type if pk_info else None
+            )
+            sql = f"SELECT * FROM {table} WHERE {in_sql}"
+            result = await self._session._pool.execute(sql, params)
 
-            related_by_pk: dict[Any, Any] = {}
-            for row in result.all():
-                row_data = row if isinstance(row, dict) else dict(row)
-                pk_value = row_data.get(remote_pk)
-                related_by_pk[pk_value] = target_model._from_row_fast(row_data)
+            related_by_pk: dict[Any, Any] = {
+                getattr(related, remote_pk, None): related
+                for related in result.to_models(target_model)
+            }
 
             for instance in instances:
                 fk_value = getattr(instance, fk_col, None)
                 instance._set_relationship(rel_name, related_by_pk.get(fk_value))
 
+    async def _load_greedy(self, instances: list[T], rel_name: str, rel_info: Any) -> None:
+        """Load a collection by reading the whole related table in one query.
+
+        Parents are matched up in memory, so no parent IDs are sent. Inside
+        session.begin() the result is reused by later greedy loads of the same
+        relationship until the session writes or the transaction ends.
+        """
+        if rel_info._target_model is None:
+            rel_info.resolve(self._model, rel_name, self._model.__hints__.get(rel_name))
+
+        target_model = rel_info._target_model
+        if target_model is None:
+            return
+        target_pk = target_model.__primary_key__
+        if not rel_info.uselist or target_pk is None:
+            # Single objects gain nothing from a full-table read
+            await self._load_selectin(instances, rel_name, rel_info)
+            return
+
+        target_table = target_model.__tablename__
+        if rel_info.is_many_to_many:
+            parent_col = self._model.__primary_key__
+            group_col = _M2M_PARENT_ALIAS
+            junction_local = rel_info._junction_local_col
+            junction_remote = rel_info._junction_remote_col
+            if not parent_col or not junction_local or not junction_remote:
+                return
+            sql = (
+                f"SELECT t.*, j.{junction_local} AS {_M2M_PARENT_ALIAS} "
+                f"FROM {target_table} AS t "
+                f"JOIN {rel_info.secondary} AS j ON j.{junction_remote} = t.{target_pk}"
+            )
+            order_terms = _relationship_order_terms(rel_info, "t")
+        else:
+            parent_col = rel_info._remote_pk_column or self._model.__primary_key__
+            group_col = rel_info._local_fk_column
+            if not parent_col or not group_col:
+                return
+            sql = f"SELECT * FROM {target_table}"
+            order_terms = _relationship_order_terms(rel_info)
+        if order_terms:
+            sql += " ORDER BY " + ", ".join(order_terms)
+
+        session = self._session
+        result = session._prefetch_cache.get(sql)
+        if result is None:
+            result = await session._execute_shared(sql, [])
+            if session._in_transaction:
+                session._prefetch_cache[sql] = result
+
+        # Each load hydrates its own instances from the shared result
+        related_by_parent = result.to_models_grouped(target_model, group_col, target_pk)
+        for instance in instances:
+            related = related_by_parent.get(getattr(instance, parent_col, None), [])
+            instance._set_relationship(rel_name, related, session)
+
     async def _load_selectin_m2m(
         self,
         instances: list[T],
@@ -1916,9 +2808,8 @@ class Query[T]:
     ) -> None:
         """Load a many-to-many relationship via junction table.
 
-        This performs two queries:
-        1. SELECT from junction table to get associations
-        2. SELECT from target table to get related objects
+        Performs a single query joining the junction table to the target table,
+        so associations and related objects arrive in one round-trip.
         """
         dialect = self._session._dialect
         junction_table = rel_info.secondary
@@ -1946,69 +2837,31 @@ class Query[T]:
                 instance._set_relationship(rel_name, [])
             return
 
-        # Query junction table to get associations
-        if dialect == "postgresql":
-            placeholders = ", ".join(f"${i+1}" for i in range(len(parent_ids)))
-        else:
-            placeholders = ", ".join("?" for _ in parent_ids)
-
-        junction_sql = (
-            f"SELECT {junction_local}, {junction_remote} "
-            f"FROM {junction_table} "
-            f"WHERE {junction_local} IN ({placeholders})"
-        )
-        junction_result = await self._session._pool.execute(junction_sql, parent_ids)
-        junction_rows = junction_result.all()
-
-        # Build mapping: parent_id -> list of target_ids
-        parent_to_targets: dict[Any, list[Any]] = {pid: [] for pid in parent_ids}
-        target_ids_needed: set[Any] = set()
-
-        for row in junction_rows:
-            parent_id = row[junction_local]
-            target_id = row[junction_remote]
-            if parent_id in parent_to_targets:
-                parent_to_targets[parent_id].append(target_id)
-                target_ids_needed.add(target_id)
-
-        if not target_ids_needed:
-            for instance in instances:
-                instance._set_relationship(rel_name, [])
-            return
-
-        # Query target table to get related objects
         target_table = target_model.__tablename__
-        target_ids_list = list(target_ids_needed)
-
-        if dialect == "postgresql":
-            target_placeholders = ", ".join(
-                f"${i+1}" for i in range(len(target_ids_list))
-            )
-        else:
-            target_placeholders = ", ".join("?" for _ in target_ids_list)
-
-        target_sql = (
-            f"SELECT * FROM {target_table} "
-            f"WHERE {target_pk} IN ({target_placeholders})"
+        parent_in_sql, params = _build_id_list_sql(
+            f"j.{junction_local}",
+            parent_ids,
+            dialect,
+            self._model.__columns__[pk_col].python_type,
+        )
+        sql = (
+            f"SELECT t.*, j.{junction_local} AS {_M2M_PARENT_ALIAS} "
+            f"FROM {target_table} AS t "
+            f"JOIN {junction_table} AS j ON j.{junction_remote} = t.{target_pk} "
+            f"WHERE {parent_in_sql}"
         )
-        target_result = await self._session._pool.execute(target_sql, target_ids_list)
+        order_terms = _relationship_order_terms(rel_info, "t")
+        if order_terms:
+            sql += " ORDER BY " + ", ".join(order_terms)
+        result = await self._session._execute_shared(sql, params, frozenset(parent_ids))
 
-        # Build mapping: target_id -> target instance
-        targets_by_id: dict[Any, Any] = {}
-        for row in target_result.all():
-            row_data = row if isinstance(row, dict) else dict(row)
-            tid = row_data.get(target_pk)
-            targets_by_id[tid] = target_model._from_row_fast(row_data)
+        # Grouping and hydration run in Rust; a target linked to several parents
+        # appears once per link but is hydrated once
+        related_by_parent = result.to_models_grouped(target_model, _M2M_PARENT_ALIAS, target_pk)
 
         # Assemble related objects for each instance
         for instance in instances:
-            parent_id = getattr(instance, pk_col, None)
-            target_ids = parent_to_targets.get(parent_id, [])
-            related = [
-                targets_by_id[tid]
-                for tid in target_ids
-                if tid in targets_by_id
-            ]
+            related = related_by_parent.get(getattr(instance, pk_col, None), [])
             # Pass session so ManyToManyCollection can be created
             instance._set_relationship(rel_name, related, self._session)
 
@@ -2016,6 +2869,8 @@ class Query[T]:
 class ExecuteResult[T: "Base"]:
     """Result from executing a query statement."""
 
+    __slots__ = ("_result", "_model", "_join_infos")
+
     def __init__(
         self,
         result: QueryResult,
@@ -2032,7 +2887,8 @@ class ExecuteResult[T: "Base"]:
 
     def all(self) -> list[dict[str, Any]]:
         """Get all results as dictionaries."""
-        return list(self._result.all())
+        # QueryResult.all() already builds a fresh Python list, no need to copy it
+        return self._result.all()
 
     def first(self) -> dict[str, Any] | None:
         """Get the first result as a dictionary."""
@@ -2090,6 +2946,8 @@ class ExecuteResult[T: "Base"]:
 class ScalarResult[T: "Base"]:
     """Result wrapper that converts rows to model instances."""
 
+    __slots__ = ("_result", "_model", "_join_infos")
+
     def __init__(
         self,
         result: QueryResult,
@@ -2106,7 +2964,15 @@ class ScalarResult[T: "Base"]:
             raise ValueError("Cannot convert to model: no model specified")
 
         if self._join_infos:
-            return self._hydrate_with_joins(self._result.all())
+            return self._hydrate_with_joins(self._result.tuples())
+
+        if (
+            not self._model.__json_columns__
+            and self._result.columns == self._model.__column_tuple__
+        ):
+            # Plain model rows: positional tuples feed the generated hydrator,
+            # skipping a per-row dict and _from_row_fast call
+            return self._hydrate_with_joins(self._result.tuples())
 
         # Rust's to_models() already returns a Python list, no need to wrap
         return self._result.to_models(self._model)
@@ -2116,11 +2982,12 @@ class ScalarResult[T: "Base"]:
         if self._model is None:
             return None
 
+        # Only the needed row is converted to a dict, not the whole result
         if self._join_infos:
-            rows = self._result.all()
-            if not rows:
+            row = self._result.first()
+            if row is None:
                 return None
-            return self._hydrate_with_joins([rows[0]])[0]
+            return self._hydrate_with_joins([tuple(row.values())])[0]
 
         return self._result.to_model(self._model)
 
@@ -2128,13 +2995,13 @@ class ScalarResult[T: "Base"]:
         """Get exactly one result as a model instance."""
         if self._model is None:
             raise ValueError("Cannot convert to model: no model specified")
-        if self._result.rowcount != 1:
-            raise ValueError(f"Expected exactly 1 row, got {self._result.rowcount}")
 
         if self._join_infos:
-            rows = self._result.all()
-            return self._hydrate_with_joins(rows)[0]
+            # QueryResult.one() raises the row-count error itself
+            return self._hydrate_with_joins([tuple(self._result.one().values())])[0]
 
+        if self._result.rowcount != 1:
+            raise ValueError(f"Expected exactly 1 row, got {self._result.rowcount}")
         result = self._result.to_model(self._model)
         if result is None:
             raise ValueError("Expected exactly 1 row, got 0")
@@ -2144,15 +3011,15 @@ class ScalarResult[T: "Base"]:
         """Get one result or None."""
         if self._model is None:
             return None
-        if self._result.rowcount > 1:
-            raise ValueError(f"Expected at most 1 row, got {self._result.rowcount}")
 
         if self._join_infos:
-            rows = self._result.all()
-            if not rows:
+            row = self._result.one_or_none()
+            if row is None:
                 return None
-            return self._hydrate_with_joins(rows)[0]
+            return self._hydrate_with_joins([tuple(row.values())])[0]
 
+        if self._result.rowcount > 1:
+            raise ValueError(f"Expected at most 1 row, got {self._result.rowcount}")
         return self._result.to_model(self._model)
 
     def __len__(self) -> int:
@@ -2185,48 +3052,13 @@ class ScalarResult[T: "Base"]:
             "Use .first(), .one(), or .all()[n] instead."
         )
 
-    def _hydrate_with_joins(self, rows: list[dict[str, Any]]) -> list[T]:
-        """Hydrate model instances with joined relationship data."""
+    def _hydrate_with_joins(self, rows: list[tuple[Any, ...]]) -> list[T]:
+        """Hydrate model instances (and any joined relationships) from tuple rows."""
         if self._model is None:
             return []
 
-        instances: list[T] = []
-
-        for row in rows:
-            # Extract main model columns (not prefixed)
-            main_data = {}
-            for col in self._model.__columns__.keys():
-                if col in row:
-                    main_data[col] = row[col]
-
-            # Create main instance
-            instance = self._model._from_row_fast(main_data)
-
-            # Hydrate each joined relationship
-            for join_info in self._join_infos:
-                alias = join_info.alias
-                target_model = join_info.target_model
-
-                # Extract joined columns (prefixed with alias_)
-                related_data = {}
-                has_data = False
-                for col in target_model.__columns__.keys():
-                    key = f"{alias}_{col}"
-                    if key in row:
-                        related_data[col] = row[key]
-                        if row[key] is not None:
-                            has_data = True
-
-                # Create related instance if we have non-null data
-                if has_data:
-                    related_instance = target_model._from_row_fast(related_data)
-                    instance._set_relationship(join_info.rel_name, related_instance)
-                else:
-                    instance._set_relationship(join_info.rel_name, None)
-
-            instances.append(instance)
-
-        return instances
+        hydrator = _compile_join_hydrator(self._model, self._join_infos, self._result.columns)
+        return hydrator(rows)
 
 
 # ========== Convenience Functions ==========
@@ -3,6 +3,8 @@ use pyo3::prelude::*;
 use pyo3::sync::GILOnceCell;
 use pyo3::types::{PyDict, PyList, PyString, PyTuple};
 use smallvec::SmallVec;
+use std::collections::hash_map::Entry;
+use std::collections::HashMap;
 use std::sync::Arc;
 use std::sync::OnceLock;
 
@@ -68,6 +70,9 @@ pub struct QueryResult {
     columns: Arc<Vec<String>>,
     /// Cached Python tuple of column names (lazy, avoids repeated Vec cloning)
     columns_tuple_cache: CachedColumnsTuple,
+    /// Interned column names shared as keys by every row dict built from this
+    /// result (lazy; one interning pass per result instead of per call or row)
+    column_keys: GILOnceCell<Arc<Vec<Py<PyString>>>>,
 }
 
 impl QueryResult {
@@ -80,6 +85,7 @@ impl QueryResult {
             columns_tuple_cache: CachedColumnsTuple {
                 tuple: OnceLock::new(),
             },
+            column_keys: GILOnceCell::new(),
         }
     }
 
@@ -99,6 +105,89 @@ impl QueryResult {
             tuple.into()
         })
     }
+
+    /// Get or create the interned column names used as row dict keys.
+    #[inline]
+    fn column_keys(&self, py: Python<'_>) -> &Arc<Vec<Py<PyString>>> {
+        self.column_keys.get_or_init(py, || {
+            Arc::new(
+                self.columns
+                    .iter()
+                    .map(|col| PyString::intern(py, col).unbind())
+                    .collect(),
+            )
+        })
+    }
+
+    /// Integer-key fast path for `to_models_grouped`.
+    ///
+    /// Parent and target ids are almost always integer primary keys, so rows
+    /// are deduplicated and grouped with Rust-side lookups instead of hashing a
+    /// Python object per row; dense group ids (e.g. parents 1..=n) index a Vec
+    /// directly. Returns `None` if any group or key value is not an integer.
+    fn group_models_by_int<'py>(
+        &self,
+        py: Python<'py>,
+        from_row_fast: &Bound<'py, PyAny>,
+        keys: &[Py<PyString>],
+        group_idx: usize,
+        key_idx: usize,
+    ) -> PyResult<Option<Bound<'py, PyDict>>> {
+        let int_at = |row: &LazyRow, idx: usize| match row.values.get(idx) {
+            Some(RowValue::Int(v)) => Some(*v),
+            _ => None,
+        };
+
+        let rows = self.rows.as_slice();
+        let mut min_group = i64::MAX;
+        let mut max_group = i64::MIN;
+        for row in rows {
+            let (Some(group), Some(_)) = (int_at(row, group_idx), int_at(row, key_idx)) else {
+                return Ok(None);
+            };
+            min_group = min_group.min(group);
+            max_group = max_group.max(group);
+        }
+
+        let span = max_group as i128 - min_group as i128 + 1;
+        let dense = span <= rows.len() as i128;
+        let mut dense_slots = vec![usize::MAX; if dense { span as usize } else { 0 }];
+        let mut sparse_slots: HashMap<i64, usize> = HashMap::new();
+        // Groups in first-seen order, matching the generic path
+        let mut buckets: Vec<(i64, Vec<Bound<'py, PyAny>>)> = Vec::new();
+        let mut instances_by_key: HashMap<i64, Bound<'py, PyAny>> =
+            HashMap::with_capacity(rows.len());
+
+        for row in rows {
+            let group = int_at(row, group_idx).unwrap_or_default();
+            let key = int_at(row, key_idx).unwrap_or_default();
+
+            let instance = match instances_by_key.entry(key) {
+                Entry::Occupied(entry) => entry.get().clone(),
+                Entry::Vacant(entry) => {
+                    let dict = row_to_dict(py, row, keys)?;
+                    entry.insert(from_row_fast.call1((dict,))?).clone()
+                }
+            };
+
+            let slot = if dense {
+                &mut dense_slots[(group - min_group) as usize]
+            } else {
+                sparse_slots.entry(group).or_insert(usize::MAX)
+            };
+            if *slot == usize::MAX {
+                *slot = buckets.len();
+                buckets.push((group, Vec::new()));
+            }
+            buckets[*slot].1.push(instance);
+        }
+
+        let groups = PyDict::new(py);
+        for (group, instances) in buckets {
+            groups.set_item(group, PyList::new(py, instances)?)?;
+        }
+        Ok(Some(groups))
+    }
 }
 
 /// Convert RowValue to Python object - hyper-optimized version
@@ -122,31 +211,16 @@ fn row_value_to_py(py: Python<'_>, val: &RowValue) -> PyObject {
     }
 }
 
-/// Convert a single row to a Python dict
+/// Convert a single row to a Python dict keyed by the result's interned column names
 #[inline]
 fn row_to_dict<'py>(
     py: Python<'py>,
     row: &LazyRow,
-    cols: &[String],
-    interned_cols: Option<&[Bound<'py, PyString>]>,
+    keys: &[Py<PyString>],
 ) -> PyResult<Bound<'py, PyDict>> {
     let dict = PyDict::new(py);
-    let vals = &row.values;
-    let len = cols.len().min(vals.len());
-
-    match interned_cols {
-        Some(interned) => {
-            for i in 0..len {
-                let py_val = row_value_to_py(py, unsafe { vals.get_unchecked(i) });
-                dict.set_item(unsafe { interned.get_unchecked(i) }, py_val)?;
-            }
-        }
-        None => {
-            for i in 0..len {
-                let py_val = row_value_to_py(py, unsafe { vals.get_unchecked(i) });
-                dict.set_item(unsafe { cols.get_unchecked(i) }, py_val)?;
-            }
-        }
+    for (key, val) in keys.iter().zip(row.values.iter()) {
+        dict.set_item(key.bind(py), row_value_to_py(py, val))?;
     }
     Ok(dict)
 }
@@ -156,21 +230,15 @@ impl QueryResult {
     /// Get all rows as a list of dictionaries - optimized
     fn all<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyList>> {
         let rows = &self.rows;
-        let cols = self.columns.as_ref();
 
         if rows.is_empty() {
             return PyList::new(py, Vec::<PyObject>::new());
         }
 
-        // Pre-intern column names for faster dict key setting
-        let interned_cols: Vec<Bound<'py, PyString>> =
-            cols.iter().map(|c| PyString::intern(py, c)).collect();
-
         // Build all dicts
-        let dicts: PyResult<Vec<Bound<'py, PyDict>>> = rows
-            .iter()
-            .map(|row| row_to_dict(py, row, cols, Some(&interned_cols)))
-            .collect();
+        let keys = self.column_keys(py);
+        let dicts: PyResult<Vec<Bound<'py, PyDict>>> =
+            rows.iter().map(|row| row_to_dict(py, row, keys)).collect();
 
         PyList::new(py, dicts?)
     }
@@ -179,7 +247,7 @@ impl QueryResult {
     #[inline]
     fn first<'py>(&self, py: Python<'py>) -> PyResult<Option<Bound<'py, PyDict>>> {
         if let Some(row) = self.rows.first() {
-            Ok(Some(row_to_dict(py, row, &self.columns, None)?))
+            Ok(Some(row_to_dict(py, row, self.column_keys(py))?))
         } else {
             Ok(None)
         }
@@ -238,10 +306,10 @@ impl QueryResult {
     }
 
     /// Iterator that borrows from Arc instead of cloning
-    fn __iter__(&self) -> QueryResultIter {
+    fn __iter__(&self, py: Python<'_>) -> QueryResultIter {
         QueryResultIter {
             rows: Arc::clone(&self.rows),
-            columns: Arc::clone(&self.columns),
+            keys: Arc::clone(self.column_keys(py)),
             index: 0,
         }
     }
@@ -355,7 +423,6 @@ impl QueryResult {
         model_class: &Bound<'py, PyAny>,
     ) -> PyResult<Bound<'py, PyList>> {
         let rows = &self.rows;
-        let cols = self.columns.as_ref();
 
         if rows.is_empty() {
             return PyList::new(py, Vec::<PyObject>::new());
@@ -363,24 +430,13 @@ impl QueryResult {
 
         // Get Python's _from_row_fast method for proper type handling
         let from_row_fast = model_class.getattr(intern!(py, "_from_row_fast"))?;
-
-        // Pre-intern column names for faster dict creation
-        let interned_cols: Vec<Bound<'py, PyString>> =
-            cols.iter().map(|col| PyString::intern(py, col)).collect();
+        let keys = self.column_keys(py);
 
         // Pre-allocate the result vector
         let mut instances: Vec<PyObject> = Vec::with_capacity(rows.len());
 
         for row in rows.iter() {
-            // Build dict from row values
-            let dict = PyDict::new(py);
-            let vals = &row.values;
-            let len = cols.len().min(vals.len());
-
-            for i in 0..len {
-                let py_val = row_value_to_py(py, &vals[i]);
-                dict.set_item(&interned_cols[i], py_val)?;
-            }
+            let dict = row_to_dict(py, row, keys)?;
 
             // Call _from_row_fast(dict) to create instance with proper type handling
             let instance = from_row_fast.call1((dict,))?;
@@ -390,6 +446,71 @@ impl QueryResult {
         PyList::new(py, instances)
     }
 
+    /// Create model instances grouped by the value of `group_col`.
+    ///
+    /// Rows sharing a `key_col` value are hydrated once and the same instance is
+    /// appended to every group it appears in (e.g. an M2M target linked to
+    /// several parents). Returns `{group_value: [instance, ...]}`.
+    fn to_models_grouped<'py>(
+        &self,
+        py: Python<'py>,
+        model_class: &Bound<'py, PyAny>,
+        group_col: &str,
+        key_col: &str,
+    ) -> PyResult<Bound<'py, PyDict>> {
+        let cols = self.columns.as_ref();
+        let position = |name: &str| {
+            cols.iter().position(|c| c == name).ok_or_else(|| {
+                pyo3::exceptions::PyKeyError::new_err(format!("Column '{}' not found", name))
+            })
+        };
+        let group_idx = position(group_col)?;
+        let key_idx = position(key_col)?;
+
+        let groups = PyDict::new(py);
+        if self.rows.is_empty() {
+            return Ok(groups);
+        }
+
+        let from_row_fast = model_class.getattr(intern!(py, "_from_row_fast"))?;
+        let keys = self.column_keys(py);
+        if let Some(groups) =
+            self.group_models_by_int(py, &from_row_fast, keys, group_idx, key_idx)?
+        {
+            return Ok(groups);
+        }
+
+        let instances_by_key = PyDict::new(py);
+        for row in self.rows.iter() {
+            let key = row
+                .values
+                .get(key_idx)
+                .map(|v| row_value_to_py(py, v))
+                .unwrap_or_else(|| py.None());
+            let instance = match instances_by_key.get_item(&key)? {
+                Some(existing) => existing,
+                None => {
+                    let dict = row_to_dict(py, row, keys)?;
+                    let created = from_row_fast.call1((dict,))?;
+                    instances_by_key.set_item(&key, &created)?;
+                    created
+                }
+            };
+
+            let group = row
+                .values
+                .get(group_idx)
+                .map(|v| row_value_to_py(py, v))
+                .unwrap_or_else(|| py.None());
+            match groups.get_item(&group)? {
+                Some(list) => list.downcast::<PyList>()?.append(instance)?,
+                None => groups.set_item(&group, PyList::new(py, [instance])?)?,
+            }
+        }
+
+        Ok(groups)
+    }
+
     /// Create a single model instance from the first row
     fn to_model<'py>(
         &self,
@@ -400,22 +521,9 @@ impl QueryResult {
             return Ok(None);
         }
 
-        let row = &self.rows[0];
-        let cols = self.columns.as_ref();
-
         // Get Python's _from_row_fast method for proper type handling (JSON, etc.)
         let from_row_fast = model_class.getattr(intern!(py, "_from_row_fast"))?;
-
-        // Build dict from row values
-        let dict = PyDict::new(py);
-        let vals = &row.values;
-        let len = cols.len().min(vals.len());
-
-        for i in 0..len {
-            let col = &cols[i];
-            let py_val = row_value_to_py(py, &vals[i]);
-            dict.set_item(PyString::intern(py, col), py_val)?;
-        }
+        let dict = row_to_dict(py, &self.rows[0], self.column_keys(py))?;
 
         // Call _from_row_fast(dict) to create instance with proper type handling
         let instance = from_row_fast.call1((dict,))?;
@@ -427,7 +535,7 @@ impl QueryResult {
 #[pyclass]
 pub struct QueryResultIter {
     rows: SharedRows,
-    columns: Arc<Vec<String>>,
+    keys: Arc<Vec<Py<PyString>>>,
     index: usize,
 }
 
@@ -442,7 +550,7 @@ impl QueryResultIter {
             let row = &self.rows[self.index];
             self.index += 1;
 
-            let dict = row_to_dict(py, row, &self.columns, None)?;
+            let dict = row_to_dict(py, row, &self.keys)?;
             Ok(Some(dict.into()))
         } else {
             Ok(None)
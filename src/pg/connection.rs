@@ -591,7 +591,7 @@ impl PgConnection {
         let bind = BindMessage {
             portal: String::new(),
             statement: stmt.name.clone(),
-            param_formats: vec![Format::Binary; params.len()],
+            param_formats: params.iter().map(PgValue::param_format).collect(),
             params: params.to_vec(),
             result_formats: vec![Format::Binary],
         };
@@ -822,7 +822,7 @@ impl PgConnection {
         let bind = BindMessage {
             portal: String::new(),
             statement: stmt.name.clone(),
-            param_formats: vec![Format::Binary; params.len()],
+            param_formats: params.iter().map(PgValue::param_format).collect(),
             params: params.to_vec(),
             result_formats: vec![Format::Binary],
         };
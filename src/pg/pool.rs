@@ -279,6 +279,29 @@ impl PgPool {
         Ok(parse_rows_affected(&result.command_tag))
     }
 
+    /// Execute one statement for each parameter set.
+    ///
+    /// Runs on a single connection inside a transaction, so the statement is
+    /// parsed once and the batch is atomic. Returns the total rows affected.
+    pub async fn execute_many(&self, query: &str, param_sets: &[Vec<PgValue>]) -> PgResult<u64> {
+        let mut conn = self.acquire().await?;
+        conn.begin().await?;
+
+        let mut rows_affected = 0;
+        for params in param_sets {
+            match conn.query(query, params).await {
+                Ok(result) => rows_affected += parse_rows_affected(&result.command_tag),
+                Err(e) => {
+                    let _ = conn.rollback().await;
+                    return Err(e);
+                }
+            }
+        }
+
+        conn.commit().await?;
+        Ok(rows_affected)
+    }
+
     /// Close the pool and all connections.
     pub async fn close(&self) {
         // Drain and close all idle connections
@@ -315,7 +338,7 @@ impl PgPool {
 // ============================================================================
 
 /// Parse rows affected from a PostgreSQL command tag.
-fn parse_rows_affected(tag: &str) -> u64 {
+pub fn parse_rows_affected(tag: &str) -> u64 {
     // Common formats:
     // - "INSERT 0 5" -> 5 rows
     // - "UPDATE 3" -> 3 rows
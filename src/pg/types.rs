@@ -4,6 +4,7 @@
 //! Reference: https://www.postgresql.org/docs/current/protocol-overview.html#PROTOCOL-FORMAT-CODES
 
 use super::error::{PgError, PgResult};
+use super::protocol::Format;
 
 // ============================================================================
 // Type OIDs
@@ -75,6 +76,9 @@ impl Oid {
     // Numeric
     pub const NUMERIC: Oid = Oid(1700);
 
+    /// No type given: the server infers the parameter's type from context
+    pub const UNSPECIFIED: Oid = Oid(0);
+
     /// Create from raw i32 value
     #[inline]
     pub fn from_i32(oid: i32) -> Self {
@@ -163,14 +167,16 @@ impl PgValue {
     /// Get the OID for this value's type
     pub fn type_oid(&self) -> Oid {
         match self {
-            PgValue::Null => Oid::TEXT, // NULL doesn't have a specific type
+            // NULL and strings are left untyped, so a string bound against a
+            // uuid, date or numeric column is read as that type
+            PgValue::Null => Oid::UNSPECIFIED,
             PgValue::Bool(_) => Oid::BOOL,
             PgValue::Int2(_) => Oid::INT2,
             PgValue::Int4(_) => Oid::INT4,
             PgValue::Int8(_) => Oid::INT8,
             PgValue::Float4(_) => Oid::FLOAT4,
             PgValue::Float8(_) => Oid::FLOAT8,
-            PgValue::Text(_) => Oid::TEXT,
+            PgValue::Text(_) => Oid::UNSPECIFIED,
             PgValue::Bytea(_) => Oid::BYTEA,
             PgValue::Uuid(_) => Oid::UUID,
             PgValue::Timestamp(_) => Oid::TIMESTAMP,
@@ -181,6 +187,19 @@ impl PgValue {
         }
     }
 
+    /// Get the wire format for this value as a bound parameter.
+    ///
+    /// Untyped values (text and NULL) are sent as text, which the server parses
+    /// as whatever type it inferred; for text columns the bytes are the same as
+    /// the binary encoding.
+    #[inline]
+    pub fn param_format(&self) -> Format {
+        match self {
+            PgValue::Null | PgValue::Text(_) => Format::Text,
+            _ => Format::Binary,
+        }
+    }
+
     /// Decode a value from binary format.
     pub fn decode_binary(oid: Oid, data: &[u8]) -> PgResult<Self> {
         match oid {
@@ -411,6 +430,16 @@ mod tests {
         assert_eq!(original, decoded);
     }
 
+    #[test]
+    fn test_untyped_params_use_text_format() {
+        let text = PgValue::Text("0b7e3f2a-5d7c-4c1e-9a55-0f0e4b7c2d11".to_string());
+        assert_eq!(text.type_oid(), Oid::UNSPECIFIED);
+        assert_eq!(text.param_format(), Format::Text);
+        assert_eq!(PgValue::Null.type_oid(), Oid::UNSPECIFIED);
+        assert_eq!(PgValue::Int8(1).type_oid(), Oid::INT8);
+        assert_eq!(PgValue::Int8(1).param_format(), Format::Binary);
+    }
+
     #[test]
     fn test_bool_roundtrip() {
         let true_val = PgValue::Bool(true);
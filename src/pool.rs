@@ -4,13 +4,22 @@
 
 use pyo3::prelude::*;
 use smallvec::SmallVec;
+use std::collections::HashMap;
 use std::sync::Arc;
+use tokio::sync::Semaphore;
+use tokio::task::JoinSet;
 
 use crate::error::{ForeignKeyError, Result};
 use crate::executor::{LazyRow, QueryResult, RowValue};
+use crate::pg::pool::parse_rows_affected;
 use crate::pg::{PgPool, PgPoolConfig, PgValue, PooledConnection as PgPooledConnection};
 use crate::schema::{ColumnInfo, ConstraintInfo, IndexInfo, TableInfo};
-use crate::sqlite::{SqlitePool, SqlitePoolConfig, SqliteValue};
+use crate::sqlite::connection::QueryResult as SqliteQueryResult;
+use crate::sqlite::{SqlitePool, SqlitePoolConfig, SqliteTransaction, SqliteValue};
+
+/// Tables introspected at once by `get_schema` on PostgreSQL. Each one runs
+/// three queries concurrently, so this stays well under typical pool sizes.
+const DEFAULT_SCHEMA_CONCURRENCY: usize = 4;
 
 pub struct PoolConfig {
     pub url: String,
@@ -128,20 +137,7 @@ impl ConnectionPool {
             .await
             .map_err(|e| ForeignKeyError::QueryError(e.to_string()))?;
 
-        let columns = result.columns;
-
-        let lazy_rows: Vec<LazyRow> = result
-            .rows
-            .into_iter()
-            .map(|row| {
-                // Use SmallVec::from_iter for efficient inline storage (avoids heap for ≤16 columns)
-                let values: SmallVec<[RowValue; 16]> =
-                    row.into_iter().map(sqlite_value_to_row).collect();
-                LazyRow { values }
-            })
-            .collect();
-
-        Ok(QueryResult::from_lazy(lazy_rows, columns))
+        Ok(sqlite_query_result(result))
     }
 
     /// Execute a statement that doesn't return rows (INSERT, UPDATE, DELETE)
@@ -163,10 +159,78 @@ impl ConnectionPool {
         }
     }
 
+    /// Execute one statement for each parameter set, as a single atomic batch
+    pub async fn execute_statement_many(
+        &self,
+        sql: &str,
+        param_sets: Vec<Vec<SqlParam>>,
+    ) -> Result<u64> {
+        match self.inner.as_ref() {
+            PoolInner::Postgres(pool) => {
+                let pg_param_sets: Vec<Vec<PgValue>> = param_sets
+                    .into_iter()
+                    .map(|params| params.into_iter().map(sql_param_to_pg).collect())
+                    .collect();
+                pool.execute_many(sql, &pg_param_sets)
+                    .await
+                    .map_err(|e| ForeignKeyError::QueryError(e.to_string()))
+            }
+            PoolInner::Sqlite(pool) => {
+                let sqlite_param_sets: Vec<Vec<SqliteValue>> = param_sets
+                    .into_iter()
+                    .map(|params| params.into_iter().map(sql_param_to_sqlite).collect())
+                    .collect();
+                pool.execute_many(sql, sqlite_param_sets)
+                    .await
+                    .map_err(|e| ForeignKeyError::QueryError(e.to_string()))
+            }
+        }
+    }
+
+    /// Execute a script of `;`-separated statements in a single call (no parameters)
+    pub async fn execute_batch(&self, sql: &str) -> Result<()> {
+        match self.inner.as_ref() {
+            PoolInner::Postgres(pool) => pool
+                .simple_query(sql)
+                .await
+                .map(|_| ())
+                .map_err(|e| ForeignKeyError::QueryError(e.to_string())),
+            PoolInner::Sqlite(pool) => pool
+                .execute_batch(sql)
+                .await
+                .map_err(|e| ForeignKeyError::QueryError(e.to_string())),
+        }
+    }
+
     // ========================================================================
     // Schema Introspection Methods
     // ========================================================================
 
+    /// Check whether a table exists.
+    ///
+    /// The SQL text is constant and the name is bound as a parameter, so each
+    /// connection's statement cache prepares it only once.
+    pub async fn table_exists_impl(&self, table: &str) -> Result<bool> {
+        match self.inner.as_ref() {
+            PoolInner::Postgres(pool) => pool
+                .query(
+                    crate::schema::PG_TABLE_EXISTS_QUERY,
+                    &[PgValue::Text(table.to_string())],
+                )
+                .await
+                .map(|result| !result.rows.is_empty())
+                .map_err(|e| ForeignKeyError::QueryError(e.to_string())),
+            PoolInner::Sqlite(pool) => pool
+                .query(
+                    crate::schema::SQLITE_TABLE_EXISTS_QUERY,
+                    &[SqliteValue::Text(table.to_string())],
+                )
+                .await
+                .map(|result| !result.rows.is_empty())
+                .map_err(|e| ForeignKeyError::QueryError(e.to_string())),
+        }
+    }
+
     /// Get all table names in the database
     pub async fn get_tables_impl(&self) -> Result<Vec<String>> {
         match self.inner.as_ref() {
@@ -273,34 +337,7 @@ impl ConnectionPool {
                     .map(|row| {
                         let mut iter = row.into_iter();
                         let _cid = iter.next(); // Skip column id
-                        let name = match iter.next() {
-                            Some(SqliteValue::Text(s)) => s,
-                            _ => String::new(),
-                        };
-                        let data_type = match iter.next() {
-                            Some(SqliteValue::Text(s)) => s,
-                            _ => String::new(),
-                        };
-                        let notnull = match iter.next() {
-                            Some(SqliteValue::Integer(i)) => i != 0,
-                            _ => false,
-                        };
-                        let default = match iter.next() {
-                            Some(SqliteValue::Text(s)) => Some(s),
-                            Some(SqliteValue::Null) => None,
-                            _ => None,
-                        };
-                        let pk = match iter.next() {
-                            Some(SqliteValue::Integer(i)) => i != 0,
-                            _ => false,
-                        };
-                        ColumnInfo {
-                            name,
-                            data_type,
-                            nullable: !notnull,
-                            default,
-                            is_primary_key: pk,
-                        }
+                        sqlite_column_info(iter)
                     })
                     .collect();
                 Ok(columns)
@@ -355,63 +392,17 @@ impl ConnectionPool {
                 Ok(indexes)
             }
             PoolInner::Sqlite(pool) => {
-                // Get list of indexes
-                let index_list_pragma = crate::schema::sqlite_index_list_pragma(table);
                 let result = pool
-                    .query(&index_list_pragma, &[])
+                    .query(
+                        crate::schema::SQLITE_INDEXES_QUERY,
+                        &[SqliteValue::Text(table.to_string())],
+                    )
                     .await
                     .map_err(|e| ForeignKeyError::QueryError(e.to_string()))?;
 
-                // PRAGMA index_list returns: seq, name, unique, origin, partial
                 let mut indexes = Vec::new();
                 for row in result.rows {
-                    let mut iter = row.into_iter();
-                    let _seq = iter.next();
-                    let name = match iter.next() {
-                        Some(SqliteValue::Text(s)) => s,
-                        _ => continue,
-                    };
-                    let unique = match iter.next() {
-                        Some(SqliteValue::Integer(i)) => i != 0,
-                        _ => false,
-                    };
-                    let origin = match iter.next() {
-                        Some(SqliteValue::Text(s)) => s,
-                        _ => String::new(),
-                    };
-
-                    // Skip auto-generated indexes for primary keys
-                    if origin == "pk" {
-                        continue;
-                    }
-
-                    // Get columns for this index
-                    let index_info_pragma = crate::schema::sqlite_index_info_pragma(&name);
-                    let col_result = pool
-                        .query(&index_info_pragma, &[])
-                        .await
-                        .map_err(|e| ForeignKeyError::QueryError(e.to_string()))?;
-
-                    // PRAGMA index_info returns: seqno, cid, name
-                    let columns: Vec<String> = col_result
-                        .rows
-                        .into_iter()
-                        .filter_map(|row| {
-                            let mut iter = row.into_iter();
-                            let _seqno = iter.next();
-                            let _cid = iter.next();
-                            match iter.next() {
-                                Some(SqliteValue::Text(s)) => Some(s),
-                                _ => None,
-                            }
-                        })
-                        .collect();
-
-                    indexes.push(IndexInfo {
-                        name,
-                        columns,
-                        unique,
-                    });
+                    push_sqlite_index_row(&mut indexes, row.into_iter());
                 }
                 Ok(indexes)
             }
@@ -420,6 +411,21 @@ impl ConnectionPool {
 
     /// Get constraint information for a table
     pub async fn get_constraints_impl(&self, table: &str) -> Result<Vec<ConstraintInfo>> {
+        if !self.is_sqlite() {
+            return self.query_constraints(table).await;
+        }
+        // SQLite reports the primary key through table_info, not foreign_key_list
+        let (columns, mut constraints) =
+            tokio::try_join!(self.get_columns_impl(table), self.query_constraints(table))?;
+        if let Some(pk) = sqlite_primary_key_constraint(table, &columns) {
+            constraints.insert(0, pk);
+        }
+        Ok(constraints)
+    }
+
+    /// Constraints as reported by the catalog query - all of them on
+    /// PostgreSQL, only foreign keys on SQLite (no primary key).
+    async fn query_constraints(&self, table: &str) -> Result<Vec<ConstraintInfo>> {
         match self.inner.as_ref() {
             PoolInner::Postgres(pool) => {
                 let result = pool
@@ -484,95 +490,9 @@ impl ConnectionPool {
 
                 // PRAGMA foreign_key_list returns: id, seq, table, from, to, on_update, on_delete, match
                 let mut constraints = Vec::new();
-                let mut current_id: Option<i64> = None;
-                let mut current_constraint: Option<ConstraintInfo> = None;
-
                 for row in result.rows {
-                    let mut iter = row.into_iter();
-                    let id = match iter.next() {
-                        Some(SqliteValue::Integer(i)) => i,
-                        _ => continue,
-                    };
-                    let _seq = iter.next();
-                    let ref_table = match iter.next() {
-                        Some(SqliteValue::Text(s)) => s,
-                        _ => continue,
-                    };
-                    let from_col = match iter.next() {
-                        Some(SqliteValue::Text(s)) => s,
-                        _ => continue,
-                    };
-                    let to_col = match iter.next() {
-                        Some(SqliteValue::Text(s)) => s,
-                        _ => continue,
-                    };
-
-                    if current_id != Some(id) {
-                        if let Some(c) = current_constraint.take() {
-                            constraints.push(c);
-                        }
-                        current_id = Some(id);
-                        current_constraint = Some(ConstraintInfo {
-                            name: format!("fk_{}_{}_{}", table, ref_table, id),
-                            constraint_type: "FOREIGN KEY".to_string(),
-                            columns: vec![from_col],
-                            references_table: Some(ref_table),
-                            references_column: Some(to_col),
-                        });
-                    } else if let Some(ref mut c) = current_constraint {
-                        c.columns.push(from_col);
-                    }
+                    push_sqlite_foreign_key_row(&mut constraints, table, row.into_iter());
                 }
-
-                if let Some(c) = current_constraint {
-                    constraints.push(c);
-                }
-
-                // Also detect primary key constraint from table_info
-                let pragma = crate::schema::sqlite_table_info_pragma(table);
-                let pk_result = pool
-                    .query(&pragma, &[])
-                    .await
-                    .map_err(|e| ForeignKeyError::QueryError(e.to_string()))?;
-
-                let pk_columns: Vec<String> = pk_result
-                    .rows
-                    .into_iter()
-                    .filter_map(|row| {
-                        let mut iter = row.into_iter();
-                        let _cid = iter.next();
-                        let name = match iter.next() {
-                            Some(SqliteValue::Text(s)) => s,
-                            _ => return None,
-                        };
-                        let _type = iter.next();
-                        let _notnull = iter.next();
-                        let _default = iter.next();
-                        let pk = match iter.next() {
-                            Some(SqliteValue::Integer(i)) => i,
-                            _ => 0,
-                        };
-                        if pk > 0 {
-                            Some(name)
-                        } else {
-                            None
-                        }
-                    })
-                    .collect();
-
-                if !pk_columns.is_empty() {
-                    constraints.insert(
-                        0,
-                        ConstraintInfo {
-                            name: format!("{}_pkey", table),
-                            constraint_type: "PRIMARY KEY".to_string(),
-                            columns: pk_columns,
-                            references_table: None,
-                            references_column: None,
-                        },
-                    );
-                }
-
                 Ok(constraints)
             }
         }
@@ -580,9 +500,18 @@ impl ConnectionPool {
 
     /// Get full table information including columns, indexes, and constraints
     pub async fn get_table_info_impl(&self, table: &str) -> Result<TableInfo> {
-        let columns = self.get_columns_impl(table).await?;
-        let indexes = self.get_indexes_impl(table).await?;
-        let constraints = self.get_constraints_impl(table).await?;
+        // Independent reads - each takes its own pooled connection
+        let (columns, indexes, mut constraints) = tokio::try_join!(
+            self.get_columns_impl(table),
+            self.get_indexes_impl(table),
+            self.query_constraints(table),
+        )?;
+        // The SQLite primary key comes from the columns already read
+        if self.is_sqlite() {
+            if let Some(pk) = sqlite_primary_key_constraint(table, &columns) {
+                constraints.insert(0, pk);
+            }
+        }
 
         Ok(TableInfo {
             name: table.to_string(),
@@ -591,6 +520,232 @@ impl ConnectionPool {
             constraints,
         })
     }
+
+    /// Get full information for every table, ordered by table name.
+    ///
+    /// On SQLite this takes three statements in total - columns, indexes and
+    /// foreign keys of all tables through the table-valued PRAGMA functions -
+    /// rather than several per table. On PostgreSQL tables are introspected
+    /// concurrently, at most `max_concurrency` at a time so the pool is not
+    /// drained.
+    pub async fn get_schema_impl(&self, max_concurrency: usize) -> Result<Vec<TableInfo>> {
+        let pool = match self.inner.as_ref() {
+            PoolInner::Postgres(_) => return self.get_schema_concurrent(max_concurrency).await,
+            PoolInner::Sqlite(pool) => pool,
+        };
+
+        let query = |sql: &'static str| async move {
+            pool.query(sql, &[])
+                .await
+                .map(|result| result.rows)
+                .map_err(|e| ForeignKeyError::QueryError(e.to_string()))
+        };
+        let (column_rows, index_rows, foreign_key_rows) = tokio::try_join!(
+            query(crate::schema::SQLITE_ALL_COLUMNS_QUERY),
+            query(crate::schema::SQLITE_ALL_INDEXES_QUERY),
+            query(crate::schema::SQLITE_ALL_FOREIGN_KEYS_QUERY),
+        )?;
+
+        // Every table has at least one column, so the column rows define the tables
+        let mut infos: Vec<TableInfo> = Vec::new();
+        let mut positions: HashMap<String, usize> = HashMap::new();
+        for row in column_rows {
+            let mut iter = row.into_iter();
+            let Some(SqliteValue::Text(table)) = iter.next() else {
+                continue;
+            };
+            let position = *positions.entry(table.clone()).or_insert_with(|| {
+                infos.push(TableInfo {
+                    name: table,
+                    columns: Vec::new(),
+                    indexes: Vec::new(),
+                    constraints: Vec::new(),
+                });
+                infos.len() - 1
+            });
+            infos[position].columns.push(sqlite_column_info(iter));
+        }
+
+        for row in index_rows {
+            let mut iter = row.into_iter();
+            if let Some(SqliteValue::Text(table)) = iter.next() {
+                if let Some(&position) = positions.get(&table) {
+                    push_sqlite_index_row(&mut infos[position].indexes, iter);
+                }
+            }
+        }
+
+        for row in foreign_key_rows {
+            let mut iter = row.into_iter();
+            if let Some(SqliteValue::Text(table)) = iter.next() {
+                if let Some(&position) = positions.get(&table) {
+                    let info = &mut infos[position];
+                    push_sqlite_foreign_key_row(&mut info.constraints, &info.name, iter);
+                }
+            }
+        }
+
+        for info in &mut infos {
+            if let Some(pk) = sqlite_primary_key_constraint(&info.name, &info.columns) {
+                info.constraints.insert(0, pk);
+            }
+        }
+
+        Ok(infos)
+    }
+
+    /// Introspect every table concurrently, bounded by a semaphore
+    async fn get_schema_concurrent(&self, max_concurrency: usize) -> Result<Vec<TableInfo>> {
+        let tables = self.get_tables_impl().await?;
+        let limit = Arc::new(Semaphore::new(max_concurrency.max(1)));
+        let mut tasks = JoinSet::new();
+        for (position, table) in tables.into_iter().enumerate() {
+            let pool = self.clone();
+            let limit = Arc::clone(&limit);
+            tasks.spawn(async move {
+                let _permit = limit.acquire_owned().await;
+                pool.get_table_info_impl(&table)
+                    .await
+                    .map(|info| (position, info))
+            });
+        }
+
+        let mut infos = Vec::with_capacity(tasks.len());
+        while let Some(joined) = tasks.join_next().await {
+            infos.push(joined.map_err(|e| ForeignKeyError::QueryError(e.to_string()))??);
+        }
+        // Tasks finish in any order; restore the table-name order
+        infos.sort_unstable_by_key(|(position, _)| *position);
+        Ok(infos.into_iter().map(|(_, info)| info).collect())
+    }
+}
+
+// ============================================================================
+// SQLite Introspection Rows
+// ============================================================================
+
+/// Build a `ColumnInfo` from `table_info` values: name, type, notnull, dflt_value, pk
+fn sqlite_column_info(mut values: impl Iterator<Item = SqliteValue>) -> ColumnInfo {
+    let name = match values.next() {
+        Some(SqliteValue::Text(s)) => s,
+        _ => String::new(),
+    };
+    let data_type = match values.next() {
+        Some(SqliteValue::Text(s)) => s,
+        _ => String::new(),
+    };
+    let notnull = match values.next() {
+        Some(SqliteValue::Integer(i)) => i != 0,
+        _ => false,
+    };
+    let default = match values.next() {
+        Some(SqliteValue::Text(s)) => Some(s),
+        _ => None,
+    };
+    let pk = match values.next() {
+        Some(SqliteValue::Integer(i)) => i != 0,
+        _ => false,
+    };
+    ColumnInfo {
+        name,
+        data_type,
+        nullable: !notnull,
+        default,
+        is_primary_key: pk,
+    }
+}
+
+/// Add one index-list/index-info row (index, unique, origin, column) to `indexes`.
+///
+/// Rows of the same index are adjacent. Indexes SQLite creates for the
+/// primary key are skipped.
+fn push_sqlite_index_row(
+    indexes: &mut Vec<IndexInfo>,
+    mut values: impl Iterator<Item = SqliteValue>,
+) {
+    let name = match values.next() {
+        Some(SqliteValue::Text(s)) => s,
+        _ => return,
+    };
+    let unique = match values.next() {
+        Some(SqliteValue::Integer(i)) => i != 0,
+        _ => false,
+    };
+    if let Some(SqliteValue::Text(origin)) = values.next() {
+        if origin == "pk" {
+            return;
+        }
+    }
+    let column = match values.next() {
+        Some(SqliteValue::Text(s)) => Some(s),
+        _ => None,
+    };
+
+    match indexes.last_mut() {
+        Some(index) if index.name == name => index.columns.extend(column),
+        _ => indexes.push(IndexInfo {
+            name,
+            columns: column.into_iter().collect(),
+            unique,
+        }),
+    }
+}
+
+/// Add one `foreign_key_list` row (id, seq, table, from, to) to `constraints`,
+/// merging the columns of composite foreign keys.
+fn push_sqlite_foreign_key_row(
+    constraints: &mut Vec<ConstraintInfo>,
+    table: &str,
+    mut values: impl Iterator<Item = SqliteValue>,
+) {
+    let id = match values.next() {
+        Some(SqliteValue::Integer(i)) => i,
+        _ => return,
+    };
+    let _seq = values.next();
+    let ref_table = match values.next() {
+        Some(SqliteValue::Text(s)) => s,
+        _ => return,
+    };
+    let from_col = match values.next() {
+        Some(SqliteValue::Text(s)) => s,
+        _ => return,
+    };
+    let to_col = match values.next() {
+        Some(SqliteValue::Text(s)) => s,
+        _ => return,
+    };
+
+    let name = format!("fk_{}_{}_{}", table, ref_table, id);
+    match constraints.last_mut() {
+        Some(constraint) if constraint.name == name => constraint.columns.push(from_col),
+        _ => constraints.push(ConstraintInfo {
+            name,
+            constraint_type: "FOREIGN KEY".to_string(),
+            columns: vec![from_col],
+            references_table: Some(ref_table),
+            references_column: Some(to_col),
+        }),
+    }
+}
+
+/// The primary key constraint implied by a table's columns, if any
+fn sqlite_primary_key_constraint(table: &str, columns: &[ColumnInfo]) -> Option<ConstraintInfo> {
+    let pk_columns: Vec<String> = columns
+        .iter()
+        .filter(|col| col.is_primary_key)
+        .map(|col| col.name.clone())
+        .collect();
+    if pk_columns.is_empty() {
+        return None;
+    }
+    Some(ConstraintInfo {
+        name: format!("{}_pkey", table),
+        constraint_type: "PRIMARY KEY".to_string(),
+        columns: pk_columns,
+        references_table: None,
+        references_column: None,
+    })
 }
 
 // ============================================================================
@@ -689,6 +844,22 @@ fn pg_value_to_row(value: PgValue) -> RowValue {
     }
 }
 
+/// Convert a SQLite driver result into our QueryResult format
+fn sqlite_query_result(result: SqliteQueryResult) -> QueryResult {
+    let lazy_rows: Vec<LazyRow> = result
+        .rows
+        .into_iter()
+        .map(|row| {
+            // Use SmallVec::from_iter for efficient inline storage (avoids heap for ≤16 columns)
+            let values: SmallVec<[RowValue; 16]> =
+                row.into_iter().map(sqlite_value_to_row).collect();
+            LazyRow { values }
+        })
+        .collect();
+
+    QueryResult::from_lazy(lazy_rows, result.columns)
+}
+
 /// Convert SqliteValue to RowValue (hot path)
 #[inline(always)]
 fn sqlite_value_to_row(value: SqliteValue) -> RowValue {
@@ -801,6 +972,40 @@ impl ConnectionPool {
         })
     }
 
+    /// Execute a statement once per parameter set; returns total rows affected
+    fn execute_many<'py>(
+        &self,
+        py: Python<'py>,
+        sql: String,
+        params_seq: Vec<Vec<PyObject>>,
+    ) -> PyResult<Bound<'py, PyAny>> {
+        let pool = self.clone();
+        let param_sets = params_seq
+            .into_iter()
+            .map(|params| convert_py_params(py, params))
+            .collect::<PyResult<Vec<_>>>()?;
+
+        pyo3_async_runtimes::tokio::future_into_py(py, async move {
+            let rows_affected = pool
+                .execute_statement_many(&sql, param_sets)
+                .await
+                .map_err(|e| pyo3::exceptions::PyRuntimeError::new_err(e.to_string()))?;
+            Ok(rows_affected)
+        })
+    }
+
+    /// Execute several `;`-separated statements (DDL, seed data) in one round-trip
+    fn execute_script<'py>(&self, py: Python<'py>, sql: String) -> PyResult<Bound<'py, PyAny>> {
+        let pool = self.clone();
+
+        pyo3_async_runtimes::tokio::future_into_py(py, async move {
+            pool.execute_batch(&sql)
+                .await
+                .map_err(|e| pyo3::exceptions::PyRuntimeError::new_err(e.to_string()))?;
+            Ok(())
+        })
+    }
+
     /// Start a new transaction - returns a Transaction context manager
     fn transaction<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyAny>> {
         let pool_inner = Arc::clone(&self.inner);
@@ -819,13 +1024,24 @@ impl ConnectionPool {
                         .map_err(|e| pyo3::exceptions::PyRuntimeError::new_err(e.to_string()))?;
 
                     Ok(Transaction {
-                        conn: Arc::new(tokio::sync::Mutex::new(Some(conn))),
-                        begun: Arc::new(std::sync::atomic::AtomicBool::new(false)),
+                        inner: Arc::new(tokio::sync::Mutex::new(Some(
+                            TransactionInner::Postgres { conn, begun: false },
+                        ))),
+                    })
+                }
+                PoolInner::Sqlite(pool) => {
+                    // BEGIN IMMEDIATE: take the write lock now rather than on first write
+                    let tx = pool
+                        .begin()
+                        .await
+                        .map_err(|e| pyo3::exceptions::PyRuntimeError::new_err(e.to_string()))?;
+
+                    Ok(Transaction {
+                        inner: Arc::new(tokio::sync::Mutex::new(Some(TransactionInner::Sqlite(
+                            tx,
+                        )))),
                     })
                 }
-                PoolInner::Sqlite(_) => Err(pyo3::exceptions::PyRuntimeError::new_err(
-                    "SQLite transactions not yet implemented",
-                )),
             }
         })
     }
@@ -847,6 +1063,19 @@ impl ConnectionPool {
     // Schema Introspection - Python Interface
     // ========================================================================
 
+    /// Check whether a table exists
+    fn table_exists<'py>(&self, py: Python<'py>, table: String) -> PyResult<Bound<'py, PyAny>> {
+        let pool = self.clone();
+
+        pyo3_async_runtimes::tokio::future_into_py(py, async move {
+            let exists = pool
+                .table_exists_impl(&table)
+                .await
+                .map_err(|e| pyo3::exceptions::PyRuntimeError::new_err(e.to_string()))?;
+            Ok(exists)
+        })
+    }
+
     /// Get all table names in the database
     fn get_tables<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyAny>> {
         let pool = self.clone();
@@ -873,6 +1102,32 @@ impl ConnectionPool {
         })
     }
 
+    /// Get column information for a table as a dict keyed by column name
+    ///
+    /// Keys keep the table's column order, so lookups by name are O(1)
+    /// without losing the ordering `get_columns` provides.
+    fn get_columns_by_name<'py>(
+        &self,
+        py: Python<'py>,
+        table: String,
+    ) -> PyResult<Bound<'py, PyAny>> {
+        let pool = self.clone();
+
+        pyo3_async_runtimes::tokio::future_into_py(py, async move {
+            let columns = pool
+                .get_columns_impl(&table)
+                .await
+                .map_err(|e| pyo3::exceptions::PyRuntimeError::new_err(e.to_string()))?;
+            Python::with_gil(|py| {
+                let by_name = pyo3::types::PyDict::new(py);
+                for column in columns {
+                    by_name.set_item(column.name.clone(), column)?;
+                }
+                Ok(by_name.unbind())
+            })
+        })
+    }
+
     /// Get index information for a table
     fn get_indexes<'py>(&self, py: Python<'py>, table: String) -> PyResult<Bound<'py, PyAny>> {
         let pool = self.clone();
@@ -911,6 +1166,27 @@ impl ConnectionPool {
             Ok(info)
         })
     }
+
+    /// Get full information for every table (columns, indexes, constraints)
+    ///
+    /// `max_concurrency` caps how many tables are introspected at once on
+    /// PostgreSQL; SQLite always uses three whole-schema statements.
+    #[pyo3(signature = (max_concurrency=DEFAULT_SCHEMA_CONCURRENCY))]
+    fn get_schema<'py>(
+        &self,
+        py: Python<'py>,
+        max_concurrency: usize,
+    ) -> PyResult<Bound<'py, PyAny>> {
+        let pool = self.clone();
+
+        pyo3_async_runtimes::tokio::future_into_py(py, async move {
+            let infos = pool
+                .get_schema_impl(max_concurrency)
+                .await
+                .map_err(|e| pyo3::exceptions::PyRuntimeError::new_err(e.to_string()))?;
+            Ok(infos)
+        })
+    }
 }
 
 /// SQL parameter types
@@ -931,6 +1207,17 @@ pub enum SqlParam {
 // Transaction Support
 // ============================================================================
 
+/// Driver-specific state of an open transaction.
+enum TransactionInner {
+    /// Dedicated connection, and whether the deferred BEGIN response was consumed
+    Postgres {
+        conn: PgPooledConnection,
+        begun: bool,
+    },
+    /// `BEGIN IMMEDIATE` transaction holding the SQLite writer connection
+    Sqlite(SqliteTransaction),
+}
+
 /// A database transaction context manager.
 ///
 /// This is used as an async context manager in Python:
@@ -946,12 +1233,17 @@ pub enum SqlParam {
 /// - First execute() sends BEGIN + query together
 /// - Subsequent queries skip ReadyForQuery wait (use Flush not Sync)
 /// - Only COMMIT/ROLLBACK sends Sync to finalize
+///
+/// On SQLite the transaction is opened with `BEGIN IMMEDIATE` on the writer
+/// connection and holds it until commit/rollback.
 #[pyclass]
 pub struct Transaction {
-    /// The dedicated connection for this transaction
-    conn: Arc<tokio::sync::Mutex<Option<PgPooledConnection>>>,
-    /// Whether BEGIN response has been consumed
-    begun: Arc<std::sync::atomic::AtomicBool>,
+    /// `None` once the transaction has been committed or rolled back
+    inner: Arc<tokio::sync::Mutex<Option<TransactionInner>>>,
+}
+
+fn transaction_not_active() -> PyErr {
+    pyo3::exceptions::PyRuntimeError::new_err("Transaction not active")
 }
 
 #[pymethods]
@@ -960,8 +1252,7 @@ impl Transaction {
     fn __aenter__<'py>(slf: PyRef<'py, Self>, py: Python<'py>) -> PyResult<Bound<'py, PyAny>> {
         // Return self - BEGIN is buffered but not sent yet
         let tx = Transaction {
-            conn: Arc::clone(&slf.conn),
-            begun: Arc::clone(&slf.begun),
+            inner: Arc::clone(&slf.inner),
         };
         pyo3_async_runtimes::tokio::future_into_py(py, async move { Ok(tx) })
     }
@@ -976,27 +1267,36 @@ impl Transaction {
         _exc_tb: Option<PyObject>,
     ) -> PyResult<Bound<'py, PyAny>> {
         let has_exception = exc_type.is_some();
-        let conn = Arc::clone(&self.conn);
+        let inner = Arc::clone(&self.inner);
 
         pyo3_async_runtimes::tokio::future_into_py(py, async move {
-            let mut guard = conn.lock().await;
-            if let Some(ref mut c) = *guard {
-                if has_exception {
-                    // Rollback on exception - includes Sync
-                    let _ = c.rollback().await;
-                } else {
-                    // Commit - includes Sync
-                    c.commit().await.map_err(|e| {
-                        pyo3::exceptions::PyRuntimeError::new_err(format!(
-                            "Failed to commit: {}",
-                            e
-                        ))
-                    })?;
+            // Taking the state out releases the connection (and its pool permit)
+            // once it has been committed or rolled back
+            let state = inner.lock().await.take();
+            let committed = match state {
+                Some(TransactionInner::Postgres { mut conn, .. }) => {
+                    if has_exception {
+                        // Rollback on exception - includes Sync
+                        let _ = conn.rollback().await;
+                        Ok(())
+                    } else {
+                        // Commit - includes Sync
+                        conn.commit().await.map_err(|e| e.to_string())
+                    }
                 }
-            }
-            // Take the connection out of the Option so it gets dropped,
-            // returning the semaphore permit to the pool
-            let _ = guard.take();
+                Some(TransactionInner::Sqlite(tx)) => {
+                    if has_exception {
+                        let _ = tx.rollback().await;
+                        Ok(())
+                    } else {
+                        tx.commit().await.map_err(|e| e.to_string())
+                    }
+                }
+                None => Ok(()),
+            };
+            committed.map_err(|e| {
+                pyo3::exceptions::PyRuntimeError::new_err(format!("Failed to commit: {}", e))
+            })?;
             // Return False to not suppress exceptions
             Ok(false)
         })
@@ -1004,8 +1304,8 @@ impl Transaction {
 
     /// Execute a query within the transaction
     ///
-    /// First call sends buffered BEGIN + query together (deferred BEGIN).
-    /// Subsequent calls use query_no_sync() - skips ReadyForQuery wait.
+    /// PostgreSQL: the first call sends buffered BEGIN + query together
+    /// (deferred BEGIN); subsequent calls skip the ReadyForQuery wait.
     #[pyo3(signature = (sql, params=None))]
     fn execute<'py>(
         &self,
@@ -1014,40 +1314,86 @@ impl Transaction {
         params: Option<Vec<PyObject>>,
     ) -> PyResult<Bound<'py, PyAny>> {
         let sql_params = convert_py_params(py, params.unwrap_or_default())?;
-        let conn = Arc::clone(&self.conn);
-        let begun = Arc::clone(&self.begun);
+        let inner = Arc::clone(&self.inner);
 
         pyo3_async_runtimes::tokio::future_into_py(py, async move {
-            let mut guard = conn.lock().await;
-            let c = guard.as_mut().ok_or_else(|| {
-                pyo3::exceptions::PyRuntimeError::new_err("Transaction not active")
-            })?;
-
-            // On first query, we need to consume BEGIN response after flush
-            let is_first = !begun.swap(true, std::sync::atomic::Ordering::SeqCst);
+            let mut guard = inner.lock().await;
+            match guard.as_mut().ok_or_else(transaction_not_active)? {
+                TransactionInner::Postgres { conn, begun } => {
+                    // On first query, we need to consume BEGIN response after flush
+                    let is_first = !std::mem::replace(begun, true);
+
+                    let pg_params: Vec<PgValue> =
+                        sql_params.into_iter().map(sql_param_to_pg).collect();
+
+                    // Execute query, consuming deferred BEGIN on first call
+                    let result = conn
+                        .query_in_transaction(&sql, &pg_params, is_first)
+                        .await
+                        .map_err(|e| pyo3::exceptions::PyRuntimeError::new_err(e.to_string()))?;
 
-            let pg_params: Vec<PgValue> = sql_params.into_iter().map(sql_param_to_pg).collect();
+                    // Convert to our QueryResult format - extract column names from Arc<Vec<FieldDescription>>
+                    let columns: Vec<String> =
+                        result.columns.iter().map(|f| f.name.clone()).collect();
 
-            // Execute query, consuming deferred BEGIN on first call
-            let result = c
-                .query_in_transaction(&sql, &pg_params, is_first)
-                .await
-                .map_err(|e| pyo3::exceptions::PyRuntimeError::new_err(e.to_string()))?;
+                    let lazy_rows: Vec<LazyRow> = result
+                        .rows
+                        .into_iter()
+                        .map(|row| {
+                            let values: SmallVec<[RowValue; 16]> =
+                                row.into_iter().map(pg_value_to_row).collect();
+                            LazyRow { values }
+                        })
+                        .collect();
 
-            // Convert to our QueryResult format - extract column names from Arc<Vec<FieldDescription>>
-            let columns: Vec<String> = result.columns.iter().map(|f| f.name.clone()).collect();
+                    Ok(QueryResult::from_lazy(lazy_rows, columns))
+                }
+                TransactionInner::Sqlite(tx) => {
+                    let sqlite_params: Vec<SqliteValue> =
+                        sql_params.into_iter().map(sql_param_to_sqlite).collect();
+                    let result = tx
+                        .query(&sql, &sqlite_params)
+                        .await
+                        .map_err(|e| pyo3::exceptions::PyRuntimeError::new_err(e.to_string()))?;
+                    Ok(sqlite_query_result(result))
+                }
+            }
+        })
+    }
 
-            let lazy_rows: Vec<LazyRow> = result
-                .rows
-                .into_iter()
-                .map(|row| {
-                    let values: SmallVec<[RowValue; 16]> =
-                        row.into_iter().map(pg_value_to_row).collect();
-                    LazyRow { values }
-                })
-                .collect();
+    /// Execute a statement that doesn't return rows within the transaction
+    #[pyo3(signature = (sql, params=None))]
+    fn execute_statement_py<'py>(
+        &self,
+        py: Python<'py>,
+        sql: String,
+        params: Option<Vec<PyObject>>,
+    ) -> PyResult<Bound<'py, PyAny>> {
+        let sql_params = convert_py_params(py, params.unwrap_or_default())?;
+        let inner = Arc::clone(&self.inner);
 
-            Ok(QueryResult::from_lazy(lazy_rows, columns))
+        pyo3_async_runtimes::tokio::future_into_py(py, async move {
+            let mut guard = inner.lock().await;
+            let rows_affected = match guard.as_mut().ok_or_else(transaction_not_active)? {
+                TransactionInner::Postgres { conn, begun } => {
+                    let is_first = !std::mem::replace(begun, true);
+                    let pg_params: Vec<PgValue> =
+                        sql_params.into_iter().map(sql_param_to_pg).collect();
+                    let result = conn
+                        .query_in_transaction(&sql, &pg_params, is_first)
+                        .await
+                        .map_err(|e| pyo3::exceptions::PyRuntimeError::new_err(e.to_string()))?;
+                    parse_rows_affected(&result.command_tag)
+                }
+                TransactionInner::Sqlite(tx) => {
+                    let sqlite_params: Vec<SqliteValue> =
+                        sql_params.into_iter().map(sql_param_to_sqlite).collect();
+                    tx.execute(&sql, &sqlite_params)
+                        .await
+                        .map_err(|e| pyo3::exceptions::PyRuntimeError::new_err(e.to_string()))?
+                }
+            };
+            Ok(rows_affected)
         })
     }
 
@@ -1069,33 +1415,42 @@ impl Transaction {
             .map(|params| convert_py_params(py, params))
             .collect::<PyResult<Vec<_>>>()?;
 
-        let conn = Arc::clone(&self.conn);
+        let inner = Arc::clone(&self.inner);
 
         pyo3_async_runtimes::tokio::future_into_py(py, async move {
-            let mut guard = conn.lock().await;
-            let c = guard.as_mut().ok_or_else(|| {
-                pyo3::exceptions::PyRuntimeError::new_err("Transaction not active")
-            })?;
+            let mut guard = inner.lock().await;
+            match guard.as_mut().ok_or_else(transaction_not_active)? {
+                TransactionInner::Postgres { conn, .. } => {
+                    let count = all_params.len();
+
+                    // Send all queries without syncing
+                    let mut results = Vec::with_capacity(count);
+                    for params in all_params {
+                        let pg_params: Vec<PgValue> =
+                            params.into_iter().map(sql_param_to_pg).collect();
+                        let result = conn.query_no_sync(&sql, &pg_params).await.map_err(|e| {
+                            pyo3::exceptions::PyRuntimeError::new_err(e.to_string())
+                        })?;
+                        results.push(result);
+                    }
 
-            let count = all_params.len();
+                    // Sync to ensure all commands are processed
+                    conn.sync()
+                        .await
+                        .map_err(|e| pyo3::exceptions::PyRuntimeError::new_err(e.to_string()))?;
 
-            // Send all queries without syncing
-            let mut results = Vec::with_capacity(count);
-            for params in all_params {
-                let pg_params: Vec<PgValue> = params.into_iter().map(sql_param_to_pg).collect();
-                let result = c
-                    .query_no_sync(&sql, &pg_params)
-                    .await
-                    .map_err(|e| pyo3::exceptions::PyRuntimeError::new_err(e.to_string()))?;
-                results.push(result);
+                    Ok(count as u64)
+                }
+                TransactionInner::Sqlite(tx) => {
+                    let param_sets: Vec<Vec<SqliteValue>> = all_params
+                        .into_iter()
+                        .map(|params| params.into_iter().map(sql_param_to_sqlite).collect())
+                        .collect();
+                    tx.execute_many(&sql, param_sets)
+                        .await
+                        .map_err(|e| pyo3::exceptions::PyRuntimeError::new_err(e.to_string()))
+                }
             }
-
-            // Sync to ensure all commands are processed
-            c.sync()
-                .await
-                .map_err(|e| pyo3::exceptions::PyRuntimeError::new_err(e.to_string()))?;
-
-            Ok(count as u64)
         })
     }
 }
@@ -122,6 +122,15 @@ WHERE table_schema = 'public'
 ORDER BY table_name
 "#;
 
+/// Query to check whether a PostgreSQL table exists ($1 = table name)
+pub const PG_TABLE_EXISTS_QUERY: &str = r#"
+SELECT 1
+FROM information_schema.tables
+WHERE table_schema = 'public'
+  AND table_type = 'BASE TABLE'
+  AND table_name = $1
+"#;
+
 /// Query to get column information for a PostgreSQL table
 pub const PG_COLUMNS_QUERY: &str = r#"
 SELECT
@@ -191,10 +200,18 @@ pub const SQLITE_TABLES_QUERY: &str = r#"
 SELECT name
 FROM sqlite_master
 WHERE type = 'table'
-  AND name NOT LIKE 'sqlite_%'
+  AND name NOT LIKE 'sqlite\_%' ESCAPE '\'
 ORDER BY name
 "#;
 
+/// Query to check whether a SQLite table exists (?1 = table name)
+pub const SQLITE_TABLE_EXISTS_QUERY: &str = r#"
+SELECT 1
+FROM sqlite_master
+WHERE type = 'table'
+  AND name = ?1
+"#;
+
 /// SQLite PRAGMA for table info - returns columns with type, notnull, pk, dflt_value
 pub fn sqlite_table_info_pragma(table: &str) -> String {
     format!("PRAGMA table_info('{}')", table)
@@ -214,3 +231,45 @@ pub fn sqlite_index_info_pragma(index: &str) -> String {
 pub fn sqlite_foreign_key_list_pragma(table: &str) -> String {
     format!("PRAGMA foreign_key_list('{}')", table)
 }
+
+/// Indexes of one table (`?1`) with their columns, one row per indexed column.
+///
+/// Joins the table-valued PRAGMA functions so a table's indexes take one
+/// statement instead of one `PRAGMA index_info` per index.
+pub const SQLITE_INDEXES_QUERY: &str = r#"
+SELECT il.name, il."unique", il.origin, ii.name
+FROM pragma_index_list(?1) AS il
+LEFT JOIN pragma_index_info(il.name) AS ii
+ORDER BY il.seq, ii.seqno
+"#;
+
+/// Columns of every user table: table, name, type, notnull, dflt_value, pk
+pub const SQLITE_ALL_COLUMNS_QUERY: &str = r#"
+SELECT m.name, p.name, p.type, p."notnull", p.dflt_value, p.pk
+FROM sqlite_master AS m
+JOIN pragma_table_info(m.name) AS p
+WHERE m.type = 'table'
+  AND m.name NOT LIKE 'sqlite\_%' ESCAPE '\'
+ORDER BY m.name, p.cid
+"#;
+
+/// Indexes of every user table: table, index, unique, origin, column
+pub const SQLITE_ALL_INDEXES_QUERY: &str = r#"
+SELECT m.name, il.name, il."unique", il.origin, ii.name
+FROM sqlite_master AS m
+JOIN pragma_index_list(m.name) AS il
+LEFT JOIN pragma_index_info(il.name) AS ii
+WHERE m.type = 'table'
+  AND m.name NOT LIKE 'sqlite\_%' ESCAPE '\'
+ORDER BY m.name, il.seq, ii.seqno
+"#;
+
+/// Foreign keys of every user table: table, id, referenced table, from, to
+pub const SQLITE_ALL_FOREIGN_KEYS_QUERY: &str = r#"
+SELECT m.name, fk.id, fk.seq, fk."table", fk."from", fk."to"
+FROM sqlite_master AS m
+JOIN pragma_foreign_key_list(m.name) AS fk
+WHERE m.type = 'table'
+  AND m.name NOT LIKE 'sqlite\_%' ESCAPE '\'
+ORDER BY m.name, fk.id, fk.seq
+"#;
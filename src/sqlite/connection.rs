@@ -5,6 +5,10 @@ use tokio_rusqlite::Connection;
 use super::error::{SqliteError, SqliteResult};
 use super::types::SqliteValue;
 
+/// Prepared statements kept per connection (rusqlite defaults to 16).
+/// ORM-generated SQL is a small set of templates reused across calls.
+const STATEMENT_CACHE_CAPACITY: usize = 128;
+
 /// Result of a query execution.
 #[derive(Debug)]
 pub struct QueryResult {
@@ -49,6 +53,12 @@ impl SqliteConnection {
             Connection::open(&path).await?
         };
 
+        conn.call(|c| {
+            c.set_prepared_statement_cache_capacity(STATEMENT_CACHE_CAPACITY);
+            Ok(())
+        })
+        .await?;
+
         // Enable performance pragmas for file-based databases
         if !is_memory {
             conn.call(|c| {
@@ -56,6 +66,7 @@ impl SqliteConnection {
                     "PRAGMA journal_mode=WAL;
                      PRAGMA synchronous=NORMAL;
                      PRAGMA busy_timeout=5000;
+                     PRAGMA temp_store=MEMORY;
                      PRAGMA cache_size=-64000;", // 64MB cache
                 )?;
                 Ok(())
@@ -116,6 +127,7 @@ impl SqliteConnection {
     }
 
     /// Execute a statement that doesn't return rows.
+    /// Shares the prepared statement cache with `query`.
     pub async fn execute(&self, sql: &str, params: &[SqliteValue]) -> SqliteResult<u64> {
         if self.closed {
             return Err(SqliteError::ConnectionClosed);
@@ -129,13 +141,48 @@ impl SqliteConnection {
                 let params_refs: Vec<&dyn rusqlite::ToSql> =
                     params.iter().map(|p| p as &dyn rusqlite::ToSql).collect();
 
-                let rows_affected = conn.execute(&sql, params_refs.as_slice())?;
+                let mut stmt = conn.prepare_cached(&sql)?;
+                let rows_affected = stmt.execute(params_refs.as_slice())?;
                 Ok(rows_affected as u64)
             })
             .await
             .map_err(SqliteError::from)
     }
 
+    /// Execute one statement once per parameter set.
+    ///
+    /// The statement is prepared once and the whole batch runs inside a
+    /// savepoint, so it is atomic and also nests inside an open transaction.
+    pub async fn execute_many(
+        &self,
+        sql: &str,
+        param_sets: Vec<Vec<SqliteValue>>,
+    ) -> SqliteResult<u64> {
+        if self.closed {
+            return Err(SqliteError::ConnectionClosed);
+        }
+
+        let sql = sql.to_string();
+
+        self.conn
+            .call(move |conn| {
+                let savepoint = conn.savepoint()?;
+                let mut rows_affected = 0u64;
+                {
+                    let mut stmt = savepoint.prepare_cached(&sql)?;
+                    for params in &param_sets {
+                        let params_refs: Vec<&dyn rusqlite::ToSql> =
+                            params.iter().map(|p| p as &dyn rusqlite::ToSql).collect();
+                        rows_affected += stmt.execute(params_refs.as_slice())? as u64;
+                    }
+                }
+                savepoint.commit()?;
+                Ok(rows_affected)
+            })
+            .await
+            .map_err(SqliteError::from)
+    }
+
     /// Execute multiple statements (for DDL, etc.).
     pub async fn execute_batch(&self, sql: &str) -> SqliteResult<()> {
         if self.closed {
@@ -16,5 +16,5 @@ mod tests;
 pub use connection::SqliteConnection;
 #[allow(unused_imports)]
 pub use error::{SqliteError, SqliteResult};
-pub use pool::{SqlitePool, SqlitePoolConfig};
+pub use pool::{SqlitePool, SqlitePoolConfig, SqliteTransaction};
 pub use types::SqliteValue;
@@ -37,6 +37,8 @@ impl SqlitePoolConfig {
 /// A pooled connection.
 pub struct PooledConnection {
     conn: Option<SqliteConnection>,
+    /// How many of the pool's recorded PRAGMAs this connection has run.
+    pragmas_applied: usize,
     pool: Arc<SqlitePoolInner>,
     _permit: OwnedSemaphorePermit,
 }
@@ -57,13 +59,36 @@ impl PooledConnection {
             .execute(sql, params)
             .await
     }
+
+    pub async fn execute_batch(&self, sql: &str) -> SqliteResult<()> {
+        self.conn
+            .as_ref()
+            .ok_or(SqliteError::ConnectionClosed)?
+            .execute_batch(sql)
+            .await
+    }
+
+    pub async fn execute_many(
+        &self,
+        sql: &str,
+        param_sets: Vec<Vec<SqliteValue>>,
+    ) -> SqliteResult<u64> {
+        self.conn
+            .as_ref()
+            .ok_or(SqliteError::ConnectionClosed)?
+            .execute_many(sql, param_sets)
+            .await
+    }
 }
 
 impl Drop for PooledConnection {
     fn drop(&mut self) {
         if let Some(conn) = self.conn.take() {
             if !conn.is_closed() {
-                self.pool.idle_connections.lock().push(conn);
+                self.pool
+                    .idle_connections
+                    .lock()
+                    .push((conn, self.pragmas_applied));
             }
         }
     }
@@ -71,8 +96,17 @@ impl Drop for PooledConnection {
 
 struct SqlitePoolInner {
     config: SqlitePoolConfig,
-    idle_connections: Mutex<Vec<SqliteConnection>>,
+    idle_connections: Mutex<Vec<(SqliteConnection, usize)>>,
     semaphore: Arc<Semaphore>,
+    /// Connection-level PRAGMA assignments issued through `execute`, replayed
+    /// on every other connection as it is opened or next acquired.
+    pragmas: Mutex<Vec<String>>,
+    /// Dedicated write connection for file databases. SQLite allows one writer
+    /// at a time, so writes queue here instead of contending (SQLITE_BUSY) on
+    /// the read connections; in WAL mode readers keep running alongside it.
+    /// `None` for in-memory pools, whose single connection handles everything.
+    /// Emptied by `close()`.
+    writer: Option<Arc<tokio::sync::Mutex<Option<SqliteConnection>>>>,
 }
 
 /// SQLite connection pool.
@@ -84,10 +118,27 @@ pub struct SqlitePool {
 impl SqlitePool {
     /// Create a new connection pool.
     pub async fn connect(config: SqlitePoolConfig) -> SqliteResult<Self> {
+        // Every `:memory:` connection is its own empty database, so an in-memory
+        // pool must funnel all queries through the one connection holding the data
+        let is_memory = config.path == ":memory:";
+        let max_connections = if is_memory {
+            1
+        } else {
+            config.max_read_connections as usize
+        };
+        let writer = if is_memory {
+            None
+        } else {
+            Some(Arc::new(tokio::sync::Mutex::new(Some(
+                SqliteConnection::open(&config.path).await?,
+            ))))
+        };
         let inner = Arc::new(SqlitePoolInner {
-            semaphore: Arc::new(Semaphore::new(config.max_read_connections as usize)),
+            semaphore: Arc::new(Semaphore::new(max_connections)),
             config,
             idle_connections: Mutex::new(Vec::new()),
+            pragmas: Mutex::new(Vec::new()),
+            writer,
         });
 
         let pool = Self { inner };
@@ -114,51 +165,298 @@ impl SqlitePool {
             idle.pop()
         };
 
-        let conn = match conn {
-            Some(c) if !c.is_closed() => c,
+        let (conn, pragmas_applied) = match conn {
+            Some((c, applied)) if !c.is_closed() => {
+                let applied = self.apply_pragmas(&c, applied).await?;
+                (c, applied)
+            }
             _ => self.create_connection().await?,
         };
 
         Ok(PooledConnection {
             conn: Some(conn),
+            pragmas_applied,
             pool: Arc::clone(&self.inner),
             _permit: permit,
         })
     }
 
-    /// Execute a query on a pooled connection.
+    /// Execute a query: SELECTs on a read connection, anything else (e.g.
+    /// `INSERT ... RETURNING`) on the writer.
     pub async fn query(&self, sql: &str, params: &[SqliteValue]) -> SqliteResult<QueryResult> {
+        if let Some(writer) = &self.inner.writer {
+            if !is_read_only(sql) {
+                let writer = writer.lock().await;
+                return writer_conn(&writer)?.query(sql, params).await;
+            }
+        }
         let conn = self.acquire().await?;
         conn.query(sql, params).await
     }
 
-    /// Execute a statement on a pooled connection.
+    /// Execute a statement on the write connection.
+    ///
+    /// PRAGMA assignments are recorded and replayed on the read connections,
+    /// since they only affect the connection that runs them.
     pub async fn execute(&self, sql: &str, params: &[SqliteValue]) -> SqliteResult<u64> {
+        if is_pragma_assignment(sql) {
+            self.inner.pragmas.lock().push(sql.to_string());
+        }
+        if let Some(writer) = &self.inner.writer {
+            let writer = writer.lock().await;
+            return writer_conn(&writer)?.execute(sql, params).await;
+        }
         let conn = self.acquire().await?;
         conn.execute(sql, params).await
     }
 
+    /// Execute several `;`-separated statements on the write connection.
+    ///
+    /// A batch made up only of PRAGMA assignments is recorded like `execute`.
+    pub async fn execute_batch(&self, sql: &str) -> SqliteResult<()> {
+        let mut statements = sql.split(';').filter(|s| !s.trim().is_empty()).peekable();
+        if statements.peek().is_some() && statements.all(is_pragma_assignment) {
+            self.inner.pragmas.lock().push(sql.to_string());
+        }
+        if let Some(writer) = &self.inner.writer {
+            let writer = writer.lock().await;
+            return writer_conn(&writer)?.execute_batch(sql).await;
+        }
+        let conn = self.acquire().await?;
+        conn.execute_batch(sql).await
+    }
+
+    /// Execute one statement for each parameter set (always on the writer).
+    pub async fn execute_many(
+        &self,
+        sql: &str,
+        param_sets: Vec<Vec<SqliteValue>>,
+    ) -> SqliteResult<u64> {
+        if let Some(writer) = &self.inner.writer {
+            let writer = writer.lock().await;
+            return writer_conn(&writer)?.execute_many(sql, param_sets).await;
+        }
+        let conn = self.acquire().await?;
+        conn.execute_many(sql, param_sets).await
+    }
+
+    /// Begin a transaction with `BEGIN IMMEDIATE`.
+    ///
+    /// The write lock is taken up front, so statements inside the transaction
+    /// never hit SQLITE_BUSY when a read would otherwise be promoted to a
+    /// write. The transaction holds the writer (or, for in-memory pools, the
+    /// only connection) until it is committed or rolled back.
+    pub async fn begin(&self) -> SqliteResult<SqliteTransaction> {
+        let conn = match &self.inner.writer {
+            Some(writer) => TransactionConnection::Writer(Arc::clone(writer).lock_owned().await),
+            None => TransactionConnection::Pooled(self.acquire().await?),
+        };
+        // Transaction control goes through `execute` so BEGIN/COMMIT/ROLLBACK
+        // are prepared once per connection and reused from its statement cache
+        conn.get()?.execute("BEGIN IMMEDIATE", &[]).await?;
+        Ok(SqliteTransaction { conn: Some(conn) })
+    }
+
     /// Close all connections.
+    ///
+    /// Waits for the writer to be released by any open transaction first.
     pub async fn close(&self) {
         let connections = {
             let mut idle = self.inner.idle_connections.lock();
             std::mem::take(&mut *idle)
         };
 
-        for conn in connections {
+        for (conn, _) in connections {
             let _ = conn.close().await;
         }
+
+        if let Some(writer) = &self.inner.writer {
+            if let Some(conn) = writer.lock().await.take() {
+                let _ = conn.close().await;
+            }
+        }
+    }
+
+    /// Open a read connection with the recorded PRAGMAs already applied.
+    async fn create_connection(&self) -> SqliteResult<(SqliteConnection, usize)> {
+        let conn = SqliteConnection::open(&self.inner.config.path).await?;
+        let applied = self.apply_pragmas(&conn, 0).await?;
+        Ok((conn, applied))
     }
 
-    async fn create_connection(&self) -> SqliteResult<SqliteConnection> {
-        SqliteConnection::open(&self.inner.config.path).await
+    /// Run the PRAGMAs recorded since `applied` on `conn`; returns the new count.
+    async fn apply_pragmas(&self, conn: &SqliteConnection, applied: usize) -> SqliteResult<usize> {
+        let (pending, total) = {
+            let pragmas = self.inner.pragmas.lock();
+            if pragmas.len() == applied {
+                return Ok(applied);
+            }
+            (pragmas[applied..].join(";\n"), pragmas.len())
+        };
+        conn.execute_batch(&pending).await?;
+        Ok(total)
     }
 }
 
+/// Connection held for the lifetime of a transaction.
+enum TransactionConnection {
+    Writer(tokio::sync::OwnedMutexGuard<Option<SqliteConnection>>),
+    Pooled(PooledConnection),
+}
+
+impl TransactionConnection {
+    fn get(&self) -> SqliteResult<&SqliteConnection> {
+        match self {
+            Self::Writer(guard) => writer_conn(guard),
+            Self::Pooled(pooled) => pooled.conn.as_ref().ok_or(SqliteError::ConnectionClosed),
+        }
+    }
+}
+
+/// An open `BEGIN IMMEDIATE` transaction.
+///
+/// Every statement runs on the transaction's connection, reads included, so
+/// uncommitted writes are visible to later queries in the same transaction.
+/// Dropping it without `commit()`/`rollback()` rolls back in the background.
+pub struct SqliteTransaction {
+    conn: Option<TransactionConnection>,
+}
+
+impl SqliteTransaction {
+    fn conn(&self) -> SqliteResult<&SqliteConnection> {
+        self.conn
+            .as_ref()
+            .ok_or(SqliteError::ConnectionClosed)?
+            .get()
+    }
+
+    pub async fn query(&self, sql: &str, params: &[SqliteValue]) -> SqliteResult<QueryResult> {
+        self.conn()?.query(sql, params).await
+    }
+
+    pub async fn execute(&self, sql: &str, params: &[SqliteValue]) -> SqliteResult<u64> {
+        self.conn()?.execute(sql, params).await
+    }
+
+    pub async fn execute_many(
+        &self,
+        sql: &str,
+        param_sets: Vec<Vec<SqliteValue>>,
+    ) -> SqliteResult<u64> {
+        self.conn()?.execute_many(sql, param_sets).await
+    }
+
+    /// Commit and release the connection.
+    pub async fn commit(mut self) -> SqliteResult<()> {
+        let conn = self.conn.take().ok_or(SqliteError::ConnectionClosed)?;
+        let result = conn.get()?.execute("COMMIT", &[]).await.map(|_| ());
+        if result.is_err() {
+            // Leave the connection clean for its next user
+            let _ = conn.get()?.execute("ROLLBACK", &[]).await;
+        }
+        result
+    }
+
+    /// Roll back and release the connection.
+    pub async fn rollback(mut self) -> SqliteResult<()> {
+        let conn = self.conn.take().ok_or(SqliteError::ConnectionClosed)?;
+        conn.get()?.execute("ROLLBACK", &[]).await.map(|_| ())
+    }
+}
+
+impl Drop for SqliteTransaction {
+    fn drop(&mut self) {
+        if let Some(conn) = self.conn.take() {
+            if let Ok(handle) = tokio::runtime::Handle::try_current() {
+                handle.spawn(async move {
+                    if let Ok(c) = conn.get() {
+                        let _ = c.execute("ROLLBACK", &[]).await;
+                    }
+                });
+            }
+        }
+    }
+}
+
+/// The writer connection, unless the pool has been closed.
+fn writer_conn(writer: &Option<SqliteConnection>) -> SqliteResult<&SqliteConnection> {
+    writer.as_ref().ok_or(SqliteError::ConnectionClosed)
+}
+
+/// Whether a statement sets a connection-level PRAGMA (`PRAGMA name = value`).
+fn is_pragma_assignment(sql: &str) -> bool {
+    let sql = sql.trim_start();
+    sql.get(..6)
+        .is_some_and(|keyword| keyword.eq_ignore_ascii_case("pragma"))
+        && sql.contains('=')
+}
+
+/// Whether a statement only reads, so it can run on a read connection.
+///
+/// Conservative: only plain `SELECT` counts; `WITH` may prefix a write.
+fn is_read_only(sql: &str) -> bool {
+    sql.trim_start()
+        .get(..6)
+        .is_some_and(|keyword| keyword.eq_ignore_ascii_case("select"))
+}
+
 #[cfg(test)]
 mod tests {
     use super::*;
 
+    #[test]
+    fn test_is_read_only() {
+        assert!(is_read_only("SELECT * FROM t"));
+        assert!(is_read_only("  select 1"));
+        assert!(!is_read_only("INSERT INTO t VALUES (1) RETURNING *"));
+        assert!(!is_read_only("WITH x AS (SELECT 1) DELETE FROM t"));
+        assert!(!is_read_only("sel"));
+    }
+
+    #[test]
+    fn test_is_pragma_assignment() {
+        assert!(is_pragma_assignment("PRAGMA foreign_keys = ON"));
+        assert!(is_pragma_assignment("  pragma cache_size=-2000"));
+        assert!(!is_pragma_assignment("PRAGMA table_info('t')"));
+        assert!(!is_pragma_assignment("UPDATE t SET x = 1"));
+    }
+
+    #[tokio::test]
+    async fn test_pragmas_reach_read_connections() {
+        let path = std::env::temp_dir().join(format!("ormkit_pragmas_{}.db", std::process::id()));
+        let path = path.to_str().unwrap().to_string();
+        let pool = SqlitePool::connect(SqlitePoolConfig::new(&path))
+            .await
+            .unwrap();
+
+        // Readers idle or checked out when the PRAGMA is issued, and readers
+        // opened after it, all end up running it
+        let idle = pool.acquire().await.unwrap();
+        let busy = pool.acquire().await.unwrap();
+        drop(idle);
+        pool.execute("PRAGMA foreign_keys = ON", &[]).await.unwrap();
+        drop(busy);
+        let readers = [
+            pool.acquire().await.unwrap(),
+            pool.acquire().await.unwrap(),
+            pool.acquire().await.unwrap(),
+        ];
+        for conn in &readers {
+            let result = conn.query("PRAGMA foreign_keys", &[]).await.unwrap();
+            assert_eq!(result.rows[0][0], SqliteValue::Integer(1));
+        }
+        drop(readers);
+
+        pool.close().await;
+        assert!(matches!(
+            pool.execute("SELECT 1", &[]).await,
+            Err(SqliteError::ConnectionClosed)
+        ));
+        for suffix in ["", "-wal", "-shm"] {
+            let _ = std::fs::remove_file(format!("{path}{suffix}"));
+        }
+    }
+
     #[tokio::test]
     async fn test_pool_basic() {
         let config = SqlitePoolConfig::new(":memory:");
@@ -184,4 +482,54 @@ mod tests {
 
         pool.close().await;
     }
+
+    #[tokio::test]
+    async fn test_transaction_commit_and_rollback() {
+        let pool = SqlitePool::connect(SqlitePoolConfig::new(":memory:"))
+            .await
+            .unwrap();
+        pool.execute("CREATE TABLE test (id INTEGER PRIMARY KEY)", &[])
+            .await
+            .unwrap();
+
+        let tx = pool.begin().await.unwrap();
+        tx.execute("INSERT INTO test (id) VALUES (1)", &[])
+            .await
+            .unwrap();
+        // Reads inside the transaction see its own writes
+        let result = tx.query("SELECT * FROM test", &[]).await.unwrap();
+        assert_eq!(result.rows.len(), 1);
+        tx.commit().await.unwrap();
+
+        let tx = pool.begin().await.unwrap();
+        tx.execute("INSERT INTO test (id) VALUES (2)", &[])
+            .await
+            .unwrap();
+        tx.rollback().await.unwrap();
+
+        let result = pool.query("SELECT * FROM test", &[]).await.unwrap();
+        assert_eq!(result.rows.len(), 1);
+
+        pool.close().await;
+    }
+
+    #[tokio::test]
+    async fn test_memory_pool_shares_one_database() {
+        let config = SqlitePoolConfig::new(":memory:").max_read_connections(4);
+        let pool = SqlitePool::connect(config).await.unwrap();
+
+        pool.execute("CREATE TABLE test (id INTEGER PRIMARY KEY)", &[])
+            .await
+            .unwrap();
+
+        // Concurrent queries must all see the table created above
+        let (a, b) = tokio::join!(
+            pool.query("SELECT * FROM test", &[]),
+            pool.query("SELECT * FROM test", &[]),
+        );
+        assert!(a.is_ok());
+        assert!(b.is_ok());
+
+        pool.close().await;
+    }
 }
@@ -38,6 +38,66 @@ async fn test_execute_and_query() {
     assert_eq!(result.rows[0][1], SqliteValue::Text("hello".to_string()));
 }
 
+#[tokio::test]
+async fn test_repeated_execute_reuses_statement() {
+    let conn = SqliteConnection::open(":memory:").await.unwrap();
+    conn.execute("CREATE TABLE test (id INTEGER PRIMARY KEY, name TEXT)", &[])
+        .await
+        .unwrap();
+
+    for name in ["a", "b", "c"] {
+        let affected = conn
+            .execute(
+                "INSERT INTO test (name) VALUES (?)",
+                &[SqliteValue::Text(name.to_string())],
+            )
+            .await
+            .unwrap();
+        assert_eq!(affected, 1);
+    }
+
+    let result = conn
+        .query("SELECT name FROM test ORDER BY id", &[])
+        .await
+        .unwrap();
+    assert_eq!(result.rows.len(), 3);
+    assert_eq!(result.rows[2][0], SqliteValue::Text("c".to_string()));
+}
+
+#[tokio::test]
+async fn test_execute_many() {
+    let conn = SqliteConnection::open(":memory:").await.unwrap();
+    conn.execute("CREATE TABLE test (id INTEGER PRIMARY KEY, name TEXT)", &[])
+        .await
+        .unwrap();
+
+    let param_sets = ["a", "b", "c"]
+        .iter()
+        .map(|name| vec![SqliteValue::Text(name.to_string())])
+        .collect();
+    let affected = conn
+        .execute_many("INSERT INTO test (name) VALUES (?)", param_sets)
+        .await
+        .unwrap();
+    assert_eq!(affected, 3);
+
+    // A failing set rolls back the whole batch
+    let param_sets = vec![
+        vec![SqliteValue::Integer(10), SqliteValue::Text("d".to_string())],
+        vec![
+            SqliteValue::Integer(1),
+            SqliteValue::Text("dup".to_string()),
+        ],
+    ];
+    assert!(conn
+        .execute_many("INSERT INTO test (id, name) VALUES (?, ?)", param_sets)
+        .await
+        .is_err());
+
+    let result = conn.query("SELECT COUNT(*) FROM test", &[]).await.unwrap();
+    assert_eq!(result.rows[0][0], SqliteValue::Integer(3));
+}
+
 #[tokio::test]
 async fn test_null_values() {
     let conn = SqliteConnection::open(":memory:").await.unwrap();
@@ -4,13 +4,41 @@ import os
 import pytest
 import pytest_asyncio
 
+from ormkit import create_engine
+
+# In-memory test databases have no journal file or fsync to tune; keep temp
+# b-trees (ORDER BY, DISTINCT) in memory and give the page cache some headroom.
+SQLITE_TEST_PRAGMAS = """
+    PRAGMA temp_store = MEMORY;
+    PRAGMA cache_size = -20000;
+"""
+
 
 @pytest_asyncio.fixture
 async def sqlite_pool():
-    """Create an in-memory SQLite connection pool."""
-    from ormkit import create_engine
+    """Create an in-memory SQLite connection pool.
 
+    Queries run on the extension's shared tokio runtime; the only per-pool
+    thread is the single connection's rusqlite worker, so there is no executor
+    to share between tests.
+    """
     pool = await create_engine("sqlite::memory:")
+    await pool.execute_script(SQLITE_TEST_PRAGMAS)
+    yield pool
+    await pool.close()
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def module_sqlite_pool():
+    """Create an in-memory SQLite connection pool shared by a whole test module.
+
+    Tables persist between tests, so fixtures built on this pool are expected
+    to clear their rows before each test. ``sqlite::memory:`` databases are
+    private to their connection, so parallel runners (``pytest -n``) give each
+    worker process its own copy without any per-worker naming.
+    """
+    pool = await create_engine("sqlite::memory:")
+    await pool.execute_script(SQLITE_TEST_PRAGMAS)
     yield pool
     await pool.close()
 
@@ -22,8 +50,6 @@ async def postgres_pool():
     Set DATABASE_URL environment variable to use a real PostgreSQL database.
     Otherwise, this fixture is skipped.
     """
-    from ormkit import create_engine
-
     url = os.environ.get("DATABASE_URL")
     if not url:
         pytest.skip("DATABASE_URL not set")
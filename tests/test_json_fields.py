@@ -3,10 +3,14 @@
 from __future__ import annotations
 
 import pytest
+import pytest_asyncio
 
 from ormkit import AsyncSession, Base, Mapped, mapped_column
 from ormkit.fields import JSON
 
+# Share one event loop (and the module-scoped SQLite pool) across this module.
+pytestmark = pytest.mark.asyncio(loop_scope="module")
+
 
 class Product(Base):
     """Test model with JSON field."""
@@ -42,17 +46,24 @@ class TestJSONFieldDefinition:
         assert col.nullable is True
 
 
-@pytest.fixture
-async def products_table(sqlite_pool):
-    """Create products table for testing."""
-    await sqlite_pool.execute("""
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def products_schema(module_sqlite_pool):
+    """Create the products table once per module."""
+    await module_sqlite_pool.execute("""
         CREATE TABLE IF NOT EXISTS products (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             name TEXT NOT NULL,
             metadata TEXT
         )
     """, [])
-    return sqlite_pool
+    return module_sqlite_pool
+
+
+@pytest_asyncio.fixture(loop_scope="module")
+async def products_table(products_schema):
+    """Empty products table for testing (shared module pool)."""
+    await products_schema.execute("DELETE FROM products", [])
+    return products_schema
 
 
 class TestJSONFieldCRUD:
@@ -90,58 +101,30 @@ class TestJSONFieldCRUD:
         assert reloaded is not None
         assert reloaded.metadata == {"v": 2, "updated": True}
 
-    async def test_json_with_nested_objects(self, products_table: AsyncSession) -> None:
-        """JSON with deeply nested structure."""
-        session = AsyncSession(products_table)
-        product = await session.insert(
-            Product(
-                name="Complex",
-                metadata={
+    @pytest.mark.parametrize(
+        "metadata",
+        [
+            pytest.param(
+                {
                     "specs": {"dimensions": {"width": 10, "height": 20}, "weight": 1.5},
                     "tags": ["a", "b", "c"],
                 },
-            )
-        )
-
-        loaded = await session.get(Product, product.id)
-        assert loaded is not None
-        assert loaded.metadata["specs"]["dimensions"]["width"] == 10
-
-    async def test_json_with_null_value(self, products_table: AsyncSession) -> None:
-        """JSON field can be None."""
-        session = AsyncSession(products_table)
-        product = await session.insert(Product(name="NoMeta", metadata=None))
-        loaded = await session.get(Product, product.id)
-        assert loaded is not None
-        assert loaded.metadata is None
-
-    async def test_json_with_array_value(self, products_table: AsyncSession) -> None:
-        """JSON field can be a list/array."""
-        session = AsyncSession(products_table)
-        product = await session.insert(
-            Product(name="ArrayMeta", metadata=["a", "b", "c"])  # type: ignore[arg-type]
-        )
-        loaded = await session.get(Product, product.id)
-        assert loaded is not None
-        assert loaded.metadata == ["a", "b", "c"]
+                id="nested-objects",
+            ),
+            pytest.param(None, id="null"),
+            pytest.param(["a", "b", "c"], id="array"),
+            pytest.param({}, id="empty-object"),
+            pytest.param([], id="empty-array"),
+        ],
+    )
+    async def test_json_roundtrip(self, products_table: AsyncSession, metadata: object) -> None:
+        """JSON values survive an insert + reload unchanged."""
+        session = AsyncSession(products_table)
+        product = await session.insert(Product(name="Roundtrip", metadata=metadata))  # type: ignore[arg-type]
 
-    async def test_json_with_empty_object(self, products_table: AsyncSession) -> None:
-        """JSON field can be an empty dict."""
-        session = AsyncSession(products_table)
-        product = await session.insert(Product(name="EmptyMeta", metadata={}))
-        loaded = await session.get(Product, product.id)
-        assert loaded is not None
-        assert loaded.metadata == {}
-
-    async def test_json_with_empty_array(self, products_table: AsyncSession) -> None:
-        """JSON field can be an empty array."""
-        session = AsyncSession(products_table)
-        product = await session.insert(
-            Product(name="EmptyArray", metadata=[])  # type: ignore[arg-type]
-        )
         loaded = await session.get(Product, product.id)
         assert loaded is not None
-        assert loaded.metadata == []
+        assert loaded.metadata == metadata
 
 
 class TestJSONQueryOperators:
@@ -2,10 +2,17 @@
 
 from __future__ import annotations
 
+import asyncio
+from uuid import uuid4
+
 import pytest
+import pytest_asyncio
 
 from ormkit import AsyncSession, Base, Mapped, mapped_column, relationship
-from ormkit.relationships import selectinload
+from ormkit.relationships import greedyload, joinedload, selectinload
+
+# Share one event loop (and the module-scoped SQLite pool) across this module.
+pytestmark = pytest.mark.asyncio(loop_scope="module")
 
 
 class User(Base):
@@ -15,7 +22,9 @@ class User(Base):
 
     id: Mapped[int] = mapped_column(primary_key=True)
     name: Mapped[str] = mapped_column(max_length=100)
-    roles: Mapped[list["Role"]] = relationship(secondary="user_roles", back_populates="users")
+    roles: Mapped[list["Role"]] = relationship(
+        secondary="user_roles", back_populates="users", order_by="name"
+    )
 
 
 class Role(Base):
@@ -25,113 +34,143 @@ class Role(Base):
 
     id: Mapped[int] = mapped_column(primary_key=True)
     name: Mapped[str] = mapped_column(max_length=50)
-    users: Mapped[list["User"]] = relationship(secondary="user_roles", back_populates="roles")
+    users: Mapped[list["User"]] = relationship(
+        secondary="user_roles", back_populates="roles", order_by="name"
+    )
 
 
-@pytest.fixture
-async def m2m_tables(sqlite_pool) -> AsyncSession:
-    """Create tables for M2M testing."""
-    # Users table
-    await sqlite_pool.execute(
+class Device(Base):
+    """M2M model with a string key stored in a PostgreSQL uuid column."""
+
+    __tablename__ = "devices"
+
+    id: Mapped[str] = mapped_column(primary_key=True)
+    name: Mapped[str] = mapped_column(max_length=50)
+    groups: Mapped[list["Group"]] = relationship(secondary="device_groups", order_by="name")
+
+
+class Group(Base):
+    """Target of Device.groups, also keyed by uuid."""
+
+    __tablename__ = "groups"
+
+    id: Mapped[str] = mapped_column(primary_key=True)
+    name: Mapped[str] = mapped_column(max_length=50)
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def m2m_schema(module_sqlite_pool):
+    """Create the M2M tables once per module."""
+    await module_sqlite_pool.execute_script(
         """
         CREATE TABLE IF NOT EXISTS users (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             name TEXT NOT NULL
-        )
-        """,
-        [],
-    )
+        );
 
-    # Roles table
-    await sqlite_pool.execute(
-        """
         CREATE TABLE IF NOT EXISTS roles (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             name TEXT NOT NULL
-        )
-        """,
-        [],
-    )
+        );
 
-    # Junction table
-    await sqlite_pool.execute(
-        """
         CREATE TABLE IF NOT EXISTS user_roles (
             user_id INTEGER NOT NULL REFERENCES users(id) ON DELETE CASCADE,
             role_id INTEGER NOT NULL REFERENCES roles(id) ON DELETE CASCADE,
             PRIMARY KEY (user_id, role_id)
-        )
-        """,
-        [],
+        ) WITHOUT ROWID;
+
+        CREATE INDEX IF NOT EXISTS idx_user_roles_role ON user_roles (role_id, user_id);
+        """
     )
+    return module_sqlite_pool
 
-    return sqlite_pool
 
+@pytest_asyncio.fixture(loop_scope="module")
+async def m2m_tables(m2m_schema) -> AsyncSession:
+    """Empty M2M tables for testing (shared module pool).
 
-@pytest.fixture
+    The AUTOINCREMENT counters are reset too, since seeded tests rely on ids 1-3.
+    """
+    await m2m_schema.execute_script(
+        """
+        DELETE FROM user_roles;
+        DELETE FROM users;
+        DELETE FROM roles;
+        DELETE FROM sqlite_sequence WHERE name IN ('users', 'roles');
+        """
+    )
+    return m2m_schema
+
+
+# Expected collections for the seed data, in relationship order_by (name) order
+_ALICE_ROLE_NAMES = ("Admin", "Editor")
+_EDITOR_USER_NAMES = ("Alice", "Bob")
+
+
+@pytest_asyncio.fixture(loop_scope="module")
 async def seeded_m2m_tables(m2m_tables) -> AsyncSession:
     """Create tables with seed data for M2M testing."""
     pool = m2m_tables
 
-    # Insert users
-    await pool.execute(
-        "INSERT INTO users (name) VALUES ('Alice'), ('Bob'), ('Charlie')", []
-    )
-
-    # Insert roles
-    await pool.execute(
-        "INSERT INTO roles (name) VALUES ('Admin'), ('Editor'), ('Viewer')", []
-    )
-
-    # Insert user-role associations
     # Alice: Admin, Editor
     # Bob: Editor
     # Charlie: Viewer
-    await pool.execute(
+    await pool.execute_script(
+        """
+        BEGIN;
+        INSERT INTO users (name) VALUES ('Alice'), ('Bob'), ('Charlie');
+        INSERT INTO roles (name) VALUES ('Admin'), ('Editor'), ('Viewer');
+        INSERT INTO user_roles (user_id, role_id) VALUES (1, 1), (1, 2), (2, 2), (3, 3);
+        COMMIT;
         """
-        INSERT INTO user_roles (user_id, role_id) VALUES
-            (1, 1), (1, 2),
-            (2, 2),
-            (3, 3)
-        """,
-        [],
     )
 
     return pool
 
 
-class TestM2MRelationshipDefinition:
-    """Test M2M relationship model definition."""
+@pytest.fixture
+def session(m2m_tables) -> AsyncSession:
+    """Session bound to the M2M test tables (seeded or not, same pool)."""
+    return AsyncSession(m2m_tables)
 
-    def test_secondary_table_detected(self) -> None:
-        """Relationship with secondary= is detected as M2M."""
-        rel = User.__relationships__["roles"]
-        assert rel.secondary == "user_roles"
 
-    def test_is_many_to_many_property(self) -> None:
-        """Relationship has is_many_to_many = True."""
-        rel = User.__relationships__["roles"]
-        assert rel.is_many_to_many is True
+class TestM2MRelationshipDefinition:
+    """Test M2M relationship model definition."""
 
-    def test_back_populates_both_sides(self) -> None:
-        """Both sides reference each other."""
-        user_rel = User.__relationships__["roles"]
-        role_rel = Role.__relationships__["users"]
-        assert user_rel.back_populates == "users"
-        assert role_rel.back_populates == "roles"
+    @pytest.mark.parametrize(
+        ("rel", "attr", "expected"),
+        [
+            pytest.param(
+                User.__relationships__["roles"], "secondary", "user_roles", id="secondary"
+            ),
+            pytest.param(
+                User.__relationships__["roles"], "is_many_to_many", True, id="is-many-to-many"
+            ),
+            pytest.param(
+                User.__relationships__["roles"], "back_populates", "users", id="user-back-populates"
+            ),
+            pytest.param(
+                Role.__relationships__["users"], "back_populates", "roles", id="role-back-populates"
+            ),
+            pytest.param(User.__relationships__["roles"], "uselist", True, id="user-uselist"),
+            pytest.param(Role.__relationships__["users"], "uselist", True, id="role-uselist"),
+        ],
+    )
+    def test_relationship_metadata(self, rel: object, attr: str, expected: object) -> None:
+        """Both sides of the M2M relationship carry the expected metadata."""
+        assert getattr(rel, attr) == expected
 
-    def test_uselist_true_for_both_sides(self) -> None:
-        """Both sides are collections (list)."""
-        assert User.__relationships__["roles"].uselist is True
-        assert Role.__relationships__["users"].uselist is True
+    def test_relationships_are_read_only(self) -> None:
+        """Relationship metadata is frozen once the class is built."""
+        with pytest.raises(TypeError):
+            User.__relationships__["extra"] = User.__relationships__["roles"]  # type: ignore[index]
 
 
 class TestM2MLoading:
     """Test loading M2M relationships."""
 
-    async def test_selectinload_m2m(self, seeded_m2m_tables) -> None:
+    async def test_selectinload_m2m(self, seeded_m2m_tables, session: AsyncSession) -> None:
         """Load M2M via selectinload."""
-        session = AsyncSession(seeded_m2m_tables)
         users = await session.query(User).options(selectinload("roles")).all()
 
         assert len(users) == 3
@@ -139,8 +178,7 @@ class TestM2MLoading:
         # Alice should have 2 roles
         alice = next(u for u in users if u.name == "Alice")
         assert len(alice.roles) == 2
-        role_names = {r.name for r in alice.roles}
-        assert role_names == {"Admin", "Editor"}
+        assert tuple(r.name for r in alice.roles) == _ALICE_ROLE_NAMES
 
         # Bob should have 1 role
         bob = next(u for u in users if u.name == "Bob")
@@ -152,9 +190,8 @@ class TestM2MLoading:
         assert len(charlie.roles) == 1
         assert charlie.roles[0].name == "Viewer"
 
-    async def test_selectinload_m2m_reverse(self, seeded_m2m_tables) -> None:
+    async def test_selectinload_m2m_reverse(self, seeded_m2m_tables, session: AsyncSession) -> None:
         """Load M2M from reverse side."""
-        session = AsyncSession(seeded_m2m_tables)
         roles = await session.query(Role).options(selectinload("users")).all()
 
         assert len(roles) == 3
@@ -167,12 +204,78 @@ class TestM2MLoading:
         # Editor should have 2 users (Alice, Bob)
         editor = next(r for r in roles if r.name == "Editor")
         assert len(editor.users) == 2
-        user_names = {u.name for u in editor.users}
-        assert user_names == {"Alice", "Bob"}
+        assert tuple(u.name for u in editor.users) == _EDITOR_USER_NAMES
+
+    async def test_count_related_m2m(self, seeded_m2m_tables, session: AsyncSession) -> None:
+        """count_related counts junction rows without loading targets."""
+        assert await session.query(User).count_related("roles") == 4
+        assert await session.query(User).filter(name="Alice").count_related("roles") == 2
+        assert await session.query(Role).filter(name="Editor").count_related("users") == 2
+
+    async def test_concurrent_selectinload_m2m(
+        self, seeded_m2m_tables, session: AsyncSession
+    ) -> None:
+        """Concurrent identical M2M loads on one session each get their own objects."""
+        first, second = await asyncio.gather(
+            session.query(User).options(selectinload("roles")).all(),
+            session.query(User).options(selectinload("roles")).all(),
+        )
+
+        for users in (first, second):
+            alice = next(u for u in users if u.name == "Alice")
+            assert tuple(r.name for r in alice.roles) == _ALICE_ROLE_NAMES
+        assert first[0].roles[0] is not second[0].roles[0]
+
+    async def test_shared_loads_are_keyed_by_sql(
+        self, seeded_m2m_tables, session: AsyncSession
+    ) -> None:
+        """Concurrent loads only share a result when their SQL text matches too."""
+        users, roles = await asyncio.gather(
+            session._execute_shared("SELECT name FROM users ORDER BY id", [], frozenset({1})),
+            session._execute_shared("SELECT name FROM roles ORDER BY id", [], frozenset({1})),
+        )
+        assert users.column("name") == ["Alice", "Bob", "Charlie"]
+        assert roles.column("name") == ["Admin", "Editor", "Viewer"]
 
-    async def test_lazy_load_m2m_raises_by_default(self, seeded_m2m_tables) -> None:
+    async def test_joinedload_m2m(self, seeded_m2m_tables, session: AsyncSession) -> None:
+        """joinedload fetches parents and M2M targets in one query."""
+        users = await (
+            session.query(User).options(joinedload("roles")).order_by("name").limit(2).all()
+        )
+
+        assert [u.name for u in users] == ["Alice", "Bob"]
+        assert tuple(r.name for r in users[0].roles) == _ALICE_ROLE_NAMES
+        assert [r.name for r in users[1].roles] == ["Editor"]
+        # A target shared by several parents is hydrated once
+        assert next(r for r in users[0].roles if r.name == "Editor") is users[1].roles[0]
+
+    async def test_greedyload_m2m(self, seeded_m2m_tables, session: AsyncSession) -> None:
+        """greedyload reads the junction once per transaction and invalidates on writes."""
+        async with session.begin():
+            users = await session.query(User).options(greedyload("roles")).all()
+            alice = next(u for u in users if u.name == "Alice")
+            assert tuple(r.name for r in alice.roles) == _ALICE_ROLE_NAMES
+            assert session._prefetch_cache
+
+            bob = await session.query(User).filter(name="Bob").options(greedyload("roles")).first()
+            assert bob is not None
+            assert [r.name for r in bob.roles] == ["Editor"]
+
+            viewer = await session.query(Role).filter(name="Viewer").first()
+            assert viewer is not None
+            await bob.roles.add(viewer)
+            assert not session._prefetch_cache
+
+            bob = await session.query(User).filter(name="Bob").options(greedyload("roles")).first()
+            assert bob is not None
+            assert [r.name for r in bob.roles] == ["Editor", "Viewer"]
+
+        assert not session._prefetch_cache
+
+    async def test_lazy_load_m2m_raises_by_default(
+        self, seeded_m2m_tables, session: AsyncSession
+    ) -> None:
         """Accessing M2M without eager loading raises."""
-        session = AsyncSession(seeded_m2m_tables)
         user = await session.query(User).first()
         assert user is not None
 
@@ -180,23 +283,16 @@ class TestM2MLoading:
         with pytest.raises((AttributeError, RuntimeError)):
             _ = user.roles
 
-    async def test_m2m_returns_empty_list_when_none(self, m2m_tables) -> None:
+    async def test_m2m_returns_empty_list_when_none(self, session: AsyncSession) -> None:
         """User with no roles returns empty list."""
-        session = AsyncSession(m2m_tables)
         user = await session.insert(User(name="NoRoles"))
 
-        loaded = (
-            await session.query(User)
-            .options(selectinload("roles"))
-            .filter(id=user.id)
-            .first()
-        )
+        loaded = await session.get(User, user.id, load=selectinload("roles"))
         assert loaded is not None
         assert loaded.roles == []
 
-    async def test_m2m_with_filter(self, seeded_m2m_tables) -> None:
+    async def test_m2m_with_filter(self, seeded_m2m_tables, session: AsyncSession) -> None:
         """Filter works with M2M eager loading."""
-        session = AsyncSession(seeded_m2m_tables)
         users = (
             await session.query(User)
             .options(selectinload("roles"))
@@ -206,154 +302,132 @@ class TestM2MLoading:
 
         assert len(users) == 1
         assert users[0].name == "Alice"
-        assert len(users[0].roles) == 2
+        assert tuple(r.name for r in users[0].roles) == _ALICE_ROLE_NAMES
 
 
 class TestM2MModification:
     """Test modifying M2M relationships."""
 
-    async def test_add_to_m2m(self, m2m_tables) -> None:
+    async def test_add_to_m2m(self, session: AsyncSession) -> None:
         """Add item to M2M relationship."""
-        session = AsyncSession(m2m_tables)
-        user = await session.insert(User(name="TestUser"))
-        role = await session.insert(Role(name="TestRole"))
+        user, role = await asyncio.gather(
+            session.insert(User(name="TestUser")), session.insert(Role(name="TestRole"))
+        )
 
         # Add role to user
         await user.roles.add(role)
 
         # Verify junction table has entry
-        loaded = (
-            await session.query(User)
-            .options(selectinload("roles"))
-            .filter(id=user.id)
-            .first()
-        )
+        loaded = await session.get(User, user.id, load=selectinload("roles"))
         assert loaded is not None
         assert len(loaded.roles) == 1
         assert loaded.roles[0].id == role.id
 
-    async def test_add_multiple_to_m2m(self, m2m_tables) -> None:
+    async def test_add_multiple_to_m2m(self, session: AsyncSession) -> None:
         """Add multiple items at once."""
-        session = AsyncSession(m2m_tables)
-        user = await session.insert(User(name="TestUser"))
-        role1 = await session.insert(Role(name="Role1"))
-        role2 = await session.insert(Role(name="Role2"))
+        # One transaction for all writes: a single commit instead of one per statement
+        async with session.begin():
+            user, role1, role2 = await asyncio.gather(
+                session.insert(User(name="TestUser")),
+                session.insert(Role(name="Role1")),
+                session.insert(Role(name="Role2")),
+            )
 
-        await user.roles.add(role1, role2)
+            await user.roles.add(role1, role2)
 
-        loaded = (
-            await session.query(User)
-            .options(selectinload("roles"))
-            .filter(id=user.id)
-            .first()
-        )
+        loaded = await session.get(User, user.id, load=selectinload("roles"))
         assert loaded is not None
         assert len(loaded.roles) == 2
 
-    async def test_remove_from_m2m(self, m2m_tables) -> None:
+    async def test_remove_from_m2m(self, session: AsyncSession) -> None:
         """Remove item from M2M relationship."""
-        session = AsyncSession(m2m_tables)
-        user = await session.insert(User(name="TestUser"))
-        role = await session.insert(Role(name="TestRole"))
+        async with session.begin():
+            user, role = await asyncio.gather(
+                session.insert(User(name="TestUser")), session.insert(Role(name="TestRole"))
+            )
 
-        # Add then remove
-        await user.roles.add(role)
-        await user.roles.remove(role)
+            # Add then remove
+            await user.roles.add(role)
+            await user.roles.remove(role)
 
         # Verify
-        loaded = (
-            await session.query(User)
-            .options(selectinload("roles"))
-            .filter(id=user.id)
-            .first()
-        )
-        assert loaded is not None
-        assert len(loaded.roles) == 0
+        assert await session.query(User).filter(id=user.id).count_related("roles") == 0
 
-    async def test_clear_m2m(self, m2m_tables) -> None:
+    async def test_clear_m2m(self, session: AsyncSession) -> None:
         """Clear all items from M2M relationship."""
-        session = AsyncSession(m2m_tables)
-        user = await session.insert(User(name="TestUser"))
+        async with session.begin():
+            user, *roles = await asyncio.gather(
+                session.insert(User(name="TestUser")),
+                *(session.insert(Role(name=name)) for name in ["Admin", "Editor", "Viewer"]),
+            )
 
-        # Add multiple roles
-        for name in ["Admin", "Editor", "Viewer"]:
-            role = await session.insert(Role(name=name))
-            await user.roles.add(role)
+            # Add multiple roles
+            for role in roles:
+                await user.roles.add(role)
 
-        # Clear all
-        await user.roles.clear()
+            # Clear all
+            await user.roles.clear()
 
-        loaded = (
-            await session.query(User)
-            .options(selectinload("roles"))
-            .filter(id=user.id)
-            .first()
-        )
-        assert loaded is not None
-        assert len(loaded.roles) == 0
+        assert await session.query(User).filter(id=user.id).count_related("roles") == 0
 
-    async def test_m2m_bidirectional_sync(self, m2m_tables) -> None:
+    async def test_m2m_bidirectional_sync(self, session: AsyncSession) -> None:
         """Changes reflect on both sides of M2M."""
-        session = AsyncSession(m2m_tables)
-        user = await session.insert(User(name="TestUser"))
-        role = await session.insert(Role(name="TestRole"))
+        user, role = await asyncio.gather(
+            session.insert(User(name="TestUser")), session.insert(Role(name="TestRole"))
+        )
 
         await user.roles.add(role)
 
         # Load role and check users
-        loaded_role = (
-            await session.query(Role)
-            .options(selectinload("users"))
-            .filter(id=role.id)
-            .first()
-        )
+        loaded_role = await session.get(Role, role.id, load=selectinload("users"))
         assert loaded_role is not None
         assert len(loaded_role.users) == 1
         assert loaded_role.users[0].id == user.id
 
-    async def test_add_duplicate_is_idempotent(self, m2m_tables) -> None:
+    async def test_add_duplicate_is_idempotent(self, session: AsyncSession) -> None:
         """Adding the same item twice is idempotent."""
-        session = AsyncSession(m2m_tables)
-        user = await session.insert(User(name="TestUser"))
-        role = await session.insert(Role(name="TestRole"))
+        async with session.begin():
+            user, role = await asyncio.gather(
+                session.insert(User(name="TestUser")), session.insert(Role(name="TestRole"))
+            )
 
-        await user.roles.add(role)
-        await user.roles.add(role)  # Add again
+            await user.roles.add(role)
+            await user.roles.add(role)  # Add again
 
-        loaded = (
-            await session.query(User)
-            .options(selectinload("roles"))
-            .filter(id=user.id)
-            .first()
-        )
+        loaded = await session.get(User, user.id, load=selectinload("roles"))
         assert loaded is not None
         assert len(loaded.roles) == 1  # Still just one
 
-    async def test_remove_nonexistent_is_noop(self, m2m_tables) -> None:
+    async def test_remove_nonexistent_is_noop(self, session: AsyncSession) -> None:
         """Removing item that isn't associated is a no-op."""
-        session = AsyncSession(m2m_tables)
-        user = await session.insert(User(name="TestUser"))
-        role = await session.insert(Role(name="TestRole"))
+        user, role = await asyncio.gather(
+            session.insert(User(name="TestUser")), session.insert(Role(name="TestRole"))
+        )
 
         # Remove without adding first - should not raise
         await user.roles.remove(role)
 
-        loaded = (
-            await session.query(User)
-            .options(selectinload("roles"))
-            .filter(id=user.id)
-            .first()
+        assert await session.query(User).filter(id=user.id).count_related("roles") == 0
+
+    async def test_m2m_changes_roll_back_with_transaction(self, session: AsyncSession) -> None:
+        """M2M writes inside session.begin() are discarded when the block raises."""
+        user, role = await asyncio.gather(
+            session.insert(User(name="TestUser")), session.insert(Role(name="TestRole"))
         )
-        assert loaded is not None
-        assert len(loaded.roles) == 0
+
+        with pytest.raises(RuntimeError):
+            async with session.begin():
+                await user.roles.add(role)
+                raise RuntimeError("abort")
+
+        assert await session.query(User).filter(id=user.id).count_related("roles") == 0
 
 
 class TestM2MEdgeCases:
     """Test edge cases for M2M relationships."""
 
-    async def test_m2m_with_ordering(self, seeded_m2m_tables) -> None:
+    async def test_m2m_with_ordering(self, seeded_m2m_tables, session: AsyncSession) -> None:
         """M2M with ordering on main query."""
-        session = AsyncSession(seeded_m2m_tables)
         users = (
             await session.query(User)
             .options(selectinload("roles"))
@@ -364,9 +438,8 @@ class TestM2MEdgeCases:
         names = [u.name for u in users]
         assert names == ["Alice", "Bob", "Charlie"]
 
-    async def test_m2m_with_limit(self, seeded_m2m_tables) -> None:
+    async def test_m2m_with_limit(self, seeded_m2m_tables, session: AsyncSession) -> None:
         """M2M loading with LIMIT on main query."""
-        session = AsyncSession(seeded_m2m_tables)
         users = (
             await session.query(User)
             .options(selectinload("roles"))
@@ -402,3 +475,37 @@ class TestM2MWithExtraColumns:
         """M2M junction table with extra metadata."""
         # e.g., order_products with 'quantity' field
         pass
+
+
+class TestM2MPostgreSQL:
+    """PostgreSQL-specific M2M tests."""
+
+    async def test_uuid_junction(self, postgres_pool) -> None:
+        """String keys in uuid columns bind as uuid on add, load and remove."""
+        await postgres_pool.execute_script(
+            """
+            DROP TABLE IF EXISTS device_groups, devices, groups;
+            CREATE TABLE devices (id UUID PRIMARY KEY, name TEXT NOT NULL);
+            CREATE TABLE groups (id UUID PRIMARY KEY, name TEXT NOT NULL);
+            CREATE TABLE device_groups (
+                device_id UUID NOT NULL REFERENCES devices(id),
+                group_id UUID NOT NULL REFERENCES groups(id),
+                PRIMARY KEY (device_id, group_id)
+            );
+            """
+        )
+        try:
+            session = AsyncSession(postgres_pool)
+            device = await session.insert(Device(id=str(uuid4()), name="sensor"))
+            admins, ops = await asyncio.gather(
+                session.insert(Group(id=str(uuid4()), name="admins")),
+                session.insert(Group(id=str(uuid4()), name="ops")),
+            )
+
+            await device.groups.add(admins, ops)
+            await device.groups.remove(admins)
+
+            loaded = await session.query(Device).options(selectinload("groups")).all()
+            assert [g.name for g in loaded[0].groups] == ["ops"]
+        finally:
+            await postgres_pool.execute_script("DROP TABLE device_groups, devices, groups;")
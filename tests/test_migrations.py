@@ -2,12 +2,30 @@
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 from textwrap import dedent
 
 import pytest
+import pytest_asyncio
 
 from ormkit import Base, Mapped, mapped_column
+from ormkit.cli import migrate_create, migrate_down, migrate_init, migrate_status, migrate_up
+from ormkit.migrations.autogen import AutogenContext
+from ormkit.migrations.config import AlembicConfig
+from ormkit.migrations.operations import (
+    AddColumn,
+    ColumnDef,
+    CreateIndex,
+    CreateTable,
+    DropColumn,
+    DropTable,
+)
+from ormkit.migrations.runner import MigrationRunner
+from ormkit.migrations.script import MigrationScript, fast_scan
+
+# Share one event loop (and the module-scoped SQLite pool) across this module.
+pytestmark = pytest.mark.asyncio(loop_scope="module")
 
 
 # Test models for migration generation
@@ -31,61 +49,76 @@ class Post(Base):
     user_id: Mapped[int]  # FK to users.id
 
 
+# Fixture file contents, dedented once at import
+_INI_BYTES = dedent("""
+    [alembic]
+    script_location = alembic
+    sqlalchemy.url = sqlite:///test.db
+
+    [alembic:exclude]
+    tables = alembic_version
+""").strip().encode()
+
+_MIGRATION_BYTES = dedent('''
+    """Create users table
+
+    Revision ID: abc123def456
+    Revises: None
+    Create Date: 2024-03-15 12:34:56.789012
+    """
+    from alembic import op
+    import sqlalchemy as sa
+
+    # revision identifiers, used by Alembic.
+    revision = 'abc123def456'
+    down_revision = None
+    branch_labels = None
+    depends_on = None
+
+    def upgrade():
+        op.create_table(
+            'users',
+            sa.Column('id', sa.Integer(), primary_key=True),
+            sa.Column('name', sa.String(100), nullable=False),
+            sa.Column('email', sa.String(255), nullable=False),
+            sa.UniqueConstraint('email'),
+        )
+
+    def downgrade():
+        op.drop_table('users')
+''').strip().encode()
+
+
+@pytest_asyncio.fixture(loop_scope="module")
+async def sqlite_pool(module_sqlite_pool):
+    """The module's shared SQLite pool, with every table dropped after each test.
+
+    These tests exercise DDL, so isolation comes from dropping whatever tables
+    a test created rather than from opening a fresh database per test.
+    """
+    yield module_sqlite_pool
+    tables = await module_sqlite_pool.get_tables()
+    if tables:
+        await module_sqlite_pool.execute_script(
+            "".join(f'DROP TABLE "{table}";' for table in tables)
+        )
+
+
 @pytest.fixture
 def alembic_dir(tmp_path: Path) -> Path:
     """Create a mock alembic directory structure."""
     alembic_path = tmp_path / "alembic"
     alembic_path.mkdir()
     (alembic_path / "versions").mkdir()
-
-    # Create alembic.ini
-    ini_content = dedent("""
-        [alembic]
-        script_location = alembic
-        sqlalchemy.url = sqlite:///test.db
-
-        [alembic:exclude]
-        tables = alembic_version
-    """).strip()
-    (tmp_path / "alembic.ini").write_text(ini_content)
-
+    (tmp_path / "alembic.ini").write_bytes(_INI_BYTES)
     return alembic_path
 
 
 @pytest.fixture
 def sample_migration(alembic_dir: Path) -> Path:
     """Create a sample Alembic migration file."""
-    migration_content = dedent('''
-        """Create users table
-
-        Revision ID: abc123def456
-        Revises: None
-        Create Date: 2024-03-15 12:34:56.789012
-        """
-        from alembic import op
-        import sqlalchemy as sa
-
-        # revision identifiers, used by Alembic.
-        revision = 'abc123def456'
-        down_revision = None
-        branch_labels = None
-        depends_on = None
-
-        def upgrade():
-            op.create_table(
-                'users',
-                sa.Column('id', sa.Integer(), primary_key=True),
-                sa.Column('name', sa.String(100), nullable=False),
-                sa.Column('email', sa.String(255), nullable=False),
-                sa.UniqueConstraint('email'),
-            )
-
-        def downgrade():
-            op.drop_table('users')
-    ''').strip()
-
     migration_path = alembic_dir / "versions" / "abc123def456_create_users_table.py"
-    migration_path.write_text(migration_content)
+    migration_path.write_bytes(_MIGRATION_BYTES)
     return migration_path
 
 
@@ -94,16 +127,12 @@ class TestAlembicCompatibility:
 
     def test_detect_alembic_directory(self, alembic_dir: Path, tmp_path: Path) -> None:
         """Detect alembic/ directory and alembic.ini."""
-        from ormkit.migrations.config import AlembicConfig
-
         config = AlembicConfig.detect(tmp_path)
         assert config is not None
         assert config.script_location == alembic_dir
 
     def test_read_alembic_config(self, alembic_dir: Path, tmp_path: Path) -> None:
         """Parse alembic.ini for script_location, sqlalchemy.url."""
-        from ormkit.migrations.config import AlembicConfig
-
         config = AlembicConfig.from_ini(tmp_path / "alembic.ini")
         # script_location is resolved to absolute path relative to config file
         assert config.script_location == alembic_dir
@@ -111,36 +140,66 @@ class TestAlembicCompatibility:
 
     def test_load_alembic_migration_file(self, sample_migration: Path) -> None:
         """Load and parse an Alembic migration script."""
-        from ormkit.migrations.script import MigrationScript
-
         script = MigrationScript.load(sample_migration)
         assert script.revision == "abc123def456"
         assert script.down_revision is None
         assert script.branch_labels is None
         assert script.depends_on is None
 
+    def test_load_reparses_only_changed_files(self, sample_migration: Path) -> None:
+        """Reloading an unchanged file reuses its parse; edits are picked up."""
+        first = MigrationScript.load(sample_migration)
+        second = MigrationScript.load(sample_migration)
+        assert first is not second
+        assert first._code is second._code
+
+        sample_migration.write_text(
+            sample_migration.read_text().replace("'abc123def456'", "'abc123def456789'")
+        )
+        assert MigrationScript.load(sample_migration).revision == "abc123def456789"
+
+    def test_scan_reads_header_without_parsing(self, sample_migration: Path) -> None:
+        """scan() matches load() for literal headers and defers the parse."""
+        scanned = MigrationScript.scan(sample_migration)
+        loaded = MigrationScript.load(sample_migration)
+        assert scanned._deferred and scanned._code is None
+        for name in ("revision", "down_revision", "message", "branch_labels", "create_date"):
+            assert getattr(scanned, name) == getattr(loaded, name)
+
+        sample_migration.write_text(
+            sample_migration.read_text().replace("down_revision = None", "down_revision = f()")
+        )
+        assert fast_scan(sample_migration) is None
+
+    async def test_load_migrations_uses_header_cache(self, sqlite_pool, sample_migration: Path, tmp_path: Path) -> None:
+        """Unchanged scripts are listed from the sidecar cache without a rescan."""
+        runner = MigrationRunner(sqlite_pool, AlembicConfig.from_ini(tmp_path / "alembic.ini"))
+        assert [s.revision for s in runner.load_migrations()] == ["abc123def456"]
+        assert (sample_migration.parent / ".ormkit_cache.json").exists()
+
+        # Same size and mtime: trusted from the cache, so the file is not reread
+        stat = sample_migration.stat()
+        sample_migration.write_bytes(b"#" * stat.st_size)
+        os.utime(sample_migration, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        (script,) = runner.load_migrations()
+        assert script.revision == "abc123def456" and script._deferred
+
+        # A changed mtime invalidates the entry
+        os.utime(sample_migration, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+        assert runner.load_migrations() == []
+
     async def test_execute_alembic_upgrade(self, sqlite_pool, sample_migration: Path) -> None:
         """Run upgrade() from an Alembic migration."""
-        from ormkit.migrations.runner import MigrationRunner
-        from ormkit.migrations.script import MigrationScript
-
         script = MigrationScript.load(sample_migration)
         runner = MigrationRunner(sqlite_pool)
 
         await runner.run_upgrade(script)
 
         # Verify table was created
-        result = await sqlite_pool.execute(
-            "SELECT name FROM sqlite_master WHERE type='table' AND name='users'"
-        )
-        tables = result.all()
-        assert len(tables) == 1
+        assert await sqlite_pool.table_exists("users")
 
     async def test_execute_alembic_downgrade(self, sqlite_pool, sample_migration: Path) -> None:
         """Run downgrade() from an Alembic migration."""
-        from ormkit.migrations.runner import MigrationRunner
-        from ormkit.migrations.script import MigrationScript
-
         script = MigrationScript.load(sample_migration)
         runner = MigrationRunner(sqlite_pool)
 
@@ -151,16 +210,10 @@ class TestAlembicCompatibility:
         await runner.run_downgrade(script)
 
         # Verify table was dropped
-        result = await sqlite_pool.execute(
-            "SELECT name FROM sqlite_master WHERE type='table' AND name='users'"
-        )
-        tables = result.all()
-        assert len(tables) == 0
+        assert not await sqlite_pool.table_exists("users")
 
     async def test_track_version_in_alembic_version_table(self, sqlite_pool) -> None:
         """Store applied versions in alembic_version table."""
-        from ormkit.migrations.runner import MigrationRunner
-
         runner = MigrationRunner(sqlite_pool)
 
         # Stamp a version
@@ -174,9 +227,7 @@ class TestAlembicCompatibility:
         result = await sqlite_pool.execute(
             "SELECT version_num FROM alembic_version"
         )
-        versions = result.all()
-        assert len(versions) == 1
-        assert versions[0]["version_num"] == "abc123def456"
+        assert result.scalars() == ["abc123def456"]
 
 
 class TestMigrationGeneration:
@@ -184,8 +235,6 @@ class TestMigrationGeneration:
 
     async def test_generate_create_table(self, sqlite_pool, tmp_path: Path) -> None:
         """Generate migration for new model."""
-        from ormkit.migrations.autogen import AutogenContext
-
         context = AutogenContext(sqlite_pool, [User])
         operations = await context.diff()
 
@@ -197,8 +246,6 @@ class TestMigrationGeneration:
 
     async def test_generate_add_column(self, sqlite_pool, tmp_path: Path) -> None:
         """Generate migration when column added to model."""
-        from ormkit.migrations.autogen import AutogenContext
-
         # Create table without 'age' column
         await sqlite_pool.execute(
             """
@@ -228,8 +275,6 @@ class TestMigrationGeneration:
 
     async def test_generate_drop_column(self, sqlite_pool, tmp_path: Path) -> None:
         """Generate migration when column removed from model."""
-        from ormkit.migrations.autogen import AutogenContext
-
         # Create table with 'deprecated' column
         await sqlite_pool.execute(
             """
@@ -253,8 +298,6 @@ class TestMigrationGeneration:
 
     async def test_generate_add_index(self, sqlite_pool, tmp_path: Path) -> None:
         """Generate migration for new index."""
-        from ormkit.migrations.autogen import AutogenContext
-
         # Create table without index on name
         await sqlite_pool.execute(
             """
@@ -280,10 +323,25 @@ class TestMigrationGeneration:
         index_ops = [op for op in operations if op.operation_type == "create_index"]
         assert len(index_ops) >= 1
 
+    async def test_equivalent_types_do_not_alter(self, sqlite_pool, tmp_path: Path) -> None:
+        """Differently spelled but equivalent column types should not be altered."""
+        await sqlite_pool.execute(
+            """
+            CREATE TABLE users (
+                id INT PRIMARY KEY NOT NULL,
+                name VARCHAR(100) NOT NULL,
+                email TEXT NOT NULL UNIQUE
+            )
+            """
+        )
+
+        context = AutogenContext(sqlite_pool, [User])
+        operations = await context.diff()
+
+        assert [op for op in operations if op.operation_type == "alter_column"] == []
+
     async def test_output_alembic_compatible_format(self, sqlite_pool, tmp_path: Path) -> None:
         """Generated migrations should be valid Alembic files."""
-        from ormkit.migrations.autogen import AutogenContext
-
         context = AutogenContext(sqlite_pool, [User])
         operations = await context.diff()
 
@@ -303,8 +361,6 @@ class TestMigrationCLI:
 
     def test_migrate_init_creates_alembic_structure(self, tmp_path: Path) -> None:
         """ormkit migrate init creates alembic/ and alembic.ini."""
-        from ormkit.cli import migrate_init
-
         migrate_init(tmp_path)
 
         assert (tmp_path / "alembic").exists()
@@ -314,8 +370,6 @@ class TestMigrationCLI:
 
     def test_migrate_create_generates_empty_migration(self, alembic_dir: Path, tmp_path: Path) -> None:
         """ormkit migrate create NAME generates timestamped file."""
-        from ormkit.cli import migrate_create
-
         migration_path = migrate_create(tmp_path, "add users table")
 
         assert migration_path.exists()
@@ -326,20 +380,13 @@ class TestMigrationCLI:
 
     async def test_migrate_up_applies_pending(self, sqlite_pool, alembic_dir: Path, sample_migration: Path, tmp_path: Path) -> None:
         """ormkit migrate up runs all pending migrations."""
-        from ormkit.cli import migrate_up
-
         await migrate_up(sqlite_pool, tmp_path)
 
         # Verify migration was applied
-        result = await sqlite_pool.execute(
-            "SELECT name FROM sqlite_master WHERE type='table' AND name='users'"
-        )
-        assert len(result.all()) == 1
+        assert await sqlite_pool.table_exists("users")
 
     async def test_migrate_down_reverts_last(self, sqlite_pool, alembic_dir: Path, sample_migration: Path, tmp_path: Path) -> None:
         """ormkit migrate down reverts most recent migration."""
-        from ormkit.cli import migrate_up, migrate_down
-
         # Apply
         await migrate_up(sqlite_pool, tmp_path)
 
@@ -347,15 +394,10 @@ class TestMigrationCLI:
         await migrate_down(sqlite_pool, tmp_path)
 
         # Verify table was dropped
-        result = await sqlite_pool.execute(
-            "SELECT name FROM sqlite_master WHERE type='table' AND name='users'"
-        )
-        assert len(result.all()) == 0
+        assert not await sqlite_pool.table_exists("users")
 
     async def test_migrate_status_shows_current_revision(self, sqlite_pool, alembic_dir: Path, sample_migration: Path, tmp_path: Path) -> None:
         """ormkit migrate status displays current state."""
-        from ormkit.cli import migrate_status, migrate_up
-
         # Before applying
         status = await migrate_status(sqlite_pool, tmp_path)
         assert status["current_revision"] is None
@@ -387,6 +429,17 @@ class TestSchemaIntrospection:
         assert "test_table2" in tables
         assert "sqlite_sequence" not in tables  # Internal SQLite table excluded
 
+    async def test_get_sqlite_tables_keeps_sqlite_like_names(self, sqlite_pool) -> None:
+        """Only the literal sqlite_ prefix is treated as internal."""
+        await sqlite_pool.execute(
+            "CREATE TABLE sqlitex (id INTEGER PRIMARY KEY AUTOINCREMENT)"
+        )
+        await sqlite_pool.execute("INSERT INTO sqlitex DEFAULT VALUES")
+
+        tables = await sqlite_pool.get_tables()
+
+        assert tables == ["sqlitex"]
+
     async def test_get_sqlite_columns(self, sqlite_pool) -> None:
         """Get column info for SQLite table."""
         await sqlite_pool.execute(
@@ -400,18 +453,12 @@ class TestSchemaIntrospection:
             """
         )
 
-        columns = await sqlite_pool.get_columns("test_columns")
+        columns = await sqlite_pool.get_columns_by_name("test_columns")
 
-        assert len(columns) == 4
-
-        id_col = next(c for c in columns if c.name == "id")
-        assert id_col.is_primary_key is True
-
-        name_col = next(c for c in columns if c.name == "name")
-        assert name_col.nullable is False
-
-        age_col = next(c for c in columns if c.name == "age")
-        assert age_col.nullable is True
+        assert list(columns) == ["id", "name", "email", "age"]
+        assert columns["id"].is_primary_key is True
+        assert columns["name"].nullable is False
+        assert columns["age"].nullable is True
 
     async def test_get_sqlite_indexes(self, sqlite_pool) -> None:
         """Get index info for SQLite table."""
@@ -467,8 +514,6 @@ class TestMigrationOperations:
 
     def test_create_table_operation(self) -> None:
         """CreateTable operation generates correct SQL."""
-        from ormkit.migrations.operations import CreateTable, ColumnDef
-
         op = CreateTable(
             "users",
             [
@@ -486,32 +531,24 @@ class TestMigrationOperations:
 
     def test_drop_table_operation(self) -> None:
         """DropTable operation generates correct SQL."""
-        from ormkit.migrations.operations import DropTable
-
         op = DropTable("users")
         sql = op.to_sql("sqlite")
         assert sql == "DROP TABLE users"
 
     def test_add_column_operation(self) -> None:
         """AddColumn operation generates correct SQL."""
-        from ormkit.migrations.operations import AddColumn, ColumnDef
-
         op = AddColumn("users", ColumnDef("age", "INTEGER", nullable=True))
         sql = op.to_sql("sqlite")
         assert "ALTER TABLE users ADD COLUMN age INTEGER" in sql
 
     def test_drop_column_operation(self) -> None:
         """DropColumn operation generates correct SQL."""
-        from ormkit.migrations.operations import DropColumn
-
         op = DropColumn("users", "deprecated_field")
         sql = op.to_sql("sqlite")
         assert "ALTER TABLE users DROP COLUMN deprecated_field" in sql
 
     def test_create_index_operation(self) -> None:
         """CreateIndex operation generates correct SQL."""
-        from ormkit.migrations.operations import CreateIndex
-
         op = CreateIndex("idx_users_email", "users", ["email"], unique=True)
         sql = op.to_sql("sqlite")
         assert "CREATE UNIQUE INDEX idx_users_email ON users (email)" in sql
@@ -2,6 +2,8 @@
 
 from datetime import datetime
 
+import pytest
+
 from ormkit import Base, ForeignKey, Mapped, mapped_column, relationship
 
 
@@ -43,6 +45,13 @@ def test_model_primary_key():
     assert Post.__primary_key__ == "id"
 
 
+def test_model_column_metadata_cache():
+    """Test that column names and JSON columns are cached on the class."""
+    assert User.__column_tuple__ == tuple(User.__columns__)
+    assert User.__json_columns__ == frozenset()
+    assert User.__insert_columns__ == ("name", "email", "age", "created_at")
+
+
 def test_model_column_properties():
     """Test column properties are correctly set."""
     id_col = User.__columns__["id"]
@@ -75,6 +84,39 @@ def test_model_instantiation():
     assert user.email == "alice@example.com"
 
 
+def test_model_init_defaults():
+    """Omitted columns get their default, None if nullable, or stay unset."""
+    user = User(name="Alice", email="alice@example.com")
+    assert user.age is None
+    assert isinstance(user.created_at, datetime)
+    assert "id" not in user.__dict__
+
+
+def test_subclass_with_custom_init_sets_its_own_columns():
+    """A subclass __init__ calling super() still handles the subclass's columns."""
+
+    class Admin(User):
+        level: Mapped[int] = mapped_column(default=1)
+
+        def __init__(self, **kwargs):
+            kwargs.setdefault("email", "admin@example.com")
+            super().__init__(**kwargs)
+
+    admin = Admin(name="x")
+    assert admin.level == 1
+    assert admin.email == "admin@example.com"
+    assert admin.age is None
+    assert Admin(name="x", level=3).level == 3
+    with pytest.raises(TypeError, match="Unknown column or relationship: nickname"):
+        Admin(name="x", nickname="Al")
+
+
+def test_model_init_rejects_unknown_keys():
+    """Unknown keyword arguments raise TypeError."""
+    with pytest.raises(TypeError, match="Unknown column or relationship: nickname"):
+        User(name="Alice", email="alice@example.com", nickname="Al")
+
+
 def test_model_to_dict():
     """Test converting model to dictionary."""
     user = User(name="Alice", email="alice@example.com", age=30)
@@ -1,18 +1,19 @@
 """Tests for new ORM features: Q objects, aggregates, streaming, etc."""
 
 import pytest
+import pytest_asyncio
 from ormkit import (
     Base,
     Mapped,
     mapped_column,
     ForeignKey,
     relationship,
-    create_engine,
     create_session,
     Q,
     joinedload,
     selectinload,
 )
+from ormkit.session import _compile_join_hydrator
 
 
 class NewFeatureUser(Base):
@@ -33,63 +34,55 @@ class NewFeaturePost(Base):
     author: Mapped[NewFeatureUser] = relationship(back_populates="posts")
 
 
-@pytest.fixture
-async def session():
-    """Create a test session with sample data."""
-    pool = await create_engine("sqlite::memory:")
-
-    await pool.execute("""
-        CREATE TABLE new_feature_users (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            name TEXT NOT NULL,
-            age INTEGER NOT NULL,
-            active INTEGER NOT NULL,
-            score REAL
-        )
-    """)
-    await pool.execute("""
-        CREATE TABLE new_feature_posts (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            title TEXT NOT NULL,
-            author_id INTEGER REFERENCES new_feature_users(id)
-        )
-    """)
-
-    # Insert sample data
-    await pool.execute(
-        "INSERT INTO new_feature_users (name, age, active, score) VALUES (?, ?, ?, ?)",
-        ["Alice", 25, 1, 95.5],
-    )
-    await pool.execute(
-        "INSERT INTO new_feature_users (name, age, active, score) VALUES (?, ?, ?, ?)",
-        ["Bob", 30, 1, 85.0],
-    )
-    await pool.execute(
-        "INSERT INTO new_feature_users (name, age, active, score) VALUES (?, ?, ?, ?)",
-        ["Charlie", 35, 0, 75.5],
-    )
-    await pool.execute(
-        "INSERT INTO new_feature_users (name, age, active, score) VALUES (?, ?, ?, ?)",
-        ["Diana", 28, 1, None],
-    )
-
-    # Insert posts
-    await pool.execute(
-        "INSERT INTO new_feature_posts (title, author_id) VALUES (?, ?)",
-        ["Post 1", 1],
-    )
-    await pool.execute(
-        "INSERT INTO new_feature_posts (title, author_id) VALUES (?, ?)",
-        ["Post 2", 1],
-    )
-    await pool.execute(
-        "INSERT INTO new_feature_posts (title, author_id) VALUES (?, ?)",
-        ["Post 3", 2],
-    )
-
-    sess = create_session(pool)
-    yield sess
-    await pool.close()
+# Share one event loop (and the module-scoped SQLite pool) across this module.
+pytestmark = pytest.mark.asyncio(loop_scope="module")
+
+_SCHEMA_SQL = """
+    CREATE TABLE IF NOT EXISTS new_feature_users (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT NOT NULL,
+        age INTEGER NOT NULL,
+        active INTEGER NOT NULL,
+        score REAL
+    );
+    CREATE TABLE IF NOT EXISTS new_feature_posts (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        title TEXT NOT NULL,
+        author_id INTEGER REFERENCES new_feature_users(id)
+    );
+"""
+
+# Sample data, reset in one transaction; tests rely on ids starting at 1
+_SAMPLE_DATA_SQL = """
+    BEGIN;
+    DELETE FROM new_feature_posts;
+    DELETE FROM new_feature_users;
+    DELETE FROM sqlite_sequence WHERE name IN ('new_feature_users', 'new_feature_posts');
+    INSERT INTO new_feature_users (name, age, active, score) VALUES
+        ('Alice', 25, 1, 95.5),
+        ('Bob', 30, 1, 85.0),
+        ('Charlie', 35, 0, 75.5),
+        ('Diana', 28, 1, NULL);
+    INSERT INTO new_feature_posts (title, author_id) VALUES
+        ('Post 1', 1),
+        ('Post 2', 1),
+        ('Post 3', 2);
+    COMMIT;
+"""
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def new_feature_schema(module_sqlite_pool):
+    """Create the tables once per module."""
+    await module_sqlite_pool.execute_script(_SCHEMA_SQL)
+    return module_sqlite_pool
+
+
+@pytest_asyncio.fixture(loop_scope="module")
+async def session(new_feature_schema):
+    """Create a test session with freshly reset sample data (shared module pool)."""
+    await new_feature_schema.execute_script(_SAMPLE_DATA_SQL)
+    return create_session(new_feature_schema)
 
 
 # ========== Q Objects Tests ==========
@@ -133,6 +126,28 @@ class TestQObjects:
         names = {u.name for u in users}
         assert names == {"Alice", "Diana"}
 
+    def test_q_and_emits_selective_terms_first(self):
+        """AND-ed terms are ordered equality, then range, then pattern; OR keeps order."""
+        q = (Q(age__lt=30) | Q(age__gt=32)) & Q(name__contains="li", active=True)
+        sql, params = q.to_sql("sqlite")
+        assert sql == "((active = ? AND name GLOB ?) AND (age < ? OR age > ?))"
+        assert params == [True, "*li*", 30, 32]
+
+    def test_q_to_sql_params_are_caller_owned(self):
+        """Mutating params from to_sql() doesn't leak into later renders."""
+        q = Q(name="Alice") | Q(age__gt=30)
+        _, params = q.to_sql("sqlite")
+        params.append("extra")
+        assert q.to_sql("sqlite")[1] == ["Alice", 30]
+
+    async def test_q_object_reused_across_queries(self, session):
+        """A Q object renders the same way each time it is reused."""
+        adults = Q(age__gte=30) | Q(name="Alice")
+        query = session.query(NewFeatureUser).filter(adults)
+        assert await query.count() == 3
+        assert len(await query.filter(active=True).all()) == 2
+        assert len(await session.query(NewFeatureUser).filter(~adults).all()) == 1
+
 
 # ========== Filter Operators Tests ==========
 
@@ -176,6 +191,22 @@ class TestFilterOperators:
         names = {u.name for u in users}
         assert names == {"Alice", "Charlie"}
 
+    async def test_pattern_operators_are_case_sensitive(self, session):
+        """Plain pattern operators match case like PostgreSQL; the i* variants don't."""
+        query = session.query(NewFeatureUser)
+        assert await query.filter(name__startswith="a").count() == 0
+        assert await query.filter(name__istartswith="a").count() == 1
+        assert await query.filter(name__contains="LI").count() == 0
+        assert await query.filter(name__icontains="LI").count() == 2
+
+    async def test_pattern_operators_match_glob_metacharacters_literally(self, session):
+        """*, ? and [ in a contains/startswith value are not wildcards on SQLite."""
+        query = session.query(NewFeatureUser)
+        assert await query.filter(name__startswith="A*").count() == 0
+        assert await query.filter(name__contains="?").count() == 0
+        _, params = query.filter(name__endswith="[e]")._build_select_sql()
+        assert params == ["*[[]e]"]
+
     async def test_empty_in_returns_no_results(self, session):
         """Test that __in with empty list returns no results."""
         users = await session.query(NewFeatureUser).filter(name__in=[]).all()
@@ -186,6 +217,27 @@ class TestFilterOperators:
         users = await session.query(NewFeatureUser).filter(name__notin=[]).all()
         assert len(users) == 4
 
+    async def test_repeated_filter_shape_binds_new_values(self, session):
+        """A cached query shape still binds each call's values and limit."""
+        query = session.query(NewFeatureUser).order_by("name")
+        first = await query.filter(name__contains="li").limit(1).all()
+        second = await query.filter(name__contains="ob").limit(2).all()
+        assert [u.name for u in first] == ["Alice"]
+        assert [u.name for u in second] == ["Bob"]
+
+
+# ========== Hydration Tests ==========
+
+
+class TestHydration:
+    async def test_all_matches_single_row_hydration(self, session):
+        """Bulk .all() builds the same instances as the single-row path."""
+        users = await session.query(NewFeatureUser).order_by("id").all()
+        first = await session.query(NewFeatureUser).order_by("id").first()
+        assert vars(users[0]) == vars(first)
+        assert users[0]._loaded_relationships is not users[1]._loaded_relationships
+        assert [u.score for u in users] == [95.5, 85.0, 75.5, None]
+
 
 # ========== Aggregate Tests ==========
 
@@ -227,6 +279,32 @@ class TestAggregates:
         # Only Alice (95.5) and Bob (85.0) have scores and are active
         assert avg == pytest.approx(90.25, rel=0.01)
 
+    async def test_aggregate_multiple_in_one_query(self, session):
+        """aggregate() returns several aggregates keyed by spec."""
+        result = await session.query(NewFeatureUser).filter(active=True).aggregate(
+            "count", "age__sum", "age__min", "age__max", "score__avg"
+        )
+        assert result["count"] == 3
+        assert result["age__sum"] == 25 + 30 + 28
+        assert (result["age__min"], result["age__max"]) == (25, 30)
+        assert result["score__avg"] == pytest.approx(90.25, rel=0.01)
+
+    async def test_repeated_filter_shape_binds_new_values(self, session):
+        """COUNT, EXISTS and DELETE reuse the WHERE clause per shape, not per value."""
+        query = session.query(NewFeatureUser)
+        assert await query.filter(age__gt=26).count() == 3
+        assert await query.filter(age__gt=32).count() == 1
+        assert await query.filter(age__gt=40).exists() is False
+        assert await query.filter(name__startswith="D").exists() is True
+
+        assert await query.filter(age__gt=32).delete() == 1
+        assert await query.filter(age__gt=26).count() == 2
+
+    async def test_aggregate_rejects_unknown_function(self, session):
+        """An unknown aggregate suffix is reported before any query runs."""
+        with pytest.raises(ValueError, match="age__median"):
+            await session.query(NewFeatureUser).aggregate("age__median")
+
 
 # ========== DISTINCT Tests ==========
 
@@ -239,6 +317,14 @@ class TestDistinct:
         active_values = [r["active"] for r in result]
         assert len(active_values) == 2  # True and False
 
+    async def test_distinct_projection_runs_in_sql(self, session):
+        """DISTINCT with a projection is left to the database, not deduped in Python."""
+        query = session.query(NewFeatureUser).distinct()
+        sql, params = query._build_select_sql(("active",), join_infos=[])
+        assert sql == "SELECT DISTINCT active FROM new_feature_users"
+        assert params == []
+        assert len(await query.values_list("active", flat=True)) == 2
+
 
 # ========== Bulk Update Tests ==========
 
@@ -253,6 +339,13 @@ class TestBulkUpdate:
         charlie = await session.query(NewFeatureUser).filter(name="Charlie").first()
         assert charlie.active == False
 
+    async def test_repeated_bulk_update_binds_new_values(self, session):
+        """Bulk updates sharing one statement shape still bind each call's values."""
+        assert await session.bulk_update(NewFeatureUser, {"score": 1.0}, age__gt=30) == 1
+        assert await session.bulk_update(NewFeatureUser, {"score": 2.0}, age__gt=26) == 3
+        scores = await session.query(NewFeatureUser).order_by("id").values_list("score", flat=True)
+        assert scores == [95.5, 2.0, 2.0, 2.0]
+
     async def test_bulk_update_with_q_object(self, session):
         """Test bulk update with Q object."""
         count = await session.bulk_update(
@@ -293,6 +386,12 @@ class TestValues:
         result = await session.query(NewFeatureUser).order_by("name").values_list("name", flat=True)
         assert result == ["Alice", "Bob", "Charlie", "Diana"]
 
+    async def test_values_skip_joinedload(self, session):
+        """Projections ignore joinedload options instead of joining for nothing."""
+        query = session.query(NewFeaturePost).options(joinedload("author")).filter(id=1)
+        assert await query.values("id", "title") == [{"id": 1, "title": "Post 1"}]
+        assert await query.values_list("title", flat=True) == ["Post 1"]
+
 
 # ========== Streaming Tests ==========
 
@@ -305,6 +404,33 @@ class TestStreaming:
             count += 1
         assert count == 4
 
+    async def test_unordered_stream_pages_by_primary_key(self, session):
+        """Unordered streams page by primary key, so later writes don't shift batches."""
+        ids = []
+        async for user in session.query(NewFeatureUser).filter(age__gte=25).stream(batch_size=2):
+            ids.append(user.id)
+            if len(ids) == 2:
+                # Deleting an already-streamed row would skip one under OFFSET paging
+                await session.query(NewFeatureUser).filter(id=ids[0]).delete()
+        assert ids == [1, 2, 3, 4]
+
+    async def test_stream_honours_offset_and_limit(self, session):
+        """offset() skips rows once and limit() caps the stream, on both paging paths."""
+        unordered = [
+            user.id
+            async for user in session.query(NewFeatureUser).offset(1).limit(2).stream(batch_size=1)
+        ]
+        assert unordered == [2, 3]
+
+        ordered = [
+            user.id
+            async for user in session.query(NewFeatureUser)
+            .order_by("-id")
+            .offset(1)
+            .stream(batch_size=2)
+        ]
+        assert ordered == [3, 2, 1]
+
     async def test_stream_with_filter(self, session):
         """Test streaming with filter."""
         names = []
@@ -341,6 +467,27 @@ class TestJoinedLoad:
         assert posts[0].author is not None
         assert posts[0].author.name == "Alice"
 
+    async def test_joinedload_shares_repeated_parent(self, session):
+        """Rows joined to the same author hydrate one shared author instance."""
+        query = session.query(NewFeaturePost).options(joinedload("author"))
+        posts = await query.order_by("id").all()
+        assert posts[0].author is posts[1].author
+        assert posts[2].author is not posts[0].author
+        assert posts[2].author.name == "Bob"
+
+    async def test_join_hydrator_skips_missing_columns(self, session):
+        """Columns absent from a joined result are left unset, not a KeyError."""
+        join_infos = session.query(NewFeaturePost).options(joinedload("author"))._build_join_info()
+        alias = join_infos[0].alias
+        columns = ("id", "author_id", f"{alias}_id", f"{alias}_name")
+        hydrate = _compile_join_hydrator(NewFeaturePost, join_infos, columns)
+
+        post, orphan = hydrate([(1, 1, 1, "Alice"), (2, None, None, None)])
+        assert "title" not in post.__dict__
+        assert post.author.name == "Alice"
+        assert "age" not in post.author.__dict__
+        assert orphan.author is None
+
     async def test_joinedload_vs_selectinload(self, session):
         """Test that joinedload and selectinload give same results."""
         posts_joined = await session.query(NewFeaturePost).options(joinedload("author")).order_by("id").all()
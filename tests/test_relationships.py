@@ -3,19 +3,23 @@
 from __future__ import annotations
 
 import pytest
+import pytest_asyncio
 
 from ormkit import (
     AsyncSession,
     Base,
     ForeignKey,
     Mapped,
-    create_engine,
     joinedload,
     mapped_column,
     noload,
     relationship,
     selectinload,
 )
+from ormkit.session import _build_id_list_sql
+
+# Share one event loop (and the module-scoped SQLite pool) across this module.
+pytestmark = pytest.mark.asyncio(loop_scope="module")
 
 
 # Use unique names to avoid conflicts with other test files
@@ -38,42 +42,43 @@ class RelPost(Base):
     author: Mapped[RelUser] = relationship(back_populates="posts")
 
 
-@pytest.fixture
-async def engine():
-    """Create an in-memory SQLite database."""
-    engine = await create_engine("sqlite::memory:")
-    # Create tables
-    await engine.execute("""
-        CREATE TABLE rel_users (
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def engine(module_sqlite_pool):
+    """Create the relationship tables once per module."""
+    await module_sqlite_pool.execute_script("""
+        CREATE TABLE IF NOT EXISTS rel_users (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             name TEXT NOT NULL
-        )
-    """, [])
-    await engine.execute("""
-        CREATE TABLE rel_posts (
+        );
+        CREATE TABLE IF NOT EXISTS rel_posts (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             title TEXT NOT NULL,
             author_id INTEGER NOT NULL,
             FOREIGN KEY (author_id) REFERENCES rel_users(id)
-        )
-    """, [])
-    return engine
+        );
+    """)
+    return module_sqlite_pool
 
 
-@pytest.fixture
+@pytest_asyncio.fixture(loop_scope="module")
 async def session(engine):
-    """Create a session with test data."""
+    """Create a session over freshly seeded test data (shared module pool)."""
     session = AsyncSession(engine)
 
-    # Insert test data
-    await engine.execute(
-        "INSERT INTO rel_users (name) VALUES (?), (?), (?)",
-        ["Alice", "Bob", "Charlie"]
-    )
-    await engine.execute(
-        "INSERT INTO rel_posts (title, author_id) VALUES (?, ?), (?, ?), (?, ?), (?, ?)",
-        ["Alice Post 1", 1, "Alice Post 2", 1, "Bob Post 1", 2, "Charlie Post 1", 3]
-    )
+    # Reset and insert test data; the seed relies on ids 1-3 for the authors
+    await engine.execute_script("""
+        BEGIN;
+        DELETE FROM rel_posts;
+        DELETE FROM rel_users;
+        DELETE FROM sqlite_sequence WHERE name IN ('rel_users', 'rel_posts');
+        INSERT INTO rel_users (name) VALUES ('Alice'), ('Bob'), ('Charlie');
+        INSERT INTO rel_posts (title, author_id) VALUES
+            ('Alice Post 1', 1),
+            ('Alice Post 2', 1),
+            ('Bob Post 1', 2),
+            ('Charlie Post 1', 3);
+        COMMIT;
+    """)
 
     return session
 
@@ -110,6 +115,15 @@ class TestRelationshipDefinition:
         assert post_rel._local_fk_column == "author_id"
         assert post_rel._remote_pk_column == "id"
 
+    def test_resolution_is_memoized(self):
+        """A resolved model skips resolution on later calls."""
+        RelUser._resolve_relationships()
+        assert RelUser.__relationships_resolved__ is True
+
+        target = RelUser.__relationships__["posts"]._target_model
+        RelUser._resolve_relationships()
+        assert RelUser.__relationships__["posts"]._target_model is target
+
 
 class TestSelectinLoad:
     """Tests for selectinload eager loading."""
@@ -158,6 +172,38 @@ class TestSelectinLoad:
         assert len(alice.posts) == 2
 
 
+    def test_id_list_sql_is_independent_of_batch_size(self):
+        """Integer keys bind as one array, so every batch size shares one statement."""
+        few_sql, few_params = _build_id_list_sql("author_id", [1, 2, 3], "sqlite", int)
+        many_sql, many_params = _build_id_list_sql(
+            "author_id", list(range(5000)), "sqlite", int
+        )
+        assert few_sql == many_sql == "author_id IN (SELECT value FROM json_each(?))"
+        assert few_params == [[1, 2, 3]]
+        assert len(many_params) == 1
+
+    def test_postgres_string_ids_bind_as_placeholders(self):
+        """PG string keys stay typed by the column (e.g. uuid), not compared as text."""
+        sql, params = _build_id_list_sql("author_id", ["a", "b", "c"], "postgresql", str)
+        assert sql == "author_id IN ($1, $2, $3, $4)"
+        assert params == ["a", "b", "c", "c"]
+
+        sql, params = _build_id_list_sql("author_id", [1, 2, 3], "postgresql", int)
+        assert sql == "author_id IN (SELECT jsonb_array_elements_text($1::jsonb)::bigint)"
+        assert params == [[1, 2, 3]]
+
+    def test_padded_id_list_stays_under_parameter_limit(self):
+        """Padding other key types to a power of two never exceeds SQLite's limit."""
+        sql, params = _build_id_list_sql("author_id", [1.0, 2.0, 3.0], "sqlite", float)
+        assert params == [1.0, 2.0, 3.0, 3.0]
+        assert sql.count("?") == 4
+
+        ids = [float(i) for i in range(20000)]
+        sql, params = _build_id_list_sql("author_id", ids, "sqlite", float)
+        assert params == ids
+        assert sql.count("?") == 20000
+
+
 class TestJoinedLoad:
     """Tests for joinedload eager loading."""
 
@@ -180,6 +226,14 @@ class TestNoLoad:
         assert len(users) == 3
         for user in users:
             assert user.posts == []
+        assert users[0].posts is not users[1].posts
+
+    async def test_noload_many_to_one_returns_none(self, session):
+        """noload on a many-to-one relationship leaves it as None."""
+        posts = await session.query(RelPost).options(noload("author")).all()
+
+        assert len(posts) == 4
+        assert all(post.author is None for post in posts)
 
 
 class TestRelationshipAccess:
@@ -227,3 +281,11 @@ class TestToDict:
         assert "posts" in d
         assert len(d["posts"]) == 2
         assert all(isinstance(p, dict) for p in d["posts"])
+
+    async def test_to_dict_with_many_to_one(self, session):
+        """A loaded many-to-one relationship serializes as a nested dict."""
+        posts = await session.query(RelPost).options(joinedload("author")).order_by("id").all()
+
+        d = posts[0].to_dict(include_relationships=True)
+        assert d["author"] == {"id": 1, "name": "Alice"}
+        assert "author" not in posts[0].to_dict()
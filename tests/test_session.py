@@ -1,8 +1,12 @@
 """Tests for async session with SQLite."""
 
 import pytest
+import pytest_asyncio
 from ormkit import AsyncSession, Base, Mapped, mapped_column, select, insert
 
+# Share one event loop (and the module-scoped SQLite pool) across this module.
+pytestmark = pytest.mark.asyncio(loop_scope="module")
+
 
 class User(Base):
     __tablename__ = "test_users"
@@ -12,26 +16,28 @@ class User(Base):
     email: Mapped[str] = mapped_column(unique=True)
 
 
-@pytest.fixture
-async def session_with_table(sqlite_pool):
-    """Create session with test table."""
-    # Create table
-    await sqlite_pool.execute("""
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def users_schema(module_sqlite_pool):
+    """Create the test_users table once per module."""
+    await module_sqlite_pool.execute("""
         CREATE TABLE IF NOT EXISTS test_users (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             name TEXT NOT NULL,
             email TEXT UNIQUE NOT NULL
         )
     """)
+    return module_sqlite_pool
 
-    async with AsyncSession(sqlite_pool) as session:
-        yield session
 
-    # Cleanup
-    await sqlite_pool.execute("DROP TABLE IF EXISTS test_users")
+@pytest_asyncio.fixture(loop_scope="module")
+async def session_with_table(users_schema):
+    """Create session with an empty test table (shared module pool)."""
+    await users_schema.execute("DELETE FROM test_users")
+
+    async with AsyncSession(users_schema) as session:
+        yield session
 
 
-@pytest.mark.asyncio
 async def test_session_add_and_commit(session_with_table):
     """Test adding and committing a single model."""
     session = session_with_table
@@ -48,7 +54,6 @@ async def test_session_add_and_commit(session_with_table):
     assert users[0].email == "alice@example.com"
 
 
-@pytest.mark.asyncio
 async def test_session_add_all(session_with_table):
     """Test adding multiple models."""
     session = session_with_table
@@ -66,7 +71,6 @@ async def test_session_add_all(session_with_table):
     assert len(fetched) == 3
 
 
-@pytest.mark.asyncio
 async def test_session_select_filter_by(session_with_table):
     """Test select with filter_by."""
     session = session_with_table
@@ -85,7 +89,6 @@ async def test_session_select_filter_by(session_with_table):
     assert user.name == "Alice"
 
 
-@pytest.mark.asyncio
 async def test_session_select_one(session_with_table):
     """Test select one result."""
     session = session_with_table
@@ -100,7 +103,6 @@ async def test_session_select_one(session_with_table):
     assert user.name == "Alice"
 
 
-@pytest.mark.asyncio
 async def test_session_select_one_or_none(session_with_table):
     """Test select one_or_none."""
     session = session_with_table
@@ -122,31 +124,29 @@ async def test_session_select_one_or_none(session_with_table):
     assert user.name == "Alice"
 
 
-@pytest.mark.asyncio
-async def test_session_raw_execute(sqlite_pool):
+async def test_session_raw_execute(module_sqlite_pool):
     """Test raw SQL execution."""
     # Create and insert directly
-    await sqlite_pool.execute("""
+    await module_sqlite_pool.execute("""
         CREATE TABLE IF NOT EXISTS raw_test (
             id INTEGER PRIMARY KEY,
             value TEXT
         )
     """)
 
-    await sqlite_pool.execute(
+    await module_sqlite_pool.execute(
         "INSERT INTO raw_test (value) VALUES (?)",
         ["hello"]
     )
 
-    result = await sqlite_pool.execute("SELECT * FROM raw_test")
+    result = await module_sqlite_pool.execute("SELECT * FROM raw_test")
     rows = result.all()
     assert len(rows) == 1
     assert rows[0]["value"] == "hello"
 
-    await sqlite_pool.execute("DROP TABLE raw_test")
+    await module_sqlite_pool.execute("DROP TABLE raw_test")
 
 
-@pytest.mark.asyncio
 async def test_session_rollback(session_with_table):
     """Test rollback discards pending changes."""
     session = session_with_table
@@ -160,10 +160,9 @@ async def test_session_rollback(session_with_table):
     assert len(users) == 0
 
 
-@pytest.mark.asyncio
-async def test_session_context_manager_rollback_on_error(sqlite_pool):
+async def test_session_context_manager_rollback_on_error(module_sqlite_pool):
     """Test context manager rolls back on exception."""
-    await sqlite_pool.execute("""
+    await module_sqlite_pool.execute("""
         CREATE TABLE IF NOT EXISTS ctx_test (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             name TEXT NOT NULL,
@@ -178,15 +177,15 @@ async def test_session_context_manager_rollback_on_error(sqlite_pool):
         email: Mapped[str] = mapped_column(unique=True)
 
     try:
-        async with AsyncSession(sqlite_pool) as session:
+        async with AsyncSession(module_sqlite_pool) as session:
             session.add(ContextUser(name="Alice", email="alice@example.com"))
             raise ValueError("Simulated error")
     except ValueError:
         pass
 
     # Verify nothing was committed
-    result = await sqlite_pool.execute("SELECT * FROM ctx_test")
+    result = await module_sqlite_pool.execute("SELECT * FROM ctx_test")
     rows = result.all()
     assert len(rows) == 0
 
-    await sqlite_pool.execute("DROP TABLE ctx_test")
+    await module_sqlite_pool.execute("DROP TABLE ctx_test")
@@ -1,8 +1,14 @@
 """Tests for the fluent session API."""
 
+import asyncio
+
 import pytest
+import pytest_asyncio
 from ormkit import AsyncSession, Base, Mapped, mapped_column, session_context
 
+# Share one event loop (and the module-scoped SQLite pool) across this module.
+pytestmark = pytest.mark.asyncio(loop_scope="module")
+
 
 class User(Base):
     __tablename__ = "fluent_users"
@@ -13,10 +19,10 @@ class User(Base):
     age: Mapped[int | None] = mapped_column(nullable=True)
 
 
-@pytest.fixture
-async def pool_with_table(sqlite_pool):
-    """Create pool with test table."""
-    await sqlite_pool.execute("""
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def fluent_users_schema(module_sqlite_pool):
+    """Create the fluent_users table once per module."""
+    await module_sqlite_pool.execute("""
         CREATE TABLE IF NOT EXISTS fluent_users (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             name TEXT NOT NULL,
@@ -24,11 +30,23 @@ async def pool_with_table(sqlite_pool):
             age INTEGER
         )
     """)
-    yield sqlite_pool
-    await sqlite_pool.execute("DROP TABLE IF EXISTS fluent_users")
+    return module_sqlite_pool
+
+
+@pytest_asyncio.fixture(loop_scope="module")
+async def pool_with_table(fluent_users_schema):
+    """Empty fluent_users table (shared module pool).
+
+    The AUTOINCREMENT counter is reset too, since several tests look up id 1.
+    """
+    await fluent_users_schema.execute_script("""
+        DELETE FROM fluent_users;
+        DELETE FROM sqlite_sequence WHERE name = 'fluent_users';
+    """)
+    return fluent_users_schema
 
 
-@pytest.fixture
+@pytest_asyncio.fixture(loop_scope="module")
 async def session(pool_with_table):
     """Create session with test table."""
     return AsyncSession(pool_with_table)
@@ -36,7 +54,6 @@ async def session(pool_with_table):
 
 # ========== Transaction Context Tests ==========
 
-@pytest.mark.asyncio
 async def test_begin_transaction_auto_commit(session):
     """Test begin() auto-commits on success."""
     async with session.begin() as tx:
@@ -48,7 +65,6 @@ async def test_begin_transaction_auto_commit(session):
     assert len(users) == 2
 
 
-@pytest.mark.asyncio
 async def test_begin_transaction_rollback_on_error(session):
     """Test begin() rolls back on exception."""
     try:
@@ -63,7 +79,38 @@ async def test_begin_transaction_rollback_on_error(session):
     assert len(users) == 0
 
 
-@pytest.mark.asyncio
+async def test_begin_transaction_is_task_local(session):
+    """Other tasks sharing the session keep using the pool during begin()."""
+    entered = asyncio.Event()
+    checked = asyncio.Event()
+
+    async def other_task():
+        await entered.wait()
+        in_transaction = session._in_transaction
+        checked.set()
+        return in_transaction
+
+    task = asyncio.create_task(other_task())
+    async with session.begin():
+        entered.set()
+        await checked.wait()
+        assert session._in_transaction
+
+    assert await task is False
+    assert not session._in_transaction
+
+
+async def test_begin_on_memory_pool_rejects_other_sessions(session, pool_with_table):
+    """A second session can't wait on the in-memory connection the block holds."""
+    async with session.begin() as tx:
+        tx.add(User(name="Alice", email="alice@example.com"))
+        with pytest.raises(RuntimeError, match="only connection"):
+            await AsyncSession(pool_with_table).query(User).all()
+
+    users = await AsyncSession(pool_with_table).query(User).all()
+    assert [u.name for u in users] == ["Alice"]
+
+
 async def test_session_context_helper(pool_with_table):
     """Test session_context() convenience function."""
     async with session_context(pool_with_table) as session:
@@ -77,7 +124,6 @@ async def test_session_context_helper(pool_with_table):
 
 # ========== Fluent Insert API Tests ==========
 
-@pytest.mark.asyncio
 async def test_insert_single(session):
     """Test insert() returns model with ID."""
     user = await session.insert(User(name="Alice", email="alice@example.com"))
@@ -88,7 +134,6 @@ async def test_insert_single(session):
     assert len(users) == 1
 
 
-@pytest.mark.asyncio
 async def test_insert_all(session):
     """Test insert_all() for batch inserts."""
     users = await session.insert_all([
@@ -102,9 +147,28 @@ async def test_insert_all(session):
     assert len(all_users) == 3
 
 
+async def test_insert_all_beyond_legacy_parameter_limit(session):
+    """A batch binding more than 999 parameters still gets every generated ID."""
+    users = await session.insert_all([
+        User(name=f"User{i}", email=f"user{i}@example.com", age=i) for i in range(400)
+    ])
+
+    assert [u.id for u in users] == list(range(1, 401))
+    assert await session.query(User).filter(age__gte=200).count() == 200
+
+
+async def test_repeated_insert_binds_new_values(session):
+    """Inserts of the same shape reuse one statement but bind each row's values."""
+    first = await session.insert(User(name="Alice", email="alice@example.com", age=25))
+    second = await session.insert(User(name="Bob", email="bob@example.com"))
+
+    assert (first.id, second.id) == (1, 2)
+    users = await session.query(User).order_by("id").all()
+    assert [(u.name, u.age) for u in users] == [("Alice", 25), ("Bob", None)]
+
+
 # ========== Fluent Query API Tests ==========
 
-@pytest.mark.asyncio
 async def test_query_filter(session):
     """Test query().filter() with exact match."""
     await session.insert_all([
@@ -117,7 +181,6 @@ async def test_query_filter(session):
     assert users[0].name == "Alice"
 
 
-@pytest.mark.asyncio
 async def test_query_filter_operators(session):
     """Test query().filter() with comparison operators."""
     await session.insert_all([
@@ -139,7 +202,6 @@ async def test_query_filter_operators(session):
     assert len(users) == 1
 
 
-@pytest.mark.asyncio
 async def test_query_first(session):
     """Test query().first()."""
     await session.insert_all([
@@ -156,7 +218,6 @@ async def test_query_first(session):
     assert user is None
 
 
-@pytest.mark.asyncio
 async def test_query_one(session):
     """Test query().one()."""
     await session.insert(User(name="Alice", email="alice@example.com"))
@@ -165,7 +226,6 @@ async def test_query_one(session):
     assert user.name == "Alice"
 
 
-@pytest.mark.asyncio
 async def test_query_count(session):
     """Test query().count()."""
     await session.insert_all([
@@ -181,7 +241,6 @@ async def test_query_count(session):
     assert count == 2
 
 
-@pytest.mark.asyncio
 async def test_query_exists(session):
     """Test query().exists()."""
     assert await session.query(User).exists() is False
@@ -192,7 +251,6 @@ async def test_query_exists(session):
     assert await session.query(User).filter(name="Nobody").exists() is False
 
 
-@pytest.mark.asyncio
 async def test_query_order_by(session):
     """Test query().order_by()."""
     await session.insert_all([
@@ -209,7 +267,6 @@ async def test_query_order_by(session):
     assert [u.name for u in users] == ["Charlie", "Bob", "Alice"]
 
 
-@pytest.mark.asyncio
 async def test_query_limit_offset(session):
     """Test query().limit().offset()."""
     await session.insert_all([
@@ -229,7 +286,6 @@ async def test_query_limit_offset(session):
 
 # ========== Get by ID Tests ==========
 
-@pytest.mark.asyncio
 async def test_get_by_id(session):
     """Test session.get() by primary key."""
     await session.insert(User(name="Alice", email="alice@example.com"))
@@ -244,7 +300,6 @@ async def test_get_by_id(session):
     assert user is None
 
 
-@pytest.mark.asyncio
 async def test_get_or_raise(session):
     """Test session.get_or_raise()."""
     await session.insert(User(name="Alice", email="alice@example.com"))
@@ -258,7 +313,6 @@ async def test_get_or_raise(session):
 
 # ========== Update Tests ==========
 
-@pytest.mark.asyncio
 async def test_update_model(session):
     """Test session.update() for updating a model."""
     user = await session.insert(User(name="Alice", email="alice@example.com", age=25))
@@ -277,7 +331,6 @@ async def test_update_model(session):
 
 # ========== Delete Tests ==========
 
-@pytest.mark.asyncio
 async def test_remove_model(session):
     """Test session.remove() for deleting a model."""
     user = await session.insert(User(name="Alice", email="alice@example.com"))
@@ -289,7 +342,6 @@ async def test_remove_model(session):
     assert len(users) == 0
 
 
-@pytest.mark.asyncio
 async def test_query_delete(session):
     """Test query().delete() for bulk deletion."""
     await session.insert_all([
@@ -308,7 +360,6 @@ async def test_query_delete(session):
 
 # ========== Chaining Tests ==========
 
-@pytest.mark.asyncio
 async def test_transaction_chaining(session):
     """Test Transaction chainable API."""
     async with session.begin() as tx:
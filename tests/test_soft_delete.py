@@ -5,10 +5,14 @@ from __future__ import annotations
 from datetime import datetime
 
 import pytest
+import pytest_asyncio
 
 from ormkit import AsyncSession, Base, Mapped, mapped_column
 from ormkit.mixins import SoftDeleteMixin
 
+# Share one event loop (and the module-scoped SQLite pool) across this module.
+pytestmark = pytest.mark.asyncio(loop_scope="module")
+
 
 class Article(Base, SoftDeleteMixin):
     """Test model with soft delete."""
@@ -41,6 +45,11 @@ class TestSoftDeleteMixinDefinition:
         """Model has __soft_delete__ = True."""
         assert Article.__soft_delete__ is True
 
+    def test_soft_delete_flag_resolved_on_each_model(self) -> None:
+        """Every model stores its own flag, even with the mixin listed after Base."""
+        assert vars(Article)["__soft_delete__"] is True
+        assert vars(RegularModel)["__soft_delete__"] is False
+
     def test_regular_model_no_soft_delete(self) -> None:
         """Regular model without mixin has no marker."""
         assert not hasattr(RegularModel, "__soft_delete__") or RegularModel.__soft_delete__ is False
@@ -59,35 +68,53 @@ class TestSoftDeleteMixinDefinition:
         assert article.is_deleted is True
 
 
-@pytest.fixture
-async def articles_table(sqlite_pool) -> AsyncSession:
-    """Create articles table for testing."""
-    await sqlite_pool.execute(
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def soft_delete_schema(module_sqlite_pool):
+    """Create the soft-delete schema once per module, in one script.
+
+    Includes the deleted_at index the model declares (index=True), so queries
+    filter soft-deleted rows the way they would against a migrated database.
+    """
+    await module_sqlite_pool.execute_script(
         """
         CREATE TABLE IF NOT EXISTS articles (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             title TEXT NOT NULL,
             deleted_at TIMESTAMP
-        )
-        """,
-        [],
-    )
-    return sqlite_pool
-
+        );
+        CREATE INDEX IF NOT EXISTS ix_articles_deleted_at ON articles (deleted_at);
 
-@pytest.fixture
-async def regular_table(sqlite_pool) -> AsyncSession:
-    """Create regular_models table for testing."""
-    await sqlite_pool.execute(
-        """
         CREATE TABLE IF NOT EXISTS regular_models (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             name TEXT NOT NULL
-        )
-        """,
-        [],
+        );
+        """
+    )
+    return module_sqlite_pool
+
+
+@pytest_asyncio.fixture(loop_scope="module")
+async def articles_table(soft_delete_schema):
+    """Empty articles table for testing (shared module pool)."""
+    await soft_delete_schema.execute_script(
+        """
+        DELETE FROM articles;
+        DELETE FROM sqlite_sequence WHERE name = 'articles';
+        """
     )
-    return sqlite_pool
+    return soft_delete_schema
+
+
+@pytest_asyncio.fixture(loop_scope="module")
+async def regular_table(soft_delete_schema):
+    """Empty regular_models table for testing (shared module pool)."""
+    await soft_delete_schema.execute_script(
+        """
+        DELETE FROM regular_models;
+        DELETE FROM sqlite_sequence WHERE name = 'regular_models';
+        """
+    )
+    return soft_delete_schema
 
 
 class TestSoftDeleteQueries:
@@ -314,10 +341,9 @@ class TestSoftDeleteEdgeCases:
     async def test_multiple_soft_deletes(self, articles_table) -> None:
         """Multiple soft-deleted records are all excluded."""
         session = AsyncSession(articles_table)
-        for i in range(5):
-            article = await session.insert(Article(title=f"Article {i}"))
-            if i % 2 == 0:
-                await session.soft_delete(article)
+        articles = await session.insert_all([Article(title=f"Article {i}") for i in range(5)])
+        for article in articles[::2]:
+            await session.soft_delete(article)
 
         articles = await session.query(Article).all()
         assert len(articles) == 2  # Only odd indices
@@ -325,11 +351,10 @@ class TestSoftDeleteEdgeCases:
     async def test_soft_delete_with_pagination(self, articles_table) -> None:
         """Pagination works correctly with soft delete."""
         session = AsyncSession(articles_table)
-        # Create 10 articles, delete 5
-        for i in range(10):
-            article = await session.insert(Article(title=f"Article {i}"))
-            if i < 5:
-                await session.soft_delete(article)
+        # Create 10 articles in one INSERT, delete 5
+        articles = await session.insert_all([Article(title=f"Article {i}") for i in range(10)])
+        for article in articles[:5]:
+            await session.soft_delete(article)
 
         # Get with limit/offset
         page = await session.query(Article).limit(2).offset(1).all()
@@ -338,8 +363,8 @@ class TestSoftDeleteEdgeCases:
     async def test_soft_delete_bulk_operation(self, articles_table) -> None:
         """Bulk operations respect soft delete."""
         session = AsyncSession(articles_table)
-        for i in range(5):
-            article = await session.insert(Article(title=f"Article {i}"))
+        articles = await session.insert_all([Article(title=f"Article {i}") for i in range(5)])
+        for article in articles:
             await session.soft_delete(article)
 
         # Bulk delete should only affect non-deleted (none in this case)
@@ -353,6 +378,31 @@ class TestSoftDeleteEdgeCases:
         assert deleted_count == 5
 
 
+    async def test_query_soft_delete_in_one_statement(self, articles_table) -> None:
+        """query.soft_delete() marks only live matching rows."""
+        session = AsyncSession(articles_table)
+        articles = await session.insert_all([Article(title=f"Article {i}") for i in range(4)])
+        articles.append(await session.insert(Article(title="Keep")))
+        await session.soft_delete(articles[0])
+        already_deleted = session.query(Article).only_deleted()
+        first_deleted_at = (await already_deleted.first()).deleted_at
+
+        count = await session.query(Article).filter(title__like="Article%").soft_delete()
+        assert count == 3
+
+        remaining = await session.query(Article).all()
+        assert [a.title for a in remaining] == ["Keep"]
+        assert await session.query(Article).only_deleted().count() == 4
+        refetched = await already_deleted.filter(id=articles[0].id).first()
+        assert refetched.deleted_at == first_deleted_at
+
+    async def test_query_soft_delete_on_non_mixin_raises(self, regular_table) -> None:
+        """query.soft_delete() on a model without SoftDeleteMixin raises."""
+        session = AsyncSession(regular_table)
+        with pytest.raises(TypeError):
+            await session.query(RegularModel).soft_delete()
+
+
 class TestSoftDeleteWithRelationships:
     """Test soft delete with relationships."""
 
@@ -3,10 +3,14 @@
 from __future__ import annotations
 
 import pytest
+import pytest_asyncio
 
 from ormkit import AsyncSession, Base, Mapped, mapped_column
 from ormkit.query import insert
 
+# Share one event loop (and the module-scoped SQLite pool) across this module.
+pytestmark = pytest.mark.asyncio(loop_scope="module")
+
 
 class User(Base):
     """Test model for upsert operations."""
@@ -32,104 +36,155 @@ class TeamMember(Base):
     # Composite unique on (team_id, user_id)
 
 
-@pytest.fixture
-async def users_table(sqlite_pool) -> AsyncSession:
-    """Create users table for testing."""
-    await sqlite_pool.execute(
+class Profile(Base):
+    """Test model whose nickname has no Python default (the table has a SQL one)."""
+
+    __tablename__ = "upsert_profiles"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    handle: Mapped[str] = mapped_column(max_length=50, unique=True)
+    nickname: Mapped[str] = mapped_column(max_length=50)
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def upsert_schema(module_sqlite_pool):
+    """Create the users and team_members tables once per module."""
+    await module_sqlite_pool.execute_script(
         """
         CREATE TABLE IF NOT EXISTS users (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             email TEXT NOT NULL UNIQUE,
             name TEXT NOT NULL,
             age INTEGER
-        )
-        """,
-        [],
-    )
-    return sqlite_pool
+        );
 
-
-@pytest.fixture
-async def team_members_table(sqlite_pool) -> AsyncSession:
-    """Create team_members table for testing."""
-    await sqlite_pool.execute(
-        """
         CREATE TABLE IF NOT EXISTS team_members (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             team_id INTEGER NOT NULL,
             user_id INTEGER NOT NULL,
             role TEXT NOT NULL,
             UNIQUE(team_id, user_id)
-        )
-        """,
-        [],
+        );
+
+        CREATE TABLE IF NOT EXISTS upsert_profiles (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            handle TEXT NOT NULL UNIQUE,
+            nickname TEXT DEFAULT 'anon'
+        );
+        """
     )
-    return sqlite_pool
+    return module_sqlite_pool
+
+
+@pytest_asyncio.fixture(loop_scope="module")
+async def users_table(upsert_schema):
+    """Empty users table for testing (shared module pool)."""
+    await upsert_schema.execute_script(
+        """
+        DELETE FROM users;
+        DELETE FROM sqlite_sequence WHERE name = 'users';
+        """
+    )
+    return upsert_schema
+
+
+class _CountingPool:
+    """Pool proxy that records the SQL of every statement it executes."""
+
+    def __init__(self, pool):
+        self._pool = pool
+        self.statements: list[str] = []
+
+    def __getattr__(self, name):
+        return getattr(self._pool, name)
+
+    async def execute(self, sql, params=None):
+        self.statements.append(sql)
+        return await self._pool.execute(sql, params)
+
+    async def execute_statement_py(self, sql, params=None):
+        self.statements.append(sql)
+        return await self._pool.execute_statement_py(sql, params)
+
+    @property
+    def insert_count(self) -> int:
+        return sum(sql.startswith("INSERT") for sql in self.statements)
+
+
+@pytest_asyncio.fixture(loop_scope="module")
+async def counting_pool(users_table):
+    """Empty users table behind a pool that counts executed statements."""
+    return _CountingPool(users_table)
+
+
+@pytest_asyncio.fixture(loop_scope="module")
+async def team_members_table(upsert_schema):
+    """Empty team_members table for testing (shared module pool)."""
+    await upsert_schema.execute_script(
+        """
+        DELETE FROM team_members;
+        DELETE FROM sqlite_sequence WHERE name = 'team_members';
+        """
+    )
+    return upsert_schema
+
+
+# Statements are immutable, so one instance is rendered for both dialects
+_UPDATE_NAME_ON_EMAIL = (
+    insert(User)
+    .values(email="a@b.com", name="A")
+    .on_conflict_do_update("email", set_={"name": "Updated"})
+)
 
 
 class TestUpsertStatement:
     """Test InsertStatement with ON CONFLICT."""
 
-    def test_on_conflict_do_update_single_column(self) -> None:
-        """Generate ON CONFLICT (col) DO UPDATE."""
-        stmt = (
-            insert(User)
-            .values(email="a@b.com", name="A")
-            .on_conflict_do_update("email", set_={"name": "Updated"})
-        )
-        sql, params = stmt.to_sql("postgresql")
-        assert "ON CONFLICT (email) DO UPDATE SET" in sql
-        assert "name" in sql
-
-    def test_on_conflict_do_update_multiple_columns(self) -> None:
-        """Generate ON CONFLICT (col1, col2) DO UPDATE."""
-        stmt = (
-            insert(TeamMember)
-            .values(team_id=1, user_id=1, role="member")
-            .on_conflict_do_update(["team_id", "user_id"], set_={"role": "admin"})
-        )
-        sql, _ = stmt.to_sql("postgresql")
-        assert "ON CONFLICT (team_id, user_id)" in sql
-
-    def test_on_conflict_do_nothing(self) -> None:
-        """Generate ON CONFLICT DO NOTHING."""
-        stmt = insert(User).values(email="a@b.com", name="A").on_conflict_do_nothing("email")
-        sql, _ = stmt.to_sql("postgresql")
-        assert "ON CONFLICT (email) DO NOTHING" in sql
-
-    def test_on_conflict_do_update_all_non_pk_fields(self) -> None:
-        """When set_ is None, update all non-PK fields."""
-        stmt = (
-            insert(User)
-            .values(email="a@b.com", name="A", age=25)
-            .on_conflict_do_update("email")  # No set_, update all
-        )
-        sql, _ = stmt.to_sql("postgresql")
-        # Should update name and age but not id
-        assert "name" in sql
-        assert "age" in sql
-
-    def test_sqlite_excluded_syntax(self) -> None:
-        """SQLite uses 'excluded' reference."""
-        stmt = (
-            insert(User)
-            .values(email="a@b.com", name="A")
-            .on_conflict_do_update("email", set_={"name": "Updated"})
-        )
-        sql, _ = stmt.to_sql("sqlite")
-        # SQLite uses excluded.column_name
-        assert "excluded" in sql.lower()
-
-    def test_postgresql_excluded_syntax(self) -> None:
-        """PostgreSQL uses 'EXCLUDED' reference."""
-        stmt = (
-            insert(User)
-            .values(email="a@b.com", name="A")
-            .on_conflict_do_update("email", set_={"name": "Updated"})
-        )
-        sql, _ = stmt.to_sql("postgresql")
-        # PostgreSQL uses EXCLUDED.column_name
-        assert "EXCLUDED" in sql or "excluded" in sql
+    @pytest.mark.parametrize(
+        ("stmt", "dialect", "expected"),
+        [
+            pytest.param(
+                _UPDATE_NAME_ON_EMAIL,
+                "postgresql",
+                ["ON CONFLICT (email) DO UPDATE SET", "name", "EXCLUDED"],
+                id="do-update-single-column",
+            ),
+            pytest.param(
+                insert(TeamMember)
+                .values(team_id=1, user_id=1, role="member")
+                .on_conflict_do_update(["team_id", "user_id"], set_={"role": "admin"}),
+                "postgresql",
+                ["ON CONFLICT (team_id, user_id)"],
+                id="do-update-multiple-columns",
+            ),
+            pytest.param(
+                insert(User).values(email="a@b.com", name="A").on_conflict_do_nothing("email"),
+                "postgresql",
+                ["ON CONFLICT (email) DO NOTHING"],
+                id="do-nothing",
+            ),
+            pytest.param(
+                # No set_: every non-PK field is updated
+                insert(User)
+                .values(email="a@b.com", name="A", age=25)
+                .on_conflict_do_update("email"),
+                "postgresql",
+                ["name", "age"],
+                id="do-update-all-non-pk-fields",
+            ),
+            pytest.param(
+                _UPDATE_NAME_ON_EMAIL,
+                "sqlite",
+                ["excluded."],
+                id="sqlite-excluded-syntax",
+            ),
+        ],
+    )
+    def test_on_conflict_sql(self, stmt: object, dialect: str, expected: list[str]) -> None:
+        """ON CONFLICT clauses render the conflict target and update references."""
+        sql, _ = stmt.to_sql(dialect)  # type: ignore[attr-defined]
+        for fragment in expected:
+            assert fragment in sql
 
 
 class TestSessionUpsert:
@@ -194,9 +249,9 @@ class TestSessionUpsert:
         assert loaded.name == "Updated"
         assert loaded.age == 25
 
-    async def test_upsert_all_batch(self, users_table) -> None:
-        """Bulk upsert multiple records."""
-        session = AsyncSession(users_table)
+    async def test_upsert_all_batch(self, counting_pool) -> None:
+        """Bulk upsert multiple records in one INSERT ... ON CONFLICT statement."""
+        session = AsyncSession(counting_pool)
         users = [
             User(email="a@b.com", name="A"),
             User(email="b@b.com", name="B"),
@@ -205,6 +260,12 @@ class TestSessionUpsert:
         results = await session.upsert_all(users, conflict_target="email")
         assert len(results) == 3
         assert all(u.id is not None for u in results)
+        # One VALUES-list statement, not one merge per row
+        assert counting_pool.insert_count == 1
+
+        # Read every row back in one query rather than one get() per id
+        rows = await session.query(User).order_by("email").values_list("id", "email")
+        assert rows == [(u.id, u.email) for u in results]
 
     async def test_upsert_all_mixed_insert_update(self, users_table) -> None:
         """Bulk upsert with mix of new and existing records."""
@@ -218,14 +279,9 @@ class TestSessionUpsert:
         ]
         await session.upsert_all(users, conflict_target="email", update_fields=["name"])
 
-        # Check both worked
-        existing = await session.query(User).filter(email="existing@b.com").first()
-        assert existing is not None
-        assert existing.name == "Updated"
-
-        new = await session.query(User).filter(email="new@b.com").first()
-        assert new is not None
-        assert new.name == "New"
+        # Check both worked, reading the two rows back in one query
+        rows = await session.query(User).order_by("email").values_list("email", "name")
+        assert rows == [("existing@b.com", "Updated"), ("new@b.com", "New")]
 
     async def test_upsert_with_composite_key(self, team_members_table) -> None:
         """Upsert with multiple conflict columns."""
@@ -299,21 +355,52 @@ class TestUpsertEdgeCases:
         assert loaded is not None
         assert loaded.age is None
 
-    async def test_upsert_all_empty_list(self, users_table) -> None:
-        """Upsert with empty list returns empty list."""
-        session = AsyncSession(users_table)
+    async def test_upsert_all_empty_list(self, counting_pool) -> None:
+        """Upsert with empty list returns empty list without touching the pool."""
+        session = AsyncSession(counting_pool)
         results = await session.upsert_all([], conflict_target="email")
         assert results == []
+        assert counting_pool.statements == []
 
-    async def test_upsert_all_single_item(self, users_table) -> None:
+    async def test_upsert_all_single_item(self, counting_pool) -> None:
         """Upsert_all with single item works."""
-        session = AsyncSession(users_table)
+        session = AsyncSession(counting_pool)
         results = await session.upsert_all(
             [User(email="single@example.com", name="Single")],
             conflict_target="email",
         )
         assert len(results) == 1
         assert results[0].id is not None
+        assert counting_pool.insert_count == 1
+
+
+    async def test_upsert_all_without_returning(self, users_table) -> None:
+        """Without RETURNING, ids are read back by conflict key after the upsert."""
+        await users_table.execute(
+            "INSERT INTO users (email, name) VALUES ('existing@b.com', 'Old')"
+        )
+        session = AsyncSession(users_table)
+        session._sqlite_returning_supported = False
+
+        users = [User(email="existing@b.com", name="Updated"), User(email="new@b.com", name="New")]
+        await session.upsert_all(users, conflict_target="email", update_fields=["name"])
+
+        assert users[0].id == 1
+        assert users[1].id is not None
+        assert await session.get(User, users[1].id) is users[1]
+
+    async def test_upsert_all_single_item_matches_batch(self, upsert_schema) -> None:
+        """One-row and multi-row upsert_all bind unset columns the same way."""
+        await upsert_schema.execute("DELETE FROM upsert_profiles")
+        session = AsyncSession(upsert_schema)
+
+        await session.upsert_all([Profile(handle="solo")], conflict_target="handle")
+        await session.upsert_all(
+            [Profile(handle="first"), Profile(handle="second")], conflict_target="handle"
+        )
+
+        rows = await session.query(Profile).order_by("handle").values_list("handle", "nickname")
+        assert rows == [("first", None), ("second", None), ("solo", None)]
 
 
 class TestUpsertPostgreSQL: